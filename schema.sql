@@ -103,10 +103,14 @@ CREATE TABLE IF NOT EXISTS job_queue (
     status TEXT DEFAULT 'PENDING',            -- PENDING | PROCESSING | DONE | FAILED
     file_path TEXT,
     metadata JSONB,
+    worker_id TEXT,                           -- Consumer that claimed the job (claim_jobs)
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW()
 );
 
+-- For databases created before worker_id existed
+ALTER TABLE job_queue ADD COLUMN IF NOT EXISTS worker_id TEXT;
+
 CREATE INDEX IF NOT EXISTS idx_job_queue_status ON job_queue(status);
 CREATE INDEX IF NOT EXISTS idx_job_queue_created ON job_queue(created_at);
 
@@ -208,6 +212,45 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Atomically claim up to p_limit PENDING jobs for one consumer.
+-- SKIP LOCKED lets several processors poll concurrently without
+-- ever handing out the same job twice.
+CREATE OR REPLACE FUNCTION claim_jobs(p_worker_id TEXT, p_limit INT DEFAULT 32)
+RETURNS SETOF job_queue AS $$
+BEGIN
+    RETURN QUERY
+    UPDATE job_queue
+    SET status = 'PROCESSING',
+        worker_id = p_worker_id,
+        updated_at = NOW()
+    WHERE id IN (
+        SELECT id FROM job_queue
+        WHERE status = 'PENDING'
+        ORDER BY created_at
+        FOR UPDATE SKIP LOCKED
+        LIMIT p_limit
+    )
+    RETURNING *;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Wake LISTENing consumers (processor.py with DATABASE_URL) as soon as
+-- a job is queued instead of waiting for their next poll.
+CREATE OR REPLACE FUNCTION notify_job_pending()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('job_pending', NEW.id::text);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_job_queue_notify ON job_queue;
+CREATE TRIGGER trg_job_queue_notify
+    AFTER INSERT ON job_queue
+    FOR EACH ROW
+    WHEN (NEW.status = 'PENDING')
+    EXECUTE FUNCTION notify_job_pending();
+
 -- ============================================
 -- ROW LEVEL SECURITY (Optional - disable for dev)
 -- ============================================
@@ -3,8 +3,9 @@ Infrastructure layer for PollPulse TN ETL pipeline.
 
 Provides:
 - Supabase client and data management utilities
-- Production resilience patterns (Circuit Breaker, Rate Limiter)
+- Production resilience patterns (Circuit Breaker, Rate Limiter, Token Bucket)
 - Content quality filtering and scoring
+- Postgres LISTEN/NOTIFY wake-ups for the job queue consumer
 """
 
 from .client import get_supabase_client
@@ -15,9 +16,11 @@ from .resilience import (
     AdaptiveRateLimiter,
     BackpressureMonitor,
     RetryWithBackoff,
+    TokenBucket,
     get_circuit_breaker,
     get_rate_limiter
 )
+from .notify import JobListener, get_job_listener
 from .quality import (
     passes_video_quality_filter,
     get_video_quality_score,
@@ -40,8 +43,12 @@ __all__ = [
     'AdaptiveRateLimiter',
     'BackpressureMonitor',
     'RetryWithBackoff',
+    'TokenBucket',
     'get_circuit_breaker',
     'get_rate_limiter',
+    # Notify
+    'JobListener',
+    'get_job_listener',
     # Quality
     'passes_video_quality_filter',
     'get_video_quality_score',
@@ -6,12 +6,40 @@ Implements the DataSystem class that handles:
 - Creating job queue entries for downstream processing
 """
 
+import gzip
 import json
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .client import get_supabase_client
 
+# Raw JSON is gzipped before upload; level 1 is nearly as small as level 9 on
+# comment text but much cheaper to produce
+GZIP_COMPRESS_LEVEL = 1
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def _dumps_json(data: Dict) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when installed, stdlib otherwise)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def _loads_json(payload: bytes) -> Dict:
+    """Parse raw storage bytes, transparently decompressing gzip payloads."""
+    if payload[:2] == GZIP_MAGIC:
+        payload = gzip.decompress(payload)
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
+    return json.loads(payload.decode('utf-8'))
+
 
 class DataSystem:
     """
@@ -78,9 +106,9 @@ class DataSystem:
             Job ID (UUID string) if successful, None otherwise
         """
         try:
-            # Serialize data to JSON bytes
-            json_content = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
-            print(f"  Preparing to upload {len(json_content)} bytes to storage...")
+            # Serialize data to gzipped JSON bytes
+            json_content = gzip.compress(_dumps_json(data), compresslevel=GZIP_COMPRESS_LEVEL)
+            print(f"  Preparing to upload {len(json_content)} bytes (gzip) to storage...")
             
             # Upload to Supabase Storage
             file_path = f"{filename}"
@@ -91,7 +119,12 @@ class DataSystem:
             try:
                 print(f"  Uploading to storage bucket '{self.bucket_name}' at path '{file_path}'...")
                 # Supabase storage upload: path, file_bytes, file_options (optional)
-                storage_client.upload(file_path, json_content, file_options={"content-type": "application/json", "upsert": "true"})
+                # The stored object is the gzip stream itself, so label it as
+                # such; downloads detect it by magic bytes (see _loads_json)
+                storage_client.upload(file_path, json_content, file_options={
+                    "content-type": "application/gzip",
+                    "upsert": "true",
+                })
                 print(f"  [OK] Storage upload successful")
             except Exception as storage_err:
                 storage_msg = str(storage_err)
@@ -191,6 +224,8 @@ USING (bucket_id = '{self.bucket_name}');
         """
         Download and parse a JSON file from Supabase Storage.
         
+        Gzipped payloads are detected by their magic bytes and decompressed.
+        
         Args:
             file_path: Path to the file in the storage bucket
         
@@ -199,7 +234,8 @@ USING (bucket_id = '{self.bucket_name}');
         """
         try:
             response = self.client.storage.from_(self.bucket_name).download(file_path)
-            data = json.loads(response.decode('utf-8'))
+            # Older uploads are plain JSON; newer ones are gzipped
+            data = _loads_json(response)
             return data
         except Exception as e:
             print(f"Error downloading file {file_path}: {str(e)}")
@@ -220,6 +256,23 @@ USING (bucket_id = '{self.bucket_name}');
         except Exception as e:
             print(f"Error updating job status: {str(e)}")
     
+    def update_job_statuses(self, job_ids: List[str], status: str):
+        """
+        Update the status of several jobs in a single request.
+        
+        Args:
+            job_ids: UUIDs of the jobs to update
+            status: New status (PENDING, PROCESSING, DONE, FAILED)
+        """
+        if not job_ids:
+            return
+        try:
+            self.client.table('job_queue').update({
+                'status': status
+            }).in_('id', job_ids).execute()
+        except Exception as e:
+            print(f"Error updating job statuses: {str(e)}")
+    
     def verify_setup(self) -> bool:
         """
         Verify that storage bucket and job_queue table are accessible.
@@ -0,0 +1,90 @@
+"""
+Postgres LISTEN/NOTIFY wake-ups for the job queue consumer.
+
+A trigger on job_queue (see schema.sql) sends NOTIFY job_pending for every new
+PENDING job. The consumer LISTENs on a direct Postgres connection and blocks on
+the socket until a notification arrives, instead of re-polling the queue.
+
+Requires psycopg2 and a DATABASE_URL (Supabase: Settings -> Database ->
+Connection string). Without either, get_job_listener() returns None and the
+consumer keeps its polling backoff.
+"""
+
+import logging
+import os
+import select
+from typing import Optional
+
+try:
+    import psycopg2
+    import psycopg2.extensions
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    PSYCOPG2_AVAILABLE = False
+
+JOB_PENDING_CHANNEL = 'job_pending'
+
+log = logging.getLogger(__name__)
+
+
+class JobListener:
+    """
+    Blocks until a job_pending notification arrives.
+    
+    Usage:
+        listener = get_job_listener()
+        if listener and listener.wait(timeout=1.0):
+            # New jobs were queued - claim them
+    """
+    
+    def __init__(self, dsn: str, channel: str = JOB_PENDING_CHANNEL):
+        self.channel = channel
+        self.conn = psycopg2.connect(dsn)
+        self.conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        with self.conn.cursor() as cur:
+            cur.execute(f"LISTEN {channel};")
+    
+    def wait(self, timeout: float) -> bool:
+        """
+        Wait up to `timeout` seconds for notifications.
+        
+        Returns:
+            True if at least one notification arrived (all pending ones are drained)
+        """
+        self.conn.poll()
+        if not self.conn.notifies:
+            readable, _, _ = select.select([self.conn], [], [], timeout)
+            if not readable:
+                return False
+            self.conn.poll()
+        
+        notified = bool(self.conn.notifies)
+        self.conn.notifies.clear()
+        return notified
+    
+    def close(self):
+        """Close the underlying connection."""
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+
+def get_job_listener() -> Optional[JobListener]:
+    """
+    Create a JobListener if psycopg2 and DATABASE_URL are available.
+    
+    Returns:
+        JobListener instance, or None to fall back to polling
+    """
+    dsn = os.getenv('DATABASE_URL', '').strip()
+    if not dsn or not PSYCOPG2_AVAILABLE:
+        return None
+    
+    try:
+        listener = JobListener(dsn)
+        log.info("Listening for '%s' notifications", JOB_PENDING_CHANNEL)
+        return listener
+    except Exception as e:
+        log.warning("Could not LISTEN on %s, falling back to polling: %s", JOB_PENDING_CHANNEL, str(e)[:100])
+        return None
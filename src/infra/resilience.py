@@ -5,10 +5,12 @@ This module provides production-grade resilience patterns:
 - CircuitBreaker: Prevents cascading failures
 - AdaptiveRateLimiter: Handles external API rate limits
 - BackpressureMonitor: Detects queue overflow
+- TokenBucket: Thread-safe request pacing for concurrent workers
 
 These patterns ensure the pipeline degrades gracefully under failure conditions.
 """
 
+import threading
 import time
 from typing import Optional, Callable, Any
 from functools import wraps
@@ -123,6 +125,40 @@ class AdaptiveRateLimiter:
         self.consecutive_successes = 0
 
 
+class TokenBucket:
+    """
+    Thread-safe token bucket for pacing requests across worker threads.
+    
+    Tokens refill at `rate` per second up to `capacity`; acquire() blocks
+    until a token is available. With capacity=1 this enforces a minimum
+    spacing of 1/rate seconds between request starts without serializing
+    the requests themselves.
+    """
+    
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                wait_time = (1 - self.tokens) / self.rate
+            
+            time.sleep(wait_time)
+
+
 class BackpressureMonitor:
     """
     Monitor queue depth and detect backpressure conditions.
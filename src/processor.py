@@ -15,19 +15,34 @@ Production Features:
 """
 
 import json
+import logging
 import os
 import time
 import hashlib
 import traceback
 import math
+import queue
+import random
 import re
+import socket
+import threading
+import unicodedata
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Optional, Dict, List, Any
+
+import numpy as np
 from transformers import pipeline, AutoModelForSequenceClassification, XLMRobertaTokenizer
 
 from infra.client import get_supabase_client
 from infra.data_manager import DataSystem
-from utils.classifier import classify_alliance
+from infra.notify import get_job_listener
+from utils.classifier import classify_alliances_batch
+from utils.acceleration import accelerate_torch_model
+from utils.quantization import load_int8_model
+
+log = logging.getLogger('processor')
 
 
 # Configuration
@@ -41,11 +56,85 @@ FRESHNESS_HALF_LIFE_DAYS = float(os.getenv('FRESHNESS_HALF_LIFE_DAYS', '14'))  #
 ENABLE_ENGAGEMENT_WEIGHTING = os.getenv('ENABLE_ENGAGEMENT_WEIGHTING', 'true').lower() == 'true'
 ENABLE_PROBABILITY_SCORING = os.getenv('ENABLE_PROBABILITY_SCORING', 'true').lower() == 'true'
 ENABLE_OUTLIER_CAP = os.getenv('ENABLE_OUTLIER_CAP', 'true').lower() == 'true'
+USE_ONNX_INT8 = os.getenv('USE_ONNX_INT8', 'false').lower() == 'true'  # Needs optimum[onnxruntime]
+USE_TORCH_COMPILE = os.getenv('USE_TORCH_COMPILE', 'false').lower() == 'true'  # BetterTransformer + torch.compile (FP32 path)
+ENABLE_LEXICON_FAST_PATH = os.getenv('ENABLE_LEXICON_FAST_PATH', 'true').lower() == 'true'
+
+# Batching: jobs claimed per poll, texts per model call, parallel storage downloads
+PROCESSOR_BATCH_SIZE = int(os.getenv('PROCESSOR_BATCH_SIZE', '32'))
+INFERENCE_BATCH_SIZE = 32
+DOWNLOAD_WORKERS = 8
+MAX_TEXT_CHARS = 1024  # Comments are cut to this length; longer authoritative texts are windowed
+WINDOW_WORDS = 400  # ~512 tokens, the model's input limit
+WINDOW_STRIDE = 350  # 50-word overlap so no sentence is only ever seen cut in half
+PIPELINE_QUEUE_SIZE = 8  # Claimed batches buffered between pipeline stages
+WORKER_ID = os.getenv('PROCESSOR_WORKER_ID') or f"{socket.gethostname()}-{os.getpid()}"
+BATCH_WAIT_MS = int(os.getenv('PROCESSOR_BATCH_WAIT_MS', '50'))  # Max wait to top up an inference batch
+IDLE_BACKOFF_MIN = 0.1  # First wait (seconds) after the queue is found empty
+IDLE_BACKOFF_MAX = 10.0  # Cap for the doubling idle wait
+IDLE_BACKOFF_JITTER = 0.2  # +/-20% so idle workers don't poll in lockstep
+
+MAX_SOURCE_IDS = 100  # Lineage entries kept per prediction row
+PREDICTION_READ_MAX_ROWS = 1000  # PostgREST default max rows per response
+
+# Prediction cache: identical comments ("First!", spam, re-scraped videos) skip inference
+ENABLE_PREDICTION_CACHE = os.getenv('ENABLE_PREDICTION_CACHE', 'true').lower() == 'true'
+PREDICTION_CACHE_SIZE = int(os.getenv('PREDICTION_CACHE_SIZE', '50000'))
+
+# Lexicon fast path: texts with a clear keyword majority skip the transformer
+LEXICON_MIN_MARGIN = 3  # |positive hits - negative hits| required to decide
+LEXICON_MIN_HITS = 2    # Minimum total lexicon hits required to decide
+LEXICON_MAX_WORDS = 40  # Only short user comments are eligible; longer texts go to the model
+# Calibrated confidence for lexicon decisions: a keyword majority is weaker
+# evidence than a model probability, so it never reports certainty
+LEXICON_BASE_SCORE = 0.7   # Score at exactly LEXICON_MIN_MARGIN
+LEXICON_SCORE_STEP = 0.05  # Added per extra hit of margin
+LEXICON_MAX_SCORE = 0.85
+
+_POS_LEXICON = {
+    # English
+    'good', 'great', 'excellent', 'best', 'super', 'superb', 'love', 'win',
+    'winner', 'victory', 'support', 'proud', 'happy', 'thanks', 'congrats',
+    'congratulations', 'brilliant', 'amazing', 'hero', 'honest', 'mass',
+    # Tamil
+    'நல்ல', 'நன்று', 'அருமை', 'சூப்பர்', 'வாழ்க', 'வெற்றி', 'நன்றி',
+    'மகிழ்ச்சி', 'பெருமை', 'சிறப்பு', 'வாழ்த்துக்கள்', 'தலைவா',
+}
+
+_NEG_LEXICON = {
+    # English
+    'bad', 'worst', 'poor', 'corrupt', 'corruption', 'fail', 'failed',
+    'failure', 'shame', 'shameful', 'liar', 'lies', 'useless', 'hate',
+    'waste', 'fraud', 'scam', 'loot', 'disaster', 'pathetic', 'cheat',
+    # Tamil
+    'மோசம்', 'ஊழல்', 'கேவலம்', 'தோல்வி', 'பொய்', 'அசிங்கம்', 'துரோகம்',
+    'வெட்கம்', 'கொள்ளை', 'ஏமாற்று', 'வேஸ்ட்',
+}
+
+# Whitespace/punctuation tokenizer that keeps Tamil combining marks intact
+_LEXICON_TOKEN_RE = re.compile(r"[^\s.,!?;:'\"()\[\]{}]+")
+
+
+# LRU of normalized-text digest -> model result (only touched from the inference thread)
+_PREDICTION_CACHE: "OrderedDict[bytes, list]" = OrderedDict()
+_PREDICTION_CACHE_STATS = {'hits': 0, 'misses': 0}
+
+# (content_id, alliance) keys prepared for inference but not yet committed by the
+# writer. processed_content only sees a key once its batch is written, so batch
+# N+1 is checked against these too (added by the inference thread, released by
+# the writer thread)
+_IN_FLIGHT_CONTENT = set()
+_IN_FLIGHT_LOCK = threading.Lock()
+
+# Metrics are buffered and written once per batch (shared by pipeline threads)
+_METRICS_BUFFER: List[Dict] = []
+_METRICS_LOCK = threading.Lock()
 
 
 # Load gazetteer (districts data)
 GAZETTEER_PATH = os.path.join("config", "districts.json")
 GAZETTEER = {}
+GAZETTEER_INDEX = []  # [(district_name, (lowercased keywords, ...)), ...] built by load_gazetteer()
 
 # Load alliances configuration
 ALLIANCES_PATH = os.path.join("config", "alliances.json")
@@ -70,10 +159,15 @@ def load_gazetteer() -> Dict:
     try:
         with open(GAZETTEER_PATH, 'r', encoding='utf-8') as f:
             GAZETTEER = json.load(f)
-        print(f"Loaded gazetteer with {len(GAZETTEER)} districts")
+        # Lowercase keywords once instead of on every match
+        GAZETTEER_INDEX[:] = [
+            (district_name, tuple(k.lower() for k in district_data.get('keywords', [])))
+            for district_name, district_data in GAZETTEER.items()
+        ]
+        log.info("Loaded gazetteer with %s districts", len(GAZETTEER))
         return GAZETTEER
     except Exception as e:
-        print(f"Error loading gazetteer: {e}")
+        log.error("Could not load gazetteer: %s", e)
         return {}
 
 
@@ -92,10 +186,10 @@ def load_alliances() -> Dict:
         with open(ALLIANCES_PATH, 'r', encoding='utf-8') as f:
             ALLIANCES = json.load(f)
         keywords = ALLIANCES.get('keywords', {})
-        print(f"Loaded alliances: {list(keywords.keys())}")
+        log.info("Loaded alliances: %s", list(keywords.keys()))
         return ALLIANCES
     except Exception as e:
-        print(f"Error loading alliances: {e}")
+        log.error("Could not load alliances: %s", e)
         return {}
 
 
@@ -113,17 +207,47 @@ def load_entity_map() -> Dict:
     try:
         with open(ENTITY_MAP_PATH, 'r', encoding='utf-8') as f:
             ENTITY_MAP = json.load(f)
-        print(f"Loaded entity map: {len(ENTITY_MAP.get('politicians', {}))} politicians")
+        log.info("Loaded entity map: %s politicians", len(ENTITY_MAP.get('politicians', {})))
         return ENTITY_MAP
     except FileNotFoundError:
-        print("Entity map not found. Run src/discover_entities.py to generate it.")
+        log.warning("Entity map not found. Run src/discover_entities.py to generate it.")
         return {}
     except Exception as e:
-        print(f"Error loading entity map: {e}")
+        log.error("Could not load entity map: %s", e)
         return {}
 
 
-def detect_politicians(data: Dict) -> List[Dict]:
+def lowercase_content(data: Dict) -> Dict:
+    """
+    Lowercase the text fields of a payload once for all keyword detectors.
+    
+    Args:
+        data: Full JSON payload containing meta, transcript, comments
+    
+    Returns:
+        Dictionary with lowercased 'title', 'description', 'transcript' and
+        'comments' (list of comment strings; non-text entries are dropped)
+    """
+    meta = data.get('meta', {})
+    comments = data.get('user_comments', []) or data.get('comments', [])
+    
+    comment_texts = []
+    for comment in comments:
+        # Handle both formats: dict (YouTube) and string (news scraper)
+        if isinstance(comment, dict):
+            comment_texts.append((comment.get('text', '') or '').lower())
+        elif isinstance(comment, str):
+            comment_texts.append(comment.lower())
+    
+    return {
+        'title': (meta.get('title', '') or '').lower(),
+        'description': (meta.get('description', '') or '').lower(),
+        'transcript': (data.get('transcript', '') or '').lower(),
+        'comments': comment_texts,
+    }
+
+
+def detect_politicians(data: Dict, lowered: Optional[Dict] = None) -> List[Dict]:
     """
     Detect politician mentions in content and return their constituencies.
     
@@ -132,6 +256,7 @@ def detect_politicians(data: Dict) -> List[Dict]:
     
     Args:
         data: Full JSON payload containing meta, transcript, comments
+        lowered: Optional lowercase_content(data) result to reuse
         
     Returns:
         List of matched politicians with their constituencies:
@@ -144,20 +269,16 @@ def detect_politicians(data: Dict) -> List[Dict]:
     alias_index = entity_map.get('alias_index', {})
     politicians = entity_map.get('politicians', {})
     
+    if lowered is None:
+        lowered = lowercase_content(data)
+    
     # Combine all text sources
-    meta = data.get('meta', {})
-    title = (meta.get('title', '') or '').lower()
-    description = (meta.get('description', '') or '')[:500].lower()
-    transcript = (data.get('transcript', '') or '')[:2000].lower()
+    title = lowered['title']
+    description = lowered['description'][:500]
+    transcript = lowered['transcript'][:2000]
     
     # Build comment text
-    comments = data.get('user_comments', []) or data.get('comments', [])
-    comment_text = ""
-    for comment in comments[:50]:  # Limit to first 50 comments
-        if isinstance(comment, dict):
-            comment_text += " " + (comment.get('text', '') or '').lower()
-        elif isinstance(comment, str):
-            comment_text += " " + comment.lower()
+    comment_text = " " + " ".join(lowered['comments'][:50])  # Limit to first 50 comments
     
     combined_text = f"{title} {description} {transcript} {comment_text}"
     
@@ -181,7 +302,7 @@ def detect_politicians(data: Dict) -> List[Dict]:
                 matched_names.add(normalized_name)
     
     if matched:
-        print(f"  Politicians detected: {[m['name'] for m in matched]}")
+        log.info("  Politicians detected: %s", [m['name'] for m in matched])
     
     return matched
 
@@ -225,10 +346,32 @@ def is_duplicate_content(client, content_id: str, alliance: str) -> bool:
         
         return len(result.data) > 0
     except Exception as e:
-        print(f"  Warning: Deduplication check failed: {e}")
+        log.warning("  Deduplication check failed: %s", e)
         return False  # Fail open - process anyway
 
 
+def claim_in_flight_content(key: tuple) -> bool:
+    """
+    Reserve a (content_id, alliance) key for the job being prepared.
+    
+    Returns:
+        False if another job already holds the key (in this batch or in a
+        batch the writer has not committed yet)
+    """
+    with _IN_FLIGHT_LOCK:
+        if key in _IN_FLIGHT_CONTENT:
+            return False
+        _IN_FLIGHT_CONTENT.add(key)
+        return True
+
+
+def release_in_flight_content(ctxs: List[Dict]):
+    """Release the keys claimed by these job contexts (after commit or failure)."""
+    with _IN_FLIGHT_LOCK:
+        for ctx in ctxs:
+            _IN_FLIGHT_CONTENT.discard(ctx.get('dedup_key'))
+
+
 def mark_content_processed(
     client,
     content_id: str,
@@ -254,7 +397,7 @@ def mark_content_processed(
     except Exception as e:
         # May fail on duplicate - that's OK
         if 'duplicate' not in str(e).lower():
-            print(f"  Warning: Failed to mark content processed: {e}")
+            log.warning("  Failed to mark content processed: %s", e)
         return False
 
 
@@ -280,28 +423,43 @@ def add_to_dlq(
             'failed_at': datetime.now(timezone.utc).isoformat(),
             'retry_count': 0
         }).execute()
-        print(f"  Added to DLQ: {error_type}")
+        log.info("  Added to DLQ: %s", error_type)
         return True
     except Exception as e:
-        print(f"  Warning: Failed to add to DLQ: {e}")
+        log.warning("  Failed to add to DLQ: %s", e)
         return False
 
 
 def log_metric(client, name: str, value: float, dimensions: Optional[Dict] = None) -> bool:
-    """Log a metric to the pipeline_metrics table."""
+    """Buffer a metric for the pipeline_metrics table (written by flush_metrics)."""
     if not ENABLE_METRICS:
         return True
     
-    try:
-        client.table('pipeline_metrics').insert({
+    with _METRICS_LOCK:
+        _METRICS_BUFFER.append({
             'metric_name': name,
             'metric_value': value,
             'dimensions': dimensions or {},
             'recorded_at': datetime.now(timezone.utc).isoformat()
-        }).execute()
+        })
+    return True
+
+
+def flush_metrics(client) -> bool:
+    """Write all buffered metrics to the pipeline_metrics table in one insert."""
+    with _METRICS_LOCK:
+        rows = _METRICS_BUFFER[:]
+        _METRICS_BUFFER.clear()
+    
+    if not rows:
+        return True
+    
+    try:
+        client.table('pipeline_metrics').insert(rows).execute()
         return True
     except Exception as e:
-        # Don't fail on metrics errors
+        # Don't fail on metrics errors, but the whole batch is lost: record it
+        log.warning("Metrics flush failed (%s rows): %s", len(rows), e)
         return False
 
 
@@ -419,7 +577,7 @@ def apply_freshness_to_predictions(client) -> int:
         return updated_count
     
     except Exception as e:
-        print(f"Error applying freshness decay: {e}")
+        log.error("Freshness decay failed: %s", e)
         return 0
 
 
@@ -435,12 +593,24 @@ def detect_alliance(data: Dict) -> str:
     Returns:
         Alliance name (e.g., "DMK_Front") or "Unknown"
     """
+    return detect_alliances([data])[0]
+
+
+def detect_alliances(data_list: List[Dict]) -> List[str]:
+    """
+    Batched detect_alliance(): one zero-shot call for all payloads that need it.
+    
+    Args:
+        data_list: Full JSON payloads
+    
+    Returns:
+        Alliance name or "Unknown" for each payload
+    """
     # Check if alliance is already set by producer
-    meta = data.get('meta', {})
-    producer_alliance = meta.get('alliance', '')
+    producer_alliances = [(data.get('meta', {}).get('alliance', '') or None) for data in data_list]
     
     # Use shared classifier (will use producer_alliance if valid)
-    return classify_alliance(data, producer_alliance=producer_alliance if producer_alliance else None)
+    return classify_alliances_batch(data_list, producer_alliances)
 
 
 def get_all_constituencies() -> List[str]:
@@ -504,18 +674,19 @@ def calculate_sentiment_score(sentiment_results: Dict) -> float:
     return round(score, 4)
 
 
-def upsert_constituency_prediction(
-    client,
+def compute_prediction_row(
+    existing: Optional[Dict],
     constituency_name: str,
     alliance_name: str,
     current_score: float,
     is_state_wide: bool = False,
     source_id: Optional[str] = None,
     model_version: Optional[str] = None,
-    avg_confidence: float = 0.5
-) -> bool:
+    avg_confidence: float = 0.5,
+    district: str = 'Unknown'
+) -> Dict:
     """
-    Upsert a constituency prediction with enhancements.
+    Apply one source's score to a constituency prediction row (no I/O).
     
     Sprint 2 Features:
     - Outlier cap: Limits influence of any single source
@@ -524,6 +695,165 @@ def upsert_constituency_prediction(
     Formula: New_Score = Old_Score + capped_delta
     Where capped_delta = cap(current_score * new_factor - old_score * (1-decay_factor))
     
+    Args:
+        existing: Current row (None if the prediction does not exist yet)
+        constituency_name: Name of the constituency
+        alliance_name: Name of the political alliance
+        current_score: Current sentiment score (-1.0 to +1.0)
+        is_state_wide: If True, apply lower weight (0.05 instead of 0.1)
+        source_id: Content ID for data lineage tracking
+        model_version: Version of the ML model used
+        avg_confidence: Average model confidence (0.0-1.0)
+        district: District recorded when the row is created
+    
+    Returns:
+        Full row dict ready for upsert (same keys for new and existing rows)
+    """
+    # Set decay factor based on whether this is local or state-wide
+    if is_state_wide:
+        new_factor = 0.05   # New score weight (lower for state-wide)
+    else:
+        new_factor = 0.1   # New score weight
+    
+    if existing:
+        # Row exists - update with moving average + outlier cap
+        old_score = existing.get('sentiment_score', 0.0)
+        old_confidence = existing.get('confidence_weight', 0.5)
+        old_sources = existing.get('source_ids', []) or []
+        source_count = existing.get('source_count', 0) or 0
+        
+        # Calculate delta (what this source would contribute)
+        raw_delta = (current_score - old_score) * new_factor
+        
+        # Sprint 2: Apply outlier cap to prevent single source dominance
+        new_score = apply_influence_cap(old_score, raw_delta)
+        new_score = round(max(-1.0, min(1.0, new_score)), 4)  # Clamp to [-1, 1]
+        
+        # Update confidence weight (blend old and new, weighted by avg_confidence)
+        new_confidence = (old_confidence * 0.8) + (avg_confidence * 0.2)
+        new_confidence = round(new_confidence, 4)
+        
+        # Update source_ids (keep last MAX_SOURCE_IDS, bounded deque drops the oldest)
+        if source_id and source_id not in old_sources:
+            recent_sources = deque(old_sources, maxlen=MAX_SOURCE_IDS)
+            recent_sources.append(source_id)
+            old_sources = list(recent_sources)
+            source_count += 1
+        
+        return {
+            'constituency_name': constituency_name,
+            'alliance': alliance_name,
+            'district': existing.get('district') or district,
+            'sentiment_score': new_score,
+            'confidence_weight': new_confidence,
+            'source_ids': old_sources,
+            'source_count': source_count,
+            'model_version': model_version or existing.get('model_version') or MODEL_VERSION,
+            'last_updated': datetime.now(timezone.utc).isoformat()
+        }
+    
+    # Row doesn't exist - insert new (cap for initial score too)
+    initial_score = apply_influence_cap(0.0, current_score * new_factor)
+    initial_score = round(max(-1.0, min(1.0, initial_score)), 4)
+    
+    return {
+        'constituency_name': constituency_name,
+        'alliance': alliance_name,
+        'district': district,  # Will be updated by location detection
+        'sentiment_score': initial_score,
+        'confidence_weight': avg_confidence,
+        'source_ids': [source_id] if source_id else [],
+        'source_count': 1 if source_id else 0,
+        'model_version': model_version or MODEL_VERSION,
+        'last_updated': datetime.now(timezone.utc).isoformat()
+    }
+
+
+def read_prediction_rows(client, names: List[str], alliances: List[str]) -> Dict:
+    """
+    Read existing prediction rows for every (name, alliance) combination.
+    
+    Names are queried in chunks small enough that a chunk can never match
+    more than PREDICTION_READ_MAX_ROWS rows (one row per pair), so the
+    server's row limit cannot silently truncate the result. A missing row
+    would otherwise be treated as new and overwrite the accumulated score.
+    
+    Returns:
+        {(constituency_name, alliance): row}
+    """
+    chunk_size = max(1, PREDICTION_READ_MAX_ROWS // max(1, len(alliances)))
+    rows = {}
+    
+    for start in range(0, len(names), chunk_size):
+        result = client.table('constituency_predictions').select(
+            'constituency_name, alliance, district, sentiment_score, confidence_weight, '
+            'source_ids, source_count, model_version'
+        ).in_('alliance', alliances).in_('constituency_name', names[start:start + chunk_size]).execute()
+        
+        for r in (result.data or []):
+            rows[(r['constituency_name'], r['alliance'])] = r
+    
+    return rows
+
+
+def write_prediction_updates(client, updates: List[Dict]) -> int:
+    """
+    Apply a list of prediction updates with one read and one bulk upsert.
+    
+    Existing rows for every touched (constituency, alliance) pair are read
+    (see read_prediction_rows), updates are applied in order in memory (so
+    several jobs hitting the same row still compose like sequential writes),
+    and the resulting rows are written back in one upsert.
+    
+    Args:
+        client: Supabase client
+        updates: compute_prediction_row() keyword dicts (see plan_prediction_updates)
+    
+    Returns:
+        Number of prediction rows written
+    
+    Raises:
+        Exception: If the read or the upsert fails
+    """
+    if not updates:
+        return 0
+    
+    names = sorted({u['constituency_name'] for u in updates})
+    alliances = sorted({u['alliance_name'] for u in updates})
+    
+    rows = read_prediction_rows(client, names, alliances)
+    touched = {}  # Insertion-ordered set of keys written in this flush
+    
+    for update in updates:
+        key = (update['constituency_name'], update['alliance_name'])
+        rows[key] = compute_prediction_row(rows.get(key), **update)
+        touched[key] = True
+    
+    payload = [rows[key] for key in touched]
+    client.table('constituency_predictions').upsert(
+        payload, on_conflict='constituency_name,alliance'
+    ).execute()
+    
+    return len(payload)
+
+
+def upsert_constituency_prediction(
+    client,
+    constituency_name: str,
+    alliance_name: str,
+    current_score: float,
+    is_state_wide: bool = False,
+    source_id: Optional[str] = None,
+    model_version: Optional[str] = None,
+    avg_confidence: float = 0.5,
+    district: str = 'Unknown'
+) -> bool:
+    """
+    Upsert a single constituency prediction with enhancements.
+    
+    See compute_prediction_row() for the scoring rules; batches should use
+    write_prediction_updates() directly.
+    
     Args:
         client: Supabase client
         constituency_name: Name of the constituency
@@ -533,154 +863,150 @@ def upsert_constituency_prediction(
         source_id: Content ID for data lineage tracking
         model_version: Version of the ML model used
         avg_confidence: Average model confidence (0.0-1.0)
+        district: District recorded when the row is created
     
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Set decay factor based on whether this is local or state-wide
-        if is_state_wide:
-            new_factor = 0.05   # New score weight (lower for state-wide)
-        else:
-            new_factor = 0.1   # New score weight
-        
-        # Check if row exists
-        result = client.table('constituency_predictions').select(
-            'sentiment_score, confidence_weight, source_ids, source_count'
-        ).eq('constituency_name', constituency_name).eq('alliance', alliance_name).execute()
-        
-        if result.data and len(result.data) > 0:
-            # Row exists - update with moving average + outlier cap
-            old_score = result.data[0].get('sentiment_score', 0.0)
-            old_confidence = result.data[0].get('confidence_weight', 0.5)
-            old_sources = result.data[0].get('source_ids', []) or []
-            source_count = result.data[0].get('source_count', 0) or 0
-            
-            # Calculate delta (what this source would contribute)
-            raw_delta = (current_score - old_score) * new_factor
-            
-            # Sprint 2: Apply outlier cap to prevent single source dominance
-            new_score = apply_influence_cap(old_score, raw_delta)
-            new_score = round(max(-1.0, min(1.0, new_score)), 4)  # Clamp to [-1, 1]
-            
-            # Update confidence weight (blend old and new, weighted by avg_confidence)
-            new_confidence = (old_confidence * 0.8) + (avg_confidence * 0.2)
-            new_confidence = round(new_confidence, 4)
-            
-            # Update source_ids (keep last 100)
-            if source_id and source_id not in old_sources:
-                old_sources.append(source_id)
-                if len(old_sources) > 100:
-                    old_sources = old_sources[-100:]
-                source_count += 1
-            
-            update_data = {
-                'sentiment_score': new_score,
-                'confidence_weight': new_confidence,
-                'source_count': source_count,
-                'last_updated': datetime.now(timezone.utc).isoformat()
-            }
-            
-            if source_id:
-                update_data['source_ids'] = old_sources
-            if model_version:
-                update_data['model_version'] = model_version
-            
-            client.table('constituency_predictions').update(update_data).eq(
-                'constituency_name', constituency_name
-            ).eq('alliance', alliance_name).execute()
-        else:
-            # Row doesn't exist - insert new (cap for initial score too)
-            initial_score = apply_influence_cap(0.0, current_score * new_factor)
-            initial_score = round(max(-1.0, min(1.0, initial_score)), 4)
-            
-            insert_data = {
-                'constituency_name': constituency_name,
-                'alliance': alliance_name,
-                'district': 'Unknown',  # Will be updated by location detection
-                'sentiment_score': initial_score,
-                'confidence_weight': avg_confidence,
-                'source_count': 1 if source_id else 0
-            }
-            
-            if source_id:
-                insert_data['source_ids'] = [source_id]
-            if model_version:
-                insert_data['model_version'] = model_version
-            
-            client.table('constituency_predictions').insert(insert_data).execute()
-        
+        write_prediction_updates(client, [{
+            'constituency_name': constituency_name,
+            'alliance_name': alliance_name,
+            'current_score': current_score,
+            'is_state_wide': is_state_wide,
+            'source_id': source_id,
+            'model_version': model_version,
+            'avg_confidence': avg_confidence,
+            'district': district
+        }])
         return True
     except Exception as e:
-        print(f"Error upserting prediction for {constituency_name}/{alliance_name}: {e}")
+        log.error("Prediction upsert failed for %s/%s: %s", constituency_name, alliance_name, e)
         return False
 
 
-def persist_predictions(
-    client,
+def plan_prediction_updates(
     detected_locations: List[str],
     alliance_name: str,
     sentiment_score: float,
     source_id: Optional[str] = None,
     model_version: Optional[str] = None,
-    avg_confidence: float = 0.5
-) -> int:
+    avg_confidence: float = 0.5,
+    politician_constituencies: Optional[List[str]] = None
+) -> List[Dict]:
     """
-    Persist sentiment predictions to the database with Sprint 2 enhancements.
+    Work out which prediction rows one job updates, without touching the database.
     
-    Handles both local (specific districts) and state-wide updates.
+    Handles both local (specific districts) and state-wide updates, plus
+    politician-routed constituencies (boosted confidence).
     
     Args:
-        client: Supabase client
         detected_locations: List of detected districts or ["State_Wide"]
         alliance_name: Political alliance name
         sentiment_score: Sentiment score (-1.0 to +1.0)
         source_id: Content ID for data lineage tracking
         model_version: Version of the ML model used
         avg_confidence: Average model confidence (Sprint 2)
+        politician_constituencies: Constituencies of politicians mentioned in the content
     
     Returns:
-        Number of constituencies updated
+        List of update dicts for write_prediction_updates()
     """
     # Handle "Unknown" alliance
     # For news articles: Skip if truly neutral (no political content detected)
     # For YouTube: Skip (should have alliance from discovery phase)
     if alliance_name == "Unknown":
-        print("  Skipping persistence: Unknown alliance (no political content detected)")
-        print("  Note: Generic news articles without alliance-specific content are excluded")
-        return 0
+        log.info("  Skipping persistence: Unknown alliance (no political content detected)")
+        log.info("  Note: Generic news articles without alliance-specific content are excluded")
+        return []
     
-    updated_count = 0
+    def update(constituency: str, is_state_wide: bool, confidence: float, district: str = 'Unknown') -> Dict:
+        return {
+            'constituency_name': constituency,
+            'alliance_name': alliance_name,
+            'current_score': sentiment_score,
+            'is_state_wide': is_state_wide,
+            'source_id': source_id,
+            'model_version': model_version,
+            'avg_confidence': confidence,
+            'district': district
+        }
     
     if "State_Wide" in detected_locations:
         # State-wide: Update ALL constituencies with lower weight
-        print(f"  Persisting to ALL constituencies (State_Wide, weight: 0.05)")
-        constituencies = get_all_constituencies()
-        
-        for constituency in constituencies:
-            if upsert_constituency_prediction(
-                client, constituency, alliance_name, sentiment_score, 
-                is_state_wide=True, source_id=source_id, model_version=model_version,
-                avg_confidence=avg_confidence
-            ):
-                updated_count += 1
+        log.info("  Persisting to ALL constituencies (State_Wide, weight: 0.05)")
+        updates = [update(c, True, avg_confidence) for c in get_all_constituencies()]
     else:
         # Local: Update only constituencies in detected districts
         constituencies = get_constituencies_for_districts(detected_locations)
-        print(f"  Persisting to {len(constituencies)} constituencies in {detected_locations}")
-        
-        for constituency in constituencies:
-            if upsert_constituency_prediction(
-                client, constituency, alliance_name, sentiment_score, 
-                is_state_wide=False, source_id=source_id, model_version=model_version,
-                avg_confidence=avg_confidence
-            ):
-                updated_count += 1
+        log.info("  Persisting to %s constituencies in %s", len(constituencies), detected_locations)
+        updates = [update(c, False, avg_confidence) for c in constituencies]
+    
+    # Politician-specific constituency predictions (higher precision)
+    if politician_constituencies:
+        log.info("  Routing to politician constituencies: %s", politician_constituencies)
+        boosted_confidence = min(avg_confidence * 1.2, 1.0)  # 20% confidence boost
+        updates.extend(
+            update(c, False, boosted_confidence, district="POLITICIAN_ROUTED")  # Special marker for debugging
+            for c in politician_constituencies
+        )
+    
+    return updates
+
+
+def persist_predictions(
+    client,
+    detected_locations: List[str],
+    alliance_name: str,
+    sentiment_score: float,
+    source_id: Optional[str] = None,
+    model_version: Optional[str] = None,
+    avg_confidence: float = 0.5
+) -> int:
+    """
+    Persist sentiment predictions for one job to the database.
+    
+    Args:
+        client: Supabase client
+        detected_locations: List of detected districts or ["State_Wide"]
+        alliance_name: Political alliance name
+        sentiment_score: Sentiment score (-1.0 to +1.0)
+        source_id: Content ID for data lineage tracking
+        model_version: Version of the ML model used
+        avg_confidence: Average model confidence (Sprint 2)
+    
+    Returns:
+        Number of constituencies updated
+    """
+    updates = plan_prediction_updates(
+        detected_locations, alliance_name, sentiment_score,
+        source_id=source_id, model_version=model_version, avg_confidence=avg_confidence
+    )
+    try:
+        return write_prediction_updates(client, updates)
+    except Exception as e:
+        log.error("Persisting predictions failed for %s: %s", alliance_name, e)
+        return 0
+
+
+def match_districts(text_lower: str) -> List[str]:
+    """
+    Return districts with at least one gazetteer keyword in the (lowercased) text.
+    
+    Args:
+        text_lower: Already-lowercased text
     
-    return updated_count
+    Returns:
+        List of matching district names in gazetteer order
+    """
+    return [
+        district_name
+        for district_name, keywords in GAZETTEER_INDEX
+        if any(keyword in text_lower for keyword in keywords)
+    ]
 
 
-def detect_location(data: Dict) -> List[str]:
+def detect_location(data: Dict, lowered: Optional[Dict] = None) -> List[str]:
     """
     Detect location(s) from video data using Metadata-First strategy.
     
@@ -692,6 +1018,7 @@ def detect_location(data: Dict) -> List[str]:
     
     Args:
         data: Full JSON payload containing meta, transcript, and comments
+        lowered: Optional lowercase_content(data) result to reuse
     
     Returns:
         List of district names, or ["State_Wide"] if no match found
@@ -699,71 +1026,46 @@ def detect_location(data: Dict) -> List[str]:
     # Priority 0: Check for location_override (from news scraper - highest confidence)
     location_override = data.get('location_override')
     if location_override:
-        print(f"  Location from override (news scraper): {location_override}")
+        log.info("  Location from override (news scraper): %s", location_override)
         return [location_override] if isinstance(location_override, str) else location_override
     
     gazetteer = load_gazetteer()
     if not gazetteer:
         return ["State_Wide"]
     
+    if lowered is None:
+        lowered = lowercase_content(data)
+    
     detected_districts = set()
     
     # Priority 1: Metadata (title + description)
-    meta = data.get('meta', {})
-    title = meta.get('title', '') or ''
-    description = meta.get('description', '') or ''
-    metadata_text = f"{title} {description}".lower()
-    
-    for district_name, district_data in gazetteer.items():
-        keywords = district_data.get('keywords', [])
-        for keyword in keywords:
-            if keyword.lower() in metadata_text:
-                detected_districts.add(district_name)
-                break  # Found match, move to next district
+    metadata_text = f"{lowered['title']} {lowered['description']}"
+    detected_districts.update(match_districts(metadata_text))
     
     if detected_districts:
-        print(f"  Location detected from metadata: {sorted(detected_districts)}")
+        log.info("  Location detected from metadata: %s", sorted(detected_districts))
         return sorted(list(detected_districts))
     
     # Priority 2: Transcript
-    transcript = data.get('transcript', '') or ''
-    if transcript:
-        transcript_lower = transcript.lower()
-        for district_name, district_data in gazetteer.items():
-            keywords = district_data.get('keywords', [])
-            for keyword in keywords:
-                if keyword.lower() in transcript_lower:
-                    detected_districts.add(district_name)
-                    break
+    if lowered['transcript']:
+        detected_districts.update(match_districts(lowered['transcript']))
     
     if detected_districts:
-        print(f"  Location detected from transcript: {sorted(detected_districts)}")
+        log.info("  Location detected from transcript: %s", sorted(detected_districts))
         return sorted(list(detected_districts))
     
     # Priority 3: Comments (require 3+ mentions per district)
-    # Check both new field (user_comments) and old field (comments) for backward compatibility
-    comments = data.get('user_comments', []) or data.get('comments', [])
+    comments = lowered['comments']
     if comments:
         district_mentions = {}
         
-        for comment in comments:
-            # Handle both formats: dict (YouTube) and string (news scraper)
-            if isinstance(comment, dict):
-                comment_text = (comment.get('text', '') or '').lower()
-            elif isinstance(comment, str):
-                comment_text = comment.lower()
-            else:
-                continue
-            
+        for comment_text in comments:
             if not comment_text:
                 continue
             
-            for district_name, district_data in gazetteer.items():
-                keywords = district_data.get('keywords', [])
-                for keyword in keywords:
-                    if keyword.lower() in comment_text:
-                        district_mentions[district_name] = district_mentions.get(district_name, 0) + 1
-                        break  # Count once per comment per district
+            # Count once per comment per district
+            for district_name in match_districts(comment_text):
+                district_mentions[district_name] = district_mentions.get(district_name, 0) + 1
         
         # Only include districts mentioned in 3+ different comments
         for district_name, mention_count in district_mentions.items():
@@ -771,11 +1073,11 @@ def detect_location(data: Dict) -> List[str]:
                 detected_districts.add(district_name)
     
     if detected_districts:
-        print(f"  Location detected from comments (3+ mentions): {sorted(detected_districts)}")
+        log.info("  Location detected from comments (3+ mentions): %s", sorted(detected_districts))
         return sorted(list(detected_districts))
     
     # Fallback: State-wide
-    print(f"  No location detected, defaulting to State_Wide")
+    log.info("  No location detected, defaulting to State_Wide")
     return ["State_Wide"]
 
 
@@ -787,8 +1089,8 @@ def load_sentiment_model():
         Pipeline object for sentiment analysis
     """
     try:
-        print("Loading sentiment model (this may take a moment on first run)...")
-        print("Model: cardiffnlp/twitter-xlm-roberta-base-sentiment")
+        log.info("Loading sentiment model (this may take a moment on first run)...")
+        log.info("Model: cardiffnlp/twitter-xlm-roberta-base-sentiment")
         
         # Set cache directory if not already set
         if not os.getenv('HF_HOME') and not os.getenv('TRANSFORMERS_CACHE'):
@@ -798,187 +1100,422 @@ def load_sentiment_model():
         model_name = "cardiffnlp/twitter-xlm-roberta-base-sentiment"
         
         # Use slow tokenizer class directly to avoid fast tokenizer conversion bug
-        print("Loading tokenizer...")
+        log.info("Loading tokenizer...")
         tokenizer = XLMRobertaTokenizer.from_pretrained(model_name)
         
-        # Load model
-        print("Loading model...")
-        model_obj = AutoModelForSequenceClassification.from_pretrained(model_name)
+        # Load model (int8 ONNX Runtime if enabled, FP32 PyTorch otherwise)
+        log.info("Loading model...")
+        model_obj = load_int8_model(model_name) if USE_ONNX_INT8 else None
+        if model_obj is not None:
+            log.info("Using int8-quantized ONNX Runtime model")
+        else:
+            model_obj = AutoModelForSequenceClassification.from_pretrained(model_name)
+            if USE_TORCH_COMPILE:
+                model_obj = accelerate_torch_model(model_obj)
         
         # Create pipeline with explicit tokenizer
-        print("Creating pipeline...")
+        log.info("Creating pipeline...")
         model = pipeline(
             "sentiment-analysis",
             model=model_obj,
             tokenizer=tokenizer,
-            return_all_scores=True,
+            top_k=1,  # Legacy path only needs the argmax label
             device=-1  # Use CPU (set to 0 for GPU if available)
         )
-        print("Model loaded successfully!")
+        if USE_TORCH_COMPILE:
+            # Pay the compile cost here rather than on the first real batch
+            log.info("Warming up compiled model...")
+            model(["warm up"], truncation=True)
+        log.info("Model loaded successfully!")
         return model
     except Exception as e:
-        import traceback
-        print(f"Error loading sentiment model: {e}")
-        print(f"Error type: {type(e).__name__}")
-        print("Full traceback:")
-        traceback.print_exc()
-        print("\nTroubleshooting:")
-        print("1. Ensure protobuf is installed: pip install protobuf")
-        print("2. Check internet connection (model needs to download on first run)")
-        print("3. Try clearing cache: rm -rf ~/.cache/huggingface")
+        log.error("Could not load sentiment model: %s", e)
+        log.error("Exception type: %s", type(e).__name__)
+        log.error("Full traceback:")
+        log.error("%s", traceback.format_exc())
+        log.error("Troubleshooting:")
+        log.error("1. Ensure protobuf is installed: pip install protobuf")
+        log.error("2. Check internet connection (model needs to download on first run)")
+        log.error("3. Try clearing cache: rm -rf ~/.cache/huggingface")
         return None
 
 
-def analyze_sentiment(texts: list, model) -> Dict:
+def _lexicon_hits(text: str) -> tuple:
+    """Count (positive, negative) lexicon hits in a text."""
+    pos_hits = 0
+    neg_hits = 0
+    for token in _LEXICON_TOKEN_RE.findall(text.lower()):
+        if token in _POS_LEXICON:
+            pos_hits += 1
+        elif token in _NEG_LEXICON:
+            neg_hits += 1
+    return pos_hits, neg_hits
+
+
+def classify_with_lexicon(text: str) -> Optional[str]:
     """
-    Run sentiment analysis on a list of texts with Sprint 2 enhancements.
+    Cheap rule-based sentiment label for texts with strong keyword signal.
+
+    Counts positive/negative lexicon hits and decides only when one side
+    clearly dominates; everything else is left to the transformer model.
+
+    Args:
+        text: Raw comment or headline text
+
+    Returns:
+        "positive" or "negative" if the lexicon is decisive, None otherwise
+    """
+    pos_hits, neg_hits = _lexicon_hits(text)
+
+    if pos_hits + neg_hits < LEXICON_MIN_HITS:
+        return None
+    if pos_hits - neg_hits >= LEXICON_MIN_MARGIN:
+        return "positive"
+    if neg_hits - pos_hits >= LEXICON_MIN_MARGIN:
+        return "negative"
+    return None
+
+
+def lexicon_result(text: str) -> Optional[list]:
+    """
+    Pipeline-style result for a short comment the lexicon can decide.
+
+    The decided label gets a calibrated score that grows with the hit margin
+    (capped at LEXICON_MAX_SCORE); the rest of the mass is split evenly over
+    the other labels so probability scoring and avg_confidence stay honest.
+
+    Args:
+        text: Raw user comment
+
+    Returns:
+        List of {'label', 'score'} sorted by score descending, or None if the
+        text is too long or the lexicon is not decisive
+    """
+    if len(text.split()) > LEXICON_MAX_WORDS:
+        return None
+    label = classify_with_lexicon(text)
+    if label is None:
+        return None
+
+    pos_hits, neg_hits = _lexicon_hits(text)
+    margin = abs(pos_hits - neg_hits)
+    score = min(LEXICON_MAX_SCORE, LEXICON_BASE_SCORE + LEXICON_SCORE_STEP * (margin - LEXICON_MIN_MARGIN))
+    rest = (1.0 - score) / 2
+    other = "negative" if label == "positive" else "positive"
+    return [
+        {'label': label, 'score': score},
+        {'label': 'neutral', 'score': rest},
+        {'label': other, 'score': rest},
+    ]
+
+
+def extract_texts(texts: list, max_chars: Optional[int] = MAX_TEXT_CHARS) -> tuple:
+    """
+    Normalise raw content items into parallel text/likes lists.
     
-    Features:
-    - Engagement weighting: Comments with more likes count more
-    - Probability scoring: Uses model confidence, not just top label
+    Texts are cut to MAX_TEXT_CHARS so the tokenizer never walks text the
+    model would truncate away.
     
     Args:
         texts: List of text items (can be dict with 'text'/'likes' keys or plain strings)
-        model: HuggingFace pipeline model
+        max_chars: Per-text character cap (None keeps full text)
     
     Returns:
-        Dictionary with sentiment statistics (weighted counts and probabilities)
+        Tuple of (list of texts, list of like counts)
     """
-    if not model:
-        return {"error": "Model not available"}
-    
-    sentiments = {
-        "positive": 0.0,
-        "negative": 0.0,
-        "neutral": 0.0,
-        "total": len(texts),
-        # Sprint 2: Probability-based scores
-        "positive_prob": 0.0,
-        "negative_prob": 0.0,
-        "neutral_prob": 0.0,
-        "total_weight": 0.0,
-        "avg_confidence": 0.0
-    }
-    
-    try:
-        # Handle both formats: dict (YouTube) and string (news scraper)
-        text_list = []
-        likes_list = []  # Sprint 2: Track likes for engagement weighting
-        
-        for item in texts:
-            if isinstance(item, dict):
-                text = item.get('text', '')
-                likes = item.get('likes', 0) or item.get('like_count', 0) or 0
-            elif isinstance(item, str):
-                text = item
-                likes = 0
-            else:
-                continue
-            
-            if text:
-                text_list.append(text)
-                likes_list.append(likes)
-        
-        if not text_list:
-            return sentiments
-        
-        sentiments["total"] = len(text_list)
-        total_confidence = 0.0
-        
-        # Run inference in batches to avoid memory issues
-        batch_size = 32
-        for i in range(0, len(text_list), batch_size):
-            batch = text_list[i:i + batch_size]
-            batch_likes = likes_list[i:i + batch_size]
-            
-            # Request all scores (not just top-1) for probability scoring
-            results = model(batch, top_k=None) if ENABLE_PROBABILITY_SCORING else model(batch)
-            
-            for idx, result in enumerate(results):
-                # Get engagement weight for this item
-                engagement_weight = get_engagement_weight(batch_likes[idx])
-                sentiments["total_weight"] += engagement_weight
-                
-                if ENABLE_PROBABILITY_SCORING and isinstance(result, list):
-                    # Sprint 2: Use full probability distribution
-                    for score_item in result:
-                        label = score_item['label'].lower()
-                        prob = score_item['score']
-                        weighted_prob = prob * engagement_weight
-                        
-                        if 'positive' in label:
-                            sentiments["positive_prob"] += weighted_prob
-                            sentiments["positive"] += weighted_prob
-                        elif 'negative' in label:
-                            sentiments["negative_prob"] += weighted_prob
-                            sentiments["negative"] += weighted_prob
-                        else:
-                            sentiments["neutral_prob"] += weighted_prob
-                            sentiments["neutral"] += weighted_prob
-                    
-                    # Track confidence (highest probability)
-                    if result:
-                        top_prob = max(r['score'] for r in result)
-                        total_confidence += top_prob
-                else:
-                    # Legacy: Binary classification (top label only)
-                    if isinstance(result, list) and len(result) > 0:
-                        top_result = max(result, key=lambda x: x['score'])
-                        label = top_result['label'].lower()
-                        confidence = top_result['score']
-                        total_confidence += confidence
-                        
-                        if 'positive' in label:
-                            sentiments["positive"] += engagement_weight
-                        elif 'negative' in label:
-                            sentiments["negative"] += engagement_weight
-                        else:
-                            sentiments["neutral"] += engagement_weight
+    # Handle both formats: dict (YouTube) and string (news scraper)
+    text_list = []
+    likes_list = []  # Sprint 2: Track likes for engagement weighting
+    
+    for item in texts:
+        if isinstance(item, dict):
+            text = item.get('text', '')
+            likes = item.get('likes', 0) or item.get('like_count', 0) or 0
+        elif isinstance(item, str):
+            text = item
+            likes = 0
+        else:
+            continue
         
-        # Calculate average confidence
-        if sentiments["total"] > 0:
-            sentiments["avg_confidence"] = round(total_confidence / sentiments["total"], 4)
+        if text:
+            text_list.append(text[:max_chars] if max_chars else text)
+            likes_list.append(likes)
     
-    except Exception as e:
-        print(f"Error during sentiment analysis: {e}")
+    return text_list, likes_list
+
+
+def sliding_window(words: List[str], size: int = WINDOW_WORDS, stride: int = WINDOW_STRIDE):
+    """Yield overlapping windows of `size` words, advancing by `stride`."""
+    for start in range(0, len(words), stride):
+        yield words[start:start + size]
+        if start + size >= len(words):
+            break
+
+
+def split_long_text(text: str) -> List[str]:
+    """
+    Split an over-long text into model-sized word windows.
     
-    return sentiments
+    Texts up to MAX_TEXT_CHARS are returned whole without splitting; anything
+    longer is scored as overlapping windows, so no part of it is dropped.
+    
+    Args:
+        text: Raw text
+    
+    Returns:
+        List of texts to score; more than one means the results are pooled
+    """
+    if len(text) <= MAX_TEXT_CHARS:
+        return [text]
+    return [' '.join(window) for window in sliding_window(text.split())]
 
 
-def compute_weighted_sentiment(
-    authoritative_content: list,
-    user_comments: list,
+def pool_window_results(window_results: List[Optional[list]]) -> Optional[list]:
+    """
+    Mean-pool per-window model outputs into one result for the parent text.
+    
+    Args:
+        window_results: Model results for each window (None entries are skipped)
+    
+    Returns:
+        Pipeline-style list of {'label', 'score'} sorted by score descending,
+        or None if no window was scored
+    """
+    scored = [r for r in window_results if r]
+    if len(scored) <= 1:
+        return scored[0] if scored else None
+    
+    totals = {}
+    for result in scored:
+        for item in result:
+            totals[item['label']] = totals.get(item['label'], 0.0) + item['score']
+    
+    pooled = [{'label': label, 'score': total / len(scored)} for label, total in totals.items()]
+    pooled.sort(key=lambda item: item['score'], reverse=True)
+    return pooled
+
+
+def prediction_cache_key(text: str) -> bytes:
+    """
+    Digest of the whitespace-normalized text, used as the prediction cache key.
+    
+    Case is kept: the sentiment model is cased and scores "GREAT!!" and
+    "great!!" differently, so they must not share an entry.
+    """
+    normalized = ' '.join(unicodedata.normalize('NFC', text).split())
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).digest()
+
+
+def run_sentiment_model(
+    text_list: List[str],
     model,
-    authoritative_weight: float = 3.0,
-    user_weight: float = 1.0
-) -> Dict:
+    lexicon_eligible: Optional[List[bool]] = None
+) -> List[Optional[list]]:
     """
-    Compute weighted sentiment using the "Weighted Hybrid" model.
+    Score texts with the lexicon fast path and batched model inference.
     
-    Applies different weights to authoritative content (news) vs user comments:
-    - Authoritative content (news headlines): weight 3.0 (authoritative signal)
-    - User comments (social media): weight 1.0 (noisy signal)
+    Args:
+        text_list: Plain texts to score
+        model: HuggingFace pipeline model
+        lexicon_eligible: Per-text flags for the lexicon fast path; only whole
+            (unwindowed) user comments should be marked. None disables it.
     
-    Formula: Score = (User_Sentiment * 1.0) + (Authoritative_Sentiment * 3.0)
+    Returns:
+        One result per text: a list of {'label', 'score'} dicts
+    """
+    # Lexicon fast path: decisive short comments get a calibrated result
+    # without touching the model; everything else is queued for inference
+    results = [None] * len(text_list)
+    model_indices = []
+    for idx, text in enumerate(text_list):
+        eligible = ENABLE_LEXICON_FAST_PATH and lexicon_eligible is not None and lexicon_eligible[idx]
+        lexicon = lexicon_result(text) if eligible else None
+        if lexicon:
+            results[idx] = lexicon
+        else:
+            model_indices.append(idx)
+    lexicon_decided = len(text_list) - len(model_indices)
+    
+    # Prediction cache: serve repeated texts from the LRU and send each
+    # distinct unseen text to the model only once
+    miss_indices = model_indices
+    duplicates = {}  # cache key -> indices sharing the same uncached text
+    if ENABLE_PREDICTION_CACHE:
+        miss_indices = []
+        for idx in model_indices:
+            key = prediction_cache_key(text_list[idx])
+            cached = _PREDICTION_CACHE.get(key)
+            if cached is not None:
+                _PREDICTION_CACHE.move_to_end(key)
+                _PREDICTION_CACHE_STATS['hits'] += 1
+                results[idx] = cached
+            elif key in duplicates:
+                _PREDICTION_CACHE_STATS['hits'] += 1
+                duplicates[key].append(idx)
+            else:
+                _PREDICTION_CACHE_STATS['misses'] += 1
+                duplicates[key] = [idx]
+                miss_indices.append(idx)
+    
+    # Run inference in batches to avoid memory issues
+    for i in range(0, len(miss_indices), INFERENCE_BATCH_SIZE):
+        batch_indices = miss_indices[i:i + INFERENCE_BATCH_SIZE]
+        batch = [text_list[j] for j in batch_indices]
+        
+        # Request all scores for probability scoring; otherwise top-1 only
+        top_k = None if ENABLE_PROBABILITY_SCORING else 1
+        batch_results = model(batch, top_k=top_k, truncation=True)
+        for j, result in zip(batch_indices, batch_results):
+            results[j] = result
+            if ENABLE_PREDICTION_CACHE:
+                key = prediction_cache_key(text_list[j])
+                for dup in duplicates[key]:
+                    results[dup] = result
+                _PREDICTION_CACHE[key] = result
+                if len(_PREDICTION_CACHE) > PREDICTION_CACHE_SIZE:
+                    _PREDICTION_CACHE.popitem(last=False)
+    
+    if lexicon_decided:
+        log.info("  Lexicon fast path decided %s/%s texts", lexicon_decided, len(text_list))
+    if len(miss_indices) < len(model_indices):
+        log.info("  Prediction cache served %s/%s texts", len(model_indices) - len(miss_indices), len(model_indices))
+    
+    return results
+
+
+def _sentiment_column(label: str) -> int:
+    """Map a model label to its column in the [positive, negative, neutral] score matrix."""
+    label = label.lower()
+    if 'positive' in label:
+        return 0
+    if 'negative' in label:
+        return 1
+    return 2
+
+
+def aggregate_sentiment(results: List[Optional[list]], likes_list: List[int]) -> Dict:
+    """
+    Fold per-text model results into engagement-weighted sentiment statistics.
     
-    This mimics "Market Sentiment" vs "Retail Noise" in trading algorithms.
+    Args:
+        results: Output of run_sentiment_model() (None entries are skipped)
+        likes_list: Like count for each result
+    
+    Returns:
+        Dictionary with sentiment statistics (weighted counts and probabilities)
+    """
+    sentiments = {
+        "positive": 0.0,
+        "negative": 0.0,
+        "neutral": 0.0,
+        "total": len(results),
+        # Sprint 2: Probability-based scores
+        "positive_prob": 0.0,
+        "negative_prob": 0.0,
+        "neutral_prob": 0.0,
+        "total_weight": 0.0,
+        "avg_confidence": 0.0
+    }
+    
+    # One row of [positive, negative, neutral] mass per scored text; the
+    # engagement-weighted totals are then a single weights @ scores product
+    rows = [(result, likes) for result, likes in zip(results, likes_list) if result is not None]
+    if not rows:
+        return sentiments
+    
+    scores = np.zeros((len(rows), 3), dtype=np.float64)
+    confidences = np.zeros(len(rows), dtype=np.float64)
+    
+    for i, (result, _) in enumerate(rows):
+        if not isinstance(result, list) or not result:
+            continue
+        
+        if ENABLE_PROBABILITY_SCORING:
+            # Sprint 2: Use full probability distribution
+            for score_item in result:
+                scores[i, _sentiment_column(score_item['label'])] += score_item['score']
+            # Track confidence (highest probability)
+            confidences[i] = max(r['score'] for r in result)
+        else:
+            # Legacy: Binary classification (top label only)
+            top_result = result[0]  # Pipeline returns scores sorted descending
+            scores[i, _sentiment_column(top_result['label'])] = 1.0
+            confidences[i] = top_result['score']
+    
+    # Get engagement weight for each item
+    likes = np.asarray([likes or 0 for _, likes in rows], dtype=np.float64)
+    if ENABLE_ENGAGEMENT_WEIGHTING:
+        weights = np.where(likes > 0, 1.0 + np.log10(1.0 + np.maximum(likes, 0.0)), 1.0)
+    else:
+        weights = np.ones(len(rows), dtype=np.float64)
+    
+    positive, negative, neutral = (weights @ scores).tolist()
+    sentiments["positive"] = positive
+    sentiments["negative"] = negative
+    sentiments["neutral"] = neutral
+    if ENABLE_PROBABILITY_SCORING:
+        sentiments["positive_prob"] = positive
+        sentiments["negative_prob"] = negative
+        sentiments["neutral_prob"] = neutral
+    sentiments["total_weight"] = float(weights.sum())
+    total_confidence = float(confidences.sum())
+    
+    # Calculate average confidence
+    if sentiments["total"] > 0:
+        sentiments["avg_confidence"] = round(total_confidence / sentiments["total"], 4)
+    
+    return sentiments
+
+
+def analyze_sentiment(texts: list, model) -> Dict:
+    """
+    Run sentiment analysis on a list of texts with Sprint 2 enhancements.
+    
+    Features:
+    - Engagement weighting: Comments with more likes count more
+    - Probability scoring: Uses model confidence, not just top label
     
     Args:
-        authoritative_content: List of authoritative texts (news headlines)
-        user_comments: List of user comments (social media)
-        model: Sentiment analysis model
+        texts: List of text items (can be dict with 'text'/'likes' keys or plain strings)
+        model: HuggingFace pipeline model
+    
+    Returns:
+        Dictionary with sentiment statistics (weighted counts and probabilities)
+    """
+    if not model:
+        return {"error": "Model not available"}
+    
+    text_list, likes_list = extract_texts(texts)
+    results = [None] * len(text_list)
+    
+    try:
+        if text_list:
+            results = run_sentiment_model(text_list, model)
+    except Exception as e:
+        log.error("Sentiment analysis failed: %s", e)
+        results = [None] * len(text_list)
+    
+    return aggregate_sentiment(results, likes_list)
+
+
+def combine_weighted_sentiment(
+    auth_sentiment: Dict,
+    user_sentiment: Dict,
+    authoritative_weight: float = 3.0,
+    user_weight: float = 1.0
+) -> Dict:
+    """
+    Blend authoritative and user sentiment into the Weighted Hybrid result.
+    
+    Args:
+        auth_sentiment: analyze_sentiment() output for authoritative content
+        user_sentiment: analyze_sentiment() output for user comments
         authoritative_weight: Weight for authoritative content (default: 3.0)
         user_weight: Weight for user comments (default: 1.0)
     
     Returns:
         Dictionary with weighted sentiment scores and breakdown
     """
-    # Analyze authoritative content
-    auth_sentiment = analyze_sentiment(authoritative_content, model)
-    
-    # Analyze user comments
-    user_sentiment = analyze_sentiment(user_comments, model)
-    
     # Calculate weighted scores
     weighted_positive = (
         (user_sentiment.get("positive", 0) * user_weight) +
@@ -1058,88 +1595,370 @@ def compute_weighted_sentiment(
     }
 
 
-def process_job(job_id: str, data_system: DataSystem, model) -> bool:
+def compute_weighted_sentiment(
+    authoritative_content: list,
+    user_comments: list,
+    model,
+    authoritative_weight: float = 3.0,
+    user_weight: float = 1.0
+) -> Dict:
     """
-    Process a single job from the queue with production hardening.
+    Compute weighted sentiment using the "Weighted Hybrid" model.
     
-    Features:
-    - Semantic deduplication (skip if already processed)
-    - Dead Letter Queue (store failed jobs for inspection)
-    - Metrics logging (track processing performance)
-    - Outlier cap (prevent single source dominance)
-    - Model versioning (track which model processed)
+    Applies different weights to authoritative content (news) vs user comments:
+    - Authoritative content (news headlines): weight 3.0 (authoritative signal)
+    - User comments (social media): weight 1.0 (noisy signal)
+    
+    Formula: Score = (User_Sentiment * 1.0) + (Authoritative_Sentiment * 3.0)
+    
+    This mimics "Market Sentiment" vs "Retail Noise" in trading algorithms.
     
     Args:
-        job_id: UUID of the job to process
-        data_system: DataSystem instance for file operations
+        authoritative_content: List of authoritative texts (news headlines)
+        user_comments: List of user comments (social media)
         model: Sentiment analysis model
+        authoritative_weight: Weight for authoritative content (default: 3.0)
+        user_weight: Weight for user comments (default: 1.0)
     
     Returns:
-        True if successful, False otherwise
+        Dictionary with weighted sentiment scores and breakdown
     """
-    start_time = time.time()
-    file_path = None
-    data = None
-    client = None
+    return compute_weighted_sentiment_batch(
+        [(authoritative_content, user_comments)],
+        model,
+        authoritative_weight=authoritative_weight,
+        user_weight=user_weight
+    )[0]
+
+
+def compute_weighted_sentiment_batch(
+    contents: List[tuple],
+    model,
+    authoritative_weight: float = 3.0,
+    user_weight: float = 1.0
+) -> List[Dict]:
+    """
+    Weighted Hybrid sentiment for several jobs with a single model pass.
+    
+    All authoritative and user texts from every job are flattened into one
+    list so the model sees full batches, then results are sliced back per
+    job and source by their offsets. Authoritative texts over MAX_TEXT_CHARS
+    are scored as overlapping windows whose results are mean-pooled,
+    keeping every model input within the token budget.
     
+    Args:
+        contents: List of (authoritative_content, user_comments) tuples, one per job
+        model: Sentiment analysis model
+        authoritative_weight: Weight for authoritative content (default: 3.0)
+        user_weight: Weight for user comments (default: 1.0)
+    
+    Returns:
+        One compute_weighted_sentiment()-style dictionary per job, in input order
+    """
+    model_inputs = []
+    lexicon_eligible = []  # Only user comments may take the lexicon fast path
+    windows = []  # (start, end) into model_inputs for each text
+    all_likes = []
+    spans = []  # (start, end) into windows/all_likes for each job's auth and user segments
+    
+    for authoritative_content, user_comments in contents:
+        job_spans = []
+        for items, windowed in ((authoritative_content, True), (user_comments, False)):
+            text_list, likes_list = extract_texts(items, max_chars=None if windowed else MAX_TEXT_CHARS)
+            start = len(windows)
+            for text in text_list:
+                window_start = len(model_inputs)
+                if windowed:
+                    model_inputs.extend(split_long_text(text))
+                else:
+                    model_inputs.append(text)
+                lexicon_eligible.extend([not windowed] * (len(model_inputs) - window_start))
+                windows.append((window_start, len(model_inputs)))
+            all_likes.extend(likes_list)
+            job_spans.append((start, len(windows)))
+        spans.append(job_spans)
+    
+    model_results = [None] * len(model_inputs)
+    if model and model_inputs:
+        try:
+            model_results = run_sentiment_model(model_inputs, model, lexicon_eligible)
+        except Exception as e:
+            log.error("Sentiment analysis failed: %s", e)
+            model_results = [None] * len(model_inputs)
+    
+    results = [
+        model_results[start] if end - start == 1 else pool_window_results(model_results[start:end])
+        for start, end in windows
+    ]
+    
+    combined = []
+    for (auth_start, auth_end), (user_start, user_end) in spans:
+        if model:
+            auth_sentiment = aggregate_sentiment(results[auth_start:auth_end], all_likes[auth_start:auth_end])
+            user_sentiment = aggregate_sentiment(results[user_start:user_end], all_likes[user_start:user_end])
+        else:
+            auth_sentiment = user_sentiment = {"error": "Model not available"}
+        combined.append(combine_weighted_sentiment(
+            auth_sentiment, user_sentiment,
+            authoritative_weight=authoritative_weight,
+            user_weight=user_weight
+        ))
+    
+    return combined
+
+
+def download_job_payload(job: Dict, data_system: DataSystem) -> Dict:
+    """
+    Download the raw JSON for an already-claimed job row.
+    
+    Args:
+        job: job_queue row with at least 'id' and 'file_path'
+        data_system: DataSystem instance for file operations
+    
+    Returns:
+        Dictionary with job_id, found, file_path and data (None if download failed)
+    """
+    job_id = job['id']
     try:
-        # Update status to PROCESSING
-        data_system.update_job_status(job_id, 'PROCESSING')
-        print(f"Processing job {job_id}...")
+        file_path = job.get('file_path')
+        data = None
+        if file_path:
+            log.debug("Downloading %s...", file_path)
+            data = data_system.get_file_from_storage(file_path)
         
-        # Get job details to find file_path
-        client = get_supabase_client()
-        if not client:
-            print("Error: Supabase client not available")
-            return False
+        return {'job_id': job_id, 'found': True, 'file_path': file_path, 'data': data}
+    except Exception as e:
+        # Surface the error in prepare_job so it lands in the DLQ
+        return {'job_id': job_id, 'found': True, 'file_path': None, 'data': None, 'error': e}
+
+
+def fetch_job_payload(job_id: str, data_system: DataSystem, client) -> Dict:
+    """
+    Mark a job PROCESSING, look up its file_path and download the raw JSON.
+    
+    Used for single jobs and when the claim_jobs RPC is not installed.
+    
+    Args:
+        job_id: UUID of the job to fetch
+        data_system: DataSystem instance for file operations
+        client: Supabase client
+    
+    Returns:
+        Dictionary with job_id, found, file_path and data (None if download failed)
+    """
+    try:
+        data_system.update_job_status(job_id, 'PROCESSING')
         
         result = client.table('job_queue').select('file_path, metadata').eq('id', job_id).execute()
-        
         if not result.data or len(result.data) == 0:
-            print(f"Job {job_id} not found")
-            return False
+            return {'job_id': job_id, 'found': False, 'file_path': None, 'data': None}
+    except Exception as e:
+        # Surface the error in prepare_job so it lands in the DLQ
+        return {'job_id': job_id, 'found': True, 'file_path': None, 'data': None, 'error': e}
+    
+    return download_job_payload({'id': job_id, **result.data[0]}, data_system)
+
+
+# Flipped off the first time the claim_jobs RPC is missing (schema.sql not re-applied)
+_CLAIM_RPC_AVAILABLE = True
+
+
+def claim_jobs(client, batch_size: int) -> Optional[List[Dict]]:
+    """
+    Atomically claim up to batch_size PENDING jobs via the claim_jobs RPC.
+    
+    The RPC flips the rows to PROCESSING and returns them in one round-trip,
+    and SKIP LOCKED guarantees no two consumers receive the same job.
+    
+    Returns:
+        Claimed job_queue rows, or None if the RPC is not available
+    """
+    global _CLAIM_RPC_AVAILABLE
+    
+    if not _CLAIM_RPC_AVAILABLE:
+        return None
+    
+    try:
+        result = client.rpc('claim_jobs', {'p_worker_id': WORKER_ID, 'p_limit': batch_size}).execute()
+        return result.data or []
+    except Exception as e:
+        if 'claim_jobs' not in str(e):
+            raise
+        _CLAIM_RPC_AVAILABLE = False
+        log.warning("claim_jobs RPC not available (%s)", str(e)[:100])
+        log.warning("  Falling back to SELECT-then-UPDATE claiming. Re-run schema.sql to enable atomic claims.")
+        return None
+
+
+def claim_next_jobs(client, data_system: DataSystem, batch_size: int) -> List[Dict]:
+    """
+    Claim up to batch_size PENDING jobs and download their payloads concurrently.
+    
+    Args:
+        client: Supabase client
+        data_system: DataSystem instance for file operations
+        batch_size: Maximum number of jobs to claim
+    
+    Returns:
+        List of fetched job payloads (empty if the queue is empty)
+    """
+    jobs = claim_jobs(client, batch_size)
+    
+    if jobs is None:
+        # Legacy path: racy SELECT, then PROCESSING update + lookup per job
+        result = client.table('job_queue').select('id').eq('status', 'PENDING').limit(batch_size).execute()
+        if not result.data:
+            return []
+        job_ids = [row['id'] for row in result.data]
+        fetch = lambda job_id: fetch_job_payload(job_id, data_system, client)
+    else:
+        if not jobs:
+            return []
+        job_ids = jobs
+        fetch = lambda job: download_job_payload(job, data_system)
+    
+    if len(job_ids) == 1:
+        return [fetch(job_ids[0])]
+    
+    # Storage downloads are I/O bound, so fan them out
+    with ThreadPoolExecutor(max_workers=min(DOWNLOAD_WORKERS, len(job_ids))) as executor:
+        return list(executor.map(fetch, job_ids))
+
+
+def handle_job_error(
+    client,
+    data_system: DataSystem,
+    job_id: str,
+    file_path: Optional[str],
+    data: Optional[Dict],
+    e: Exception
+):
+    """
+    Record a failed job: classify the error, add it to the DLQ and mark it FAILED.
+    
+    Args:
+        client: Supabase client (may be None)
+        data_system: DataSystem instance for status updates
+        job_id: UUID of the failed job
+        file_path: Storage path of the raw payload, if known
+        data: Parsed payload, if it was downloaded
+        e: The exception that caused the failure
+    """
+    if isinstance(e, json.JSONDecodeError):
+        error_msg = f"JSON parse error: {str(e)}"
+        log.error("Job %s failed: %s", job_id, error_msg)
+        error_type = "JSON_PARSE"
+    else:
+        error_msg = f"{type(e).__name__}: {str(e)}"
+        log.error("Job %s failed: %s", job_id, error_msg)
+        log.error("%s", traceback.format_exc())
+        
+        # Determine error type
+        error_type = "UNKNOWN"
+        if "model" in str(e).lower() or "inference" in str(e).lower():
+            error_type = "ML_INFERENCE"
+        elif "database" in str(e).lower() or "supabase" in str(e).lower():
+            error_type = "DB_ERROR"
+        elif "network" in str(e).lower() or "connection" in str(e).lower():
+            error_type = "NETWORK"
+    
+    # Add to DLQ
+    if client and file_path:
+        add_to_dlq(client, job_id, file_path, error_msg, error_type, data)
+    
+    try:
+        data_system.update_job_status(job_id, 'FAILED')
+    except:
+        pass
+
+
+def prepare_job(
+    fetched: Dict,
+    data_system: DataSystem,
+    client,
+    alliance_name: Optional[str] = None
+) -> Dict:
+    """
+    Pre-inference stage: validate the payload, deduplicate and detect routing.
+    
+    Args:
+        fetched: Output of fetch_job_payload()
+        data_system: DataSystem instance for file operations
+        client: Supabase client
+        alliance_name: Alliance already classified for this payload (batched
+                       by run_inference_stage); detected here when None
+    
+    Returns:
+        Job context dict. 'result' is None when the job still needs inference,
+        otherwise the final True/False outcome of the job. Jobs that need
+        inference hold an in-flight dedup key ('dedup_key') until
+        release_in_flight_content() is called for them.
+    """
+    job_id = fetched['job_id']
+    ctx = {
+        'job_id': job_id,
+        'file_path': fetched.get('file_path'),
+        'data': fetched.get('data'),
+        'start_time': time.time(),
+        'result': None
+    }
+    
+    try:
+        log.info("Processing job %s...", job_id)
+        
+        if fetched.get('error'):
+            raise fetched['error']
+        
+        if not fetched['found']:
+            log.warning("Job %s not found", job_id)
+            ctx['result'] = False
+            return ctx
         
-        job_data = result.data[0]
-        file_path = job_data.get('file_path')
+        file_path = ctx['file_path']
         
         if not file_path:
-            print(f"No file_path found for job {job_id}")
+            log.warning("No file_path found for job %s", job_id)
             data_system.update_job_status(job_id, 'FAILED')
-            return False
+            ctx['result'] = False
+            return ctx
         
-        # Download file from Storage
-        print(f"Downloading {file_path}...")
-        data = data_system.get_file_from_storage(file_path)
+        data = ctx['data']
         
         if not data:
-            print(f"Failed to download {file_path}")
+            log.error("Failed to download %s", file_path)
             add_to_dlq(client, job_id, file_path, "Failed to download file", "NETWORK")
             data_system.update_job_status(job_id, 'FAILED')
-            return False
+            ctx['result'] = False
+            return ctx
         
         # Get content ID and type for deduplication
         content_id = get_content_id(data)
         content_type = get_content_type(data)
-        alliance_name = detect_alliance(data)
+        if alliance_name is None:
+            alliance_name = detect_alliance(data)
         
         # Debug logging for alliance detection
         if alliance_name == "Unknown":
             meta = data.get('meta', {})
             title = meta.get('title', '')[:100] if meta.get('title') else ''
             headlines = data.get('authoritative_content', [])
-            print(f"  Alliance detection: Unknown")
-            print(f"    Title: {title}")
+            log.info("  Alliance detection: Unknown")
+            log.info("    Title: %s", title)
             if headlines:
-                print(f"    Headlines sample: {str(headlines[:2])[:150]}")
+                log.info("    Headlines sample: %s", str(headlines[:2])[:150])
         else:
-            print(f"  Alliance detected: {alliance_name}")
-        
-        # Check for duplicate (semantic deduplication)
-        if is_duplicate_content(client, content_id, alliance_name):
-            print(f"  [WARN] Duplicate content detected ({content_id}), skipping")
+            log.info("  Alliance detected: %s", alliance_name)
+        
+        # Check for duplicate (semantic deduplication), including jobs still in flight
+        dedup_key = (content_id, alliance_name)
+        with _IN_FLIGHT_LOCK:
+            in_flight = ENABLE_DEDUPLICATION and dedup_key in _IN_FLIGHT_CONTENT
+        if in_flight or is_duplicate_content(client, content_id, alliance_name):
+            log.warning("  Duplicate content detected (%s), skipping", content_id)
             data_system.update_job_status(job_id, 'DONE')
             log_metric(client, 'duplicate_skipped', 1, {'content_type': content_type})
-            return True
+            ctx['result'] = True
+            return ctx
         
         # Extract data components (Weighted Hybrid model)
         authoritative_content = data.get('authoritative_content', [])  # News headlines (weight 3.0)
@@ -1150,178 +1969,509 @@ def process_job(job_id: str, data_system: DataSystem, model) -> bool:
             user_comments = data.get('comments', [])
         
         if not authoritative_content and not user_comments:
-            print("No content found in data (neither authoritative_content nor user_comments)")
+            log.info("No content found in data (neither authoritative_content nor user_comments)")
             data_system.update_job_status(job_id, 'DONE')
-            return True
-        
-        # Get quality signals if available
-        quality_signals = data.get('quality_signals', {})
-        confidence_multiplier = quality_signals.get('confidence_multiplier', 0.5)
+            ctx['result'] = True
+            return ctx
         
         # Detect location using Metadata-First strategy
-        print("Detecting location...")
-        detected_locations = detect_location(data)
-        print(f"  Detected locations: {detected_locations}")
+        log.debug("Detecting location...")
+        lowered = lowercase_content(data)
+        detected_locations = detect_location(data, lowered)
+        log.info("  Detected locations: %s", detected_locations)
         
         # Detect politician mentions for constituency-level routing
-        print("Detecting politicians...")
-        detected_politicians = detect_politicians(data)
+        log.debug("Detecting politicians...")
+        detected_politicians = detect_politicians(data, lowered)
         politician_constituencies = [p['constituency'] for p in detected_politicians if p.get('constituency')]
         if politician_constituencies:
-            print(f"  Politician-based constituencies: {politician_constituencies}")
+            log.info("  Politician-based constituencies: %s", politician_constituencies)
         
-        # Run weighted sentiment analysis (Weighted Hybrid model)
-        print(f"Running weighted sentiment analysis...")
-        print(f"  Authoritative content: {len(authoritative_content)} items (weight: 3.0)")
-        print(f"  User comments: {len(user_comments)} items (weight: 1.0)")
+        ctx.update({
+            'content_id': content_id,
+            'content_type': content_type,
+            'alliance_name': alliance_name,
+            'authoritative_content': authoritative_content,
+            'user_comments': user_comments,
+            'quality_signals': data.get('quality_signals', {}),
+            'detected_locations': detected_locations,
+            'politician_constituencies': politician_constituencies
+        })
         
-        sentiment_results = compute_weighted_sentiment(
-            authoritative_content=authoritative_content,
-            user_comments=user_comments,
-            model=model,
-            authoritative_weight=3.0,
-            user_weight=1.0
-        )
+        # Claimed last, so every path that returns earlier leaves nothing to release
+        if ENABLE_DEDUPLICATION and not claim_in_flight_content(dedup_key):
+            log.warning("  Duplicate content detected (%s), skipping", content_id)
+            data_system.update_job_status(job_id, 'DONE')
+            log_metric(client, 'duplicate_skipped', 1, {'content_type': content_type})
+            ctx['result'] = True
+            return ctx
+        ctx['dedup_key'] = dedup_key
+        return ctx
+    
+    except Exception as e:
+        handle_job_error(client, data_system, job_id, ctx['file_path'], ctx['data'], e)
+        ctx['result'] = False
+        return ctx
+
+
+def score_job(ctx: Dict, sentiment_results: Dict, data_system: DataSystem, client) -> bool:
+    """
+    Post-inference stage: compute the job's score and plan its prediction updates.
+    
+    Nothing is written here; commit_jobs() persists the whole batch at once.
+    The score and planned updates are stored on ctx.
+    
+    Args:
+        ctx: Job context from prepare_job()
+        sentiment_results: compute_weighted_sentiment() output for this job
+        data_system: DataSystem instance for file operations
+        client: Supabase client
+    
+    Returns:
+        True if successful, False otherwise
+    """
+    job_id = ctx['job_id']
+    
+    try:
+        alliance_name = ctx['alliance_name']
+        content_id = ctx['content_id']
+        detected_locations = ctx['detected_locations']
+        politician_constituencies = ctx['politician_constituencies']
+        
+        # Get quality signals if available
+        confidence_multiplier = ctx['quality_signals'].get('confidence_multiplier', 0.5)
+        
+        log.info("Job %s: weighted sentiment analysis", job_id)
+        log.info("  Authoritative content: %s items (weight: 3.0)", len(ctx['authoritative_content']))
+        log.info("  User comments: %s items (weight: 1.0)", len(ctx['user_comments']))
         
         # Print results (Weighted Hybrid model output)
-        print("Weighted Sentiment Analysis Results:")
-        print(f"  Weighted Positive: {sentiment_results.get('weighted_positive', 0):.2f} ({sentiment_results.get('positive_percentage', 0):.1f}%)")
-        print(f"  Weighted Negative: {sentiment_results.get('weighted_negative', 0):.2f} ({sentiment_results.get('negative_percentage', 0):.1f}%)")
-        print(f"  Weighted Neutral: {sentiment_results.get('weighted_neutral', 0):.2f} ({sentiment_results.get('neutral_percentage', 0):.1f}%)")
-        print(f"  Total Weighted Score: {sentiment_results.get('total_weighted', 0):.2f}")
-        print(f"  Locations: {detected_locations}")
+        log.debug("Weighted Sentiment Analysis Results:")
+        log.debug("  Weighted Positive: %.2f (%.1f%%)", sentiment_results.get('weighted_positive', 0), sentiment_results.get('positive_percentage', 0))
+        log.debug("  Weighted Negative: %.2f (%.1f%%)", sentiment_results.get('weighted_negative', 0), sentiment_results.get('negative_percentage', 0))
+        log.debug("  Weighted Neutral: %.2f (%.1f%%)", sentiment_results.get('weighted_neutral', 0), sentiment_results.get('neutral_percentage', 0))
+        log.debug("  Total Weighted Score: %.2f", sentiment_results.get('total_weighted', 0))
+        log.debug("  Locations: %s", detected_locations)
         
         # Breakdown by source
-        print("\n  Breakdown by Source:")
-        print(f"    Authoritative (raw): {sentiment_results.get('authoritative', {})}")
-        print(f"    User Comments (raw): {sentiment_results.get('user_comments', {})}")
+        log.debug("  Breakdown by Source:")
+        log.debug("    Authoritative (raw): %s", sentiment_results.get('authoritative', {}))
+        log.debug("    User Comments (raw): %s", sentiment_results.get('user_comments', {}))
         
-        print(f"\n  Alliance: {alliance_name}")
-        print(f"  Confidence Multiplier: {confidence_multiplier:.2f}")
+        log.debug("  Alliance: %s", alliance_name)
+        log.debug("  Confidence Multiplier: %.2f", confidence_multiplier)
         
         # Calculate sentiment score (-1.0 to +1.0)
         sentiment_score = calculate_sentiment_score(sentiment_results)
-        print(f"  Sentiment Score: {sentiment_score}")
+        log.info("  Sentiment Score: %s", sentiment_score)
         
         # Get average confidence from sentiment results
         avg_confidence = sentiment_results.get('avg_confidence', 0.5)
-        print(f"  Avg Model Confidence: {avg_confidence:.3f}")
+        log.debug("  Avg Model Confidence: %.3f", avg_confidence)
         
-        # Persist predictions to database (with source tracking + Sprint 2 confidence)
-        print("\nPersisting predictions...")
-        updated_count = persist_predictions(
-            client=client,
+        # Plan predictions (with source tracking + Sprint 2 confidence)
+        log.debug("Planning predictions...")
+        ctx['prediction_updates'] = plan_prediction_updates(
             detected_locations=detected_locations,
             alliance_name=alliance_name,
             sentiment_score=sentiment_score,
             source_id=content_id,
             model_version=MODEL_VERSION,
-            avg_confidence=avg_confidence
+            avg_confidence=avg_confidence,
+            politician_constituencies=politician_constituencies
         )
-        print(f"  Updated {updated_count} constituency predictions (district-based)")
-        
-        # Persist politician-specific constituency predictions (higher precision)
-        if politician_constituencies:
-            print(f"  Routing to politician constituencies: {politician_constituencies}")
-            for constituency in politician_constituencies:
-                # Update specific constituency with boosted confidence (politician mention = high precision)
-                boosted_confidence = min(avg_confidence * 1.2, 1.0)  # 20% confidence boost
-                upsert_constituency_prediction(
-                    client=client,
-                    constituency_name=constituency,
-                    district="POLITICIAN_ROUTED",  # Special marker for debugging
-                    alliance=alliance_name,
-                    new_score=sentiment_score,
-                    source_id=content_id,
-                    model_version=MODEL_VERSION,
-                    avg_confidence=boosted_confidence
-                )
-            print(f"  Updated {len(politician_constituencies)} politician-routed constituencies")
+        ctx['sentiment_score'] = sentiment_score
         
+        return True
+    
+    except Exception as e:
+        handle_job_error(client, data_system, job_id, ctx['file_path'], ctx['data'], e)
+        return False
+
+
+def commit_jobs(scored: List[Dict], data_system: DataSystem, client) -> int:
+    """
+    Persist a batch of scored jobs with bulk writes.
+    
+    All prediction updates in the batch go out as one read plus one upsert,
+    DONE statuses as one update and metrics as one insert. If the bulk
+    prediction write fails, every job in the batch is sent to the DLQ.
+    
+    Args:
+        scored: Job contexts that passed score_job()
+        data_system: DataSystem instance for status updates
+        client: Supabase client
+    
+    Returns:
+        Number of jobs marked DONE
+    """
+    if not scored:
+        flush_metrics(client)
+        return 0
+    
+    try:
+        updates = [u for ctx in scored for u in ctx['prediction_updates']]
+        updated_count = write_prediction_updates(client, updates)
+        log.info("Persisted %s constituency predictions for %s jobs", updated_count, len(scored))
+    except Exception as e:
+        for ctx in scored:
+            handle_job_error(client, data_system, ctx['job_id'], ctx['file_path'], ctx['data'], e)
+        flush_metrics(client)
+        return 0
+    
+    for ctx in scored:
         # Mark content as processed (for deduplication)
         mark_content_processed(
             client=client,
-            content_id=content_id,
-            content_type=content_type,
-            alliance=alliance_name,
-            file_path=file_path,
-            sentiment_score=sentiment_score
+            content_id=ctx['content_id'],
+            content_type=ctx['content_type'],
+            alliance=ctx['alliance_name'],
+            file_path=ctx['file_path'],
+            sentiment_score=ctx['sentiment_score']
         )
         
-        # Update job status to DONE
-        data_system.update_job_status(job_id, 'DONE')
-        
         # Log metrics
-        processing_time = (time.time() - start_time) * 1000  # ms
+        processing_time = (time.time() - ctx['start_time']) * 1000  # ms
         log_metric(client, 'processing_latency_ms', processing_time, {
-            'content_type': content_type,
-            'alliance': alliance_name
+            'content_type': ctx['content_type'],
+            'alliance': ctx['alliance_name']
         })
-        log_metric(client, 'sentiment_score', sentiment_score, {
-            'content_type': content_type,
-            'alliance': alliance_name,
-            'content_id': content_id
+        log_metric(client, 'sentiment_score', ctx['sentiment_score'], {
+            'content_type': ctx['content_type'],
+            'alliance': ctx['alliance_name'],
+            'content_id': ctx['content_id']
         })
         
-        print(f"Job {job_id} completed successfully ({processing_time:.0f}ms)")
-        
-        return True
+        log.info("Job %s completed successfully (%.0fms)", ctx['job_id'], processing_time)
     
-    except json.JSONDecodeError as e:
-        error_msg = f"JSON parse error: {str(e)}"
-        print(f"Error processing job {job_id}: {error_msg}")
-        if client and file_path:
-            add_to_dlq(client, job_id, file_path, error_msg, "JSON_PARSE", data)
+    data_system.update_job_statuses([ctx['job_id'] for ctx in scored], 'DONE')
+    flush_metrics(client)
+    
+    return len(scored)
+
+
+def persist_jobs(ready: List[Dict], batch_results: List[Dict], data_system: DataSystem, client) -> int:
+    """Score each inferred job and commit the batch; returns the number of jobs marked DONE."""
+    try:
+        scored = [
+            ctx for ctx, sentiment_results in zip(ready, batch_results)
+            if score_job(ctx, sentiment_results, data_system, client)
+        ]
+        return commit_jobs(scored, data_system, client)
+    finally:
+        # processed_content now has the committed keys; failed ones may be retried
+        release_in_flight_content(ready)
+
+
+def run_inference_stage(fetched_jobs: List[Dict], data_system: DataSystem, model, client) -> tuple:
+    """
+    Prepare a batch of fetched jobs and score all their texts in one model pass.
+    
+    Each job is prepared (dedup, routing) individually, then the texts of all
+    surviving jobs are scored together by compute_weighted_sentiment_batch().
+    
+    Args:
+        fetched_jobs: Outputs of fetch_job_payload()
+        data_system: DataSystem instance for file operations
+        model: Sentiment analysis model
+        client: Supabase client
+    
+    Returns:
+        Tuple of (job contexts ready to persist, their sentiment results,
+        number of jobs already completed during preparation)
+    """
+    succeeded = 0
+    ready = []
+    
+    # Classify alliances for every downloaded payload in one zero-shot call
+    alliances = {}
+    payloads = [f for f in fetched_jobs if f.get('found') and f.get('data') and not f.get('error')]
+    if payloads:
         try:
-            data_system.update_job_status(job_id, 'FAILED')
-        except:
-            pass
-        return False
+            alliances = dict(zip(
+                (f['job_id'] for f in payloads),
+                detect_alliances([f['data'] for f in payloads])
+            ))
+        except Exception as e:
+            log.warning("Batched alliance detection failed, classifying per job: %s", e)
+    
+    for fetched in fetched_jobs:
+        ctx = prepare_job(fetched, data_system, client, alliances.get(fetched['job_id']))
+        if ctx['result'] is None:
+            ready.append(ctx)
+        elif ctx['result']:
+            succeeded += 1
+    
+    if not ready:
+        return [], [], succeeded
     
+    # Run weighted sentiment analysis (Weighted Hybrid model) for the whole batch
+    total_texts = sum(len(c['authoritative_content']) + len(c['user_comments']) for c in ready)
+    log.info("Running weighted sentiment analysis for %s jobs (%s items)...", len(ready), total_texts)
+    
+    try:
+        batch_results = compute_weighted_sentiment_batch(
+            [(c['authoritative_content'], c['user_comments']) for c in ready],
+            model=model,
+            authoritative_weight=3.0,
+            user_weight=1.0
+        )
     except Exception as e:
-        error_msg = f"{type(e).__name__}: {str(e)}"
-        print(f"Error processing job {job_id}: {error_msg}")
-        print(traceback.format_exc())
+        for ctx in ready:
+            handle_job_error(client, data_system, ctx['job_id'], ctx['file_path'], ctx['data'], e)
+        release_in_flight_content(ready)
+        return [], [], succeeded
+    
+    if ENABLE_PREDICTION_CACHE:
+        lookups = _PREDICTION_CACHE_STATS['hits'] + _PREDICTION_CACHE_STATS['misses']
+        if lookups:
+            log_metric(client, 'prediction_cache_hit_rate', _PREDICTION_CACHE_STATS['hits'] / lookups, {
+                'hits': _PREDICTION_CACHE_STATS['hits'],
+                'misses': _PREDICTION_CACHE_STATS['misses'],
+                'size': len(_PREDICTION_CACHE)
+            })
+    
+    return ready, batch_results, succeeded
+
+
+def process_jobs(fetched_jobs: List[Dict], data_system: DataSystem, model) -> int:
+    """
+    Process a batch of fetched jobs with one shared model pass.
+    
+    Args:
+        fetched_jobs: Outputs of fetch_job_payload()
+        data_system: DataSystem instance for file operations
+        model: Sentiment analysis model
+    
+    Returns:
+        Number of jobs that completed successfully
+    """
+    client = get_supabase_client()
+    if not client:
+        log.error("Supabase client not available")
+        return 0
+    
+    ready, batch_results, succeeded = run_inference_stage(fetched_jobs, data_system, model, client)
+    
+    return succeeded + persist_jobs(ready, batch_results, data_system, client)
+
+
+def process_job(
+    job_id: str,
+    data_system: DataSystem,
+    model,
+    fetched: Optional[Dict] = None
+) -> bool:
+    """
+    Process a single job from the queue with production hardening.
+    
+    Features:
+    - Semantic deduplication (skip if already processed)
+    - Dead Letter Queue (store failed jobs for inspection)
+    - Metrics logging (track processing performance)
+    - Outlier cap (prevent single source dominance)
+    - Model versioning (track which model processed)
+    
+    Args:
+        job_id: UUID of the job to process
+        data_system: DataSystem instance for file operations
+        model: Sentiment analysis model
+        fetched: Payload already downloaded by fetch_job_payload();
+                 fetched synchronously when omitted
+    
+    Returns:
+        True if successful, False otherwise
+    """
+    if fetched is None:
+        client = get_supabase_client()
+        if not client:
+            log.error("Supabase client not available")
+            return False
+        fetched = fetch_job_payload(job_id, data_system, client)
+    
+    return process_jobs([fetched], data_system, model) == 1
+
+
+def fetch_stage(
+    client,
+    data_system: DataSystem,
+    fetch_queue: queue.Queue,
+    stop_event: threading.Event,
+    poll_interval: int
+):
+    """
+    Pipeline stage 1 (thread): claim PENDING jobs and download their payloads.
+    
+    Only this stage sleeps when the queue is empty, so inference and writes
+    for jobs already in flight are never stalled by the poll interval.
+    
+    Empty polls back off exponentially from IDLE_BACKOFF_MIN to
+    IDLE_BACKOFF_MAX with jitter, and reset on the next successful claim, so
+    a burst is picked up quickly while idle workers poll rarely. Errors wait
+    poll_interval seconds.
+    
+    With a LISTEN/NOTIFY listener (DATABASE_URL + psycopg2) the idle wait also
+    ends as soon as the producer queues a job. If its connection drops, the
+    listener is closed and the stage keeps plain polling for the rest of the run.
+    """
+    listener = get_job_listener()
+    try:
+        _fetch_loop(client, data_system, fetch_queue, stop_event, poll_interval, listener)
+    finally:
+        if listener:
+            listener.close()
+
+
+def wait_for_jobs(listener, stop_event: threading.Event, timeout: float) -> bool:
+    """
+    Sleep up to `timeout` seconds, waking early on a job_pending notification.
+    
+    Args:
+        listener: JobListener, or None to just sleep
+        stop_event: Ends the wait early on shutdown
+        timeout: Maximum seconds to wait
+    
+    Returns:
+        True if a notification arrived
+    
+    Raises:
+        Exception: Whatever the listener raised (e.g. its connection dropped);
+            the caller should discard it
+    """
+    if listener is None:
+        stop_event.wait(timeout)
+        return False
+    
+    # Wait in short slices so shutdown is not delayed by a long idle wait
+    deadline = time.monotonic() + timeout
+    while not stop_event.is_set():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        if listener.wait(min(remaining, 1.0)):
+            return True
+    return False
+
+
+def _fetch_loop(
+    client,
+    data_system: DataSystem,
+    fetch_queue: queue.Queue,
+    stop_event: threading.Event,
+    poll_interval: int,
+    listener
+):
+    """Claim/download loop behind fetch_stage()."""
+    idle_backoff = IDLE_BACKOFF_MIN
+    while not stop_event.is_set():
+        try:
+            fetched_jobs = claim_next_jobs(client, data_system, PROCESSOR_BATCH_SIZE)
+        except Exception as e:
+            log.error("Fetch stage failed: %s", str(e))
+            stop_event.wait(poll_interval)
+            continue
+        
+        if not fetched_jobs:
+            if idle_backoff == IDLE_BACKOFF_MIN:
+                log.info("No pending jobs found. Backing off...")
+            jitter = random.uniform(1 - IDLE_BACKOFF_JITTER, 1 + IDLE_BACKOFF_JITTER)
+            try:
+                notified = wait_for_jobs(listener, stop_event, idle_backoff * jitter)
+            except Exception as e:
+                # A dead connection never recovers; drop it once and keep polling
+                log.warning("Job listener failed, falling back to polling: %s", str(e)[:100])
+                listener.close()
+                listener = None
+                notified = False
+            if notified:
+                idle_backoff = IDLE_BACKOFF_MIN
+            else:
+                idle_backoff = min(idle_backoff * 2, IDLE_BACKOFF_MAX)
+            continue
         
-        # Determine error type
-        error_type = "UNKNOWN"
-        if "model" in str(e).lower() or "inference" in str(e).lower():
-            error_type = "ML_INFERENCE"
-        elif "database" in str(e).lower() or "supabase" in str(e).lower():
-            error_type = "DB_ERROR"
-        elif "network" in str(e).lower() or "connection" in str(e).lower():
-            error_type = "NETWORK"
+        idle_backoff = IDLE_BACKOFF_MIN
         
-        # Add to DLQ
-        if client and file_path:
-            add_to_dlq(client, job_id, file_path, error_msg, error_type, data)
+        # Bounded queue applies backpressure when inference falls behind
+        while True:
+            if stop_event.is_set():
+                release_jobs(fetched_jobs, data_system)
+                return
+            try:
+                fetch_queue.put(fetched_jobs, timeout=0.5)
+                break
+            except queue.Full:
+                continue
+
+
+def write_stage(write_queue: queue.Queue, data_system: DataSystem, client):
+    """
+    Pipeline stage 3 (thread): persist scored jobs until a None sentinel arrives.
+    """
+    while True:
+        item = write_queue.get()
+        if item is None:
+            break
         
+        ready, batch_results = item
+        done = persist_jobs(ready, batch_results, data_system, client)
+        log.info("Batch persisted: %s/%s jobs succeeded", done, len(ready))
+
+
+def collect_batch(fetch_queue: queue.Queue, max_jobs: int, max_wait: float, poll_timeout: float) -> List[Dict]:
+    """
+    Dynamic batching: gather up to max_jobs jobs, or whatever arrived within max_wait.
+    
+    Args:
+        fetch_queue: Queue of fetched job lists from fetch_stage()
+        max_jobs: Target number of jobs per inference batch
+        max_wait: Seconds to keep topping up the batch after the first job arrives
+        poll_timeout: Seconds to wait for the first job
+    
+    Returns:
+        List of fetched jobs (empty if nothing arrived within poll_timeout)
+    """
+    try:
+        batch = list(fetch_queue.get(timeout=poll_timeout))
+    except queue.Empty:
+        return []
+    
+    deadline = time.time() + max_wait
+    while len(batch) < max_jobs:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            break
         try:
-            data_system.update_job_status(job_id, 'FAILED')
-        except:
-            pass
-        
-        return False
+            batch.extend(fetch_queue.get(timeout=remaining))
+        except queue.Empty:
+            break
+    
+    return batch
 
 
 def poll_and_process(poll_interval: int = 5, timeout_minutes: int = 3):
     """
     Main consumer loop that polls the job queue and processes jobs.
     
+    Runs as a three-stage pipeline connected by bounded queues:
+    fetcher thread (claim + download) -> inference (this thread) -> writer
+    thread (persist). Network round-trips on either side overlap model
+    inference, and inference batches up to PROCESSOR_BATCH_SIZE jobs or
+    whatever arrives within BATCH_WAIT_MS.
+    
     Args:
-        poll_interval: Seconds to wait between polls when no jobs are found
+        poll_interval: Seconds to wait after a polling error (empty polls use
+                       exponential backoff capped at IDLE_BACKOFF_MAX)
         timeout_minutes: Exit if no jobs found for this many minutes (default: 3)
     """
-    print("=" * 60)
-    print("Starting Sentiment Analysis Processor (Consumer)")
-    print("=" * 60)
-    print()
+    log.info("=" * 60)
+    log.info("Starting Sentiment Analysis Processor (Consumer)")
+    log.info("=" * 60)
     
     # Initialize components
     try:
         data_system = DataSystem(bucket_name='raw_data')
     except RuntimeError as e:
-        print(f"Error initializing DataSystem: {e}")
+        log.error("Could not initialize DataSystem: %s", e)
         return
     
     # Load configuration
@@ -1331,60 +2481,104 @@ def poll_and_process(poll_interval: int = 5, timeout_minutes: int = 3):
     
     model = load_sentiment_model()
     if not model:
-        print("Error: Could not load sentiment model")
+        log.error("Could not load sentiment model")
         return
     
-    print("Model loaded successfully")
-    print(f"Polling job queue for PENDING jobs...")
-    print(f"Timeout: Will exit if no jobs found for {timeout_minutes} minutes")
-    print()
+    log.info("Model loaded successfully")
+    log.info("Polling job queue for PENDING jobs (batch size: %s)...", PROCESSOR_BATCH_SIZE)
+    log.info("Timeout: Will exit if no jobs found for %s minutes", timeout_minutes)
     
     client = get_supabase_client()
     if not client:
-        print("Error: Supabase client not available")
+        log.error("Supabase client not available")
         return
     
     # Track last job time for timeout
     last_job_time = time.time()
     timeout_seconds = timeout_minutes * 60
     
-    # Main polling loop
-    while True:
-        try:
-            # Check if timeout exceeded
-            time_since_last_job = time.time() - last_job_time
-            if time_since_last_job >= timeout_seconds:
-                print(f"\n{'=' * 60}")
-                print(f"Timeout: No jobs found for {timeout_minutes} minutes")
-                print(f"Exiting processor gracefully...")
-                print(f"{'=' * 60}")
-                break
-            
-            # Query for PENDING jobs
-            result = client.table('job_queue').select('id').eq('status', 'PENDING').limit(1).execute()
-            
-            if result.data and len(result.data) > 0:
-                job_id = result.data[0]['id']
-                process_job(job_id, data_system, model)
+    fetch_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    write_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    stop_event = threading.Event()
+    
+    fetcher = threading.Thread(
+        target=fetch_stage,
+        args=(client, data_system, fetch_queue, stop_event, poll_interval),
+        name='fetcher',
+        daemon=True
+    )
+    writer = threading.Thread(
+        target=write_stage,
+        args=(write_queue, data_system, client),
+        name='writer',
+        daemon=True
+    )
+    fetcher.start()
+    writer.start()
+    
+    # Main (inference) loop
+    try:
+        while True:
+            try:
+                # Check if timeout exceeded
+                time_since_last_job = time.time() - last_job_time
+                if time_since_last_job >= timeout_seconds:
+                    log.info("=" * 60)
+                    log.info("Timeout: No jobs found for %s minutes", timeout_minutes)
+                    log.info("Exiting processor gracefully...")
+                    log.info("=" * 60)
+                    break
+                
+                fetched_jobs = collect_batch(
+                    fetch_queue,
+                    max_jobs=PROCESSOR_BATCH_SIZE,
+                    max_wait=BATCH_WAIT_MS / 1000.0,
+                    poll_timeout=min(1.0, timeout_seconds)
+                )
+                if not fetched_jobs:
+                    continue
+                
+                ready, batch_results, _ = run_inference_stage(fetched_jobs, data_system, model, client)
+                if ready:
+                    write_queue.put((ready, batch_results))
                 last_job_time = time.time()  # Reset timeout timer
-                print()
-            else:
-                time_remaining = timeout_seconds - time_since_last_job
-                minutes_remaining = int(time_remaining / 60)
-                print(f"No pending jobs found. Waiting {poll_interval} seconds... (Timeout in {minutes_remaining}m)")
+            
+            except KeyboardInterrupt:
+                log.info("Shutting down consumer...")
+                break
+            except Exception as e:
+                log.error("Polling loop failed: %s", str(e))
                 time.sleep(poll_interval)
-        
-        except KeyboardInterrupt:
-            print("\nShutting down consumer...")
-            break
-        except Exception as e:
-            print(f"Error in polling loop: {str(e)}")
-            time.sleep(poll_interval)
+    finally:
+        stop_event.set()
+        fetcher.join()
+        while True:
+            try:
+                release_jobs(fetch_queue.get_nowait(), data_system)
+            except queue.Empty:
+                break
+        # Let the writer drain everything already scored
+        write_queue.put(None)
+        writer.join()
+        flush_metrics(client)
+
+
+def release_jobs(fetched_jobs: List[Dict], data_system: DataSystem):
+    """Return claimed but unprocessed jobs to PENDING on shutdown."""
+    for fetched in fetched_jobs or []:
+        log.info("Releasing claimed job %s back to PENDING", fetched['job_id'])
+        data_system.update_job_status(fetched['job_id'], 'PENDING')
 
 
 if __name__ == "__main__":
+    # WARNING in production keeps the per-job hot path free of log formatting;
+    # set LOG_LEVEL=INFO (or DEBUG for per-job score breakdowns) to follow progress
+    logging.basicConfig(
+        level=os.getenv('LOG_LEVEL', 'WARNING').upper(),
+        format='%(asctime)s %(message)s'
+    )
+    
     # Allow timeout to be configured via environment variable
     timeout_minutes = int(os.getenv('PROCESSOR_TIMEOUT_MINUTES', '3'))
     poll_interval = int(os.getenv('PROCESSOR_POLL_INTERVAL', '5'))
     poll_and_process(poll_interval=poll_interval, timeout_minutes=timeout_minutes)
-
@@ -16,7 +16,9 @@ The Consumer (processor.py) will independently poll the queue and process jobs.
 
 import json
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import List, Dict, Optional
 from datetime import datetime
 import yt_dlp
@@ -25,6 +27,7 @@ from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFoun
 from dotenv import load_dotenv
 
 from infra.data_manager import DataSystem
+from infra.resilience import TokenBucket
 from discover import discover_videos
 from utils.classifier import classify_alliance, should_process_content
 
@@ -71,6 +74,19 @@ load_dotenv()
 # Get max comments per video from environment variable
 MAX_COMMENTS_PER_VIDEO = int(os.getenv('MAX_COMMENTS_PER_VIDEO', '50'))
 
+# Comments longer than this are cut at scrape time; the sentiment model only
+# sees ~512 tokens anyway, so the tail is wasted storage and tokenizer work
+MAX_COMMENT_CHARS = 1024
+
+# Videos are scraped concurrently; each worker fetches the transcript and the
+# comments of its video in parallel. Request starts are paced by a shared token
+# bucket (one video every SCRAPER_RATE_LIMIT_SECONDS) instead of a blocking sleep.
+SCRAPER_WORKERS = int(os.getenv('SCRAPER_WORKERS', '8'))
+SCRAPER_RATE_LIMIT_SECONDS = float(os.getenv('SCRAPER_RATE_LIMIT_SECONDS', '2'))
+
+# Re-count PENDING jobs in the queue after scraping (off by default; costs a query)
+VERIFY_JOBS = os.getenv('VERIFY_JOBS', 'false').lower() == 'true'
+
 
 def get_transcript_text(video_id: str) -> Optional[str]:
     """
@@ -97,20 +113,19 @@ def get_transcript_text(video_id: str) -> Optional[str]:
             ('en', False)   # English auto-generated
         ]
         
+        # Enumerate available transcripts once instead of one find_* lookup per priority
+        available = {(t.language_code, t.is_generated): t for t in transcript_list}
+        
         for lang_code, prefer_manual in language_priority:
+            transcript = available.get((lang_code, not prefer_manual))
+            if transcript is None:
+                continue
+            
             try:
-                if prefer_manual:
-                    # Try manual transcript first
-                    transcript = transcript_list.find_manually_created_transcript([lang_code])
-                else:
-                    # Try auto-generated transcript
-                    transcript = transcript_list.find_generated_transcript([lang_code])
-                
                 # Fetch and concatenate transcript
                 transcript_data = transcript.fetch()
-                transcript_text = ' '.join([entry['text'] for entry in transcript_data])
-                return transcript_text
-                
+                return ' '.join(entry['text'] for entry in transcript_data)
+            
             except (NoTranscriptFound, TranscriptsDisabled):
                 # Try next language/type
                 continue
@@ -126,11 +141,70 @@ def get_transcript_text(video_id: str) -> Optional[str]:
         return None
 
 
-def scrape_comments_from_video(video_url: str, max_comments: int = 50) -> tuple:
+def build_comment_ydl_opts() -> dict:
+    """
+    Build yt-dlp options for comment extraction (cookies resolved once).
+    
+    Returns:
+        yt-dlp options dictionary
+    """
+    ydl_opts = {
+        'quiet': True,
+        'no_warnings': True,
+        'skip_download': True,
+        'writesubtitles': False,
+        'writeautomaticsub': False,
+        'getcomments': True,
+    }
+    
+    # Add cookies if available
+    return get_ytdlp_opts_with_cookies(ydl_opts)
+
+
+# One YoutubeDL handle per fetch thread, reused across videos: YoutubeDL is not
+# thread-safe, but building one per video re-creates extractors, re-parses
+# options and reloads the cookie jar every time
+_ydl_local = threading.local()
+_ydl_handles = []
+_ydl_handles_lock = threading.Lock()
+
+
+def get_thread_ydl(ydl_opts: dict):
+    """
+    Get the calling thread's persistent YoutubeDL handle, creating it on first use.
+    
+    Args:
+        ydl_opts: Options used when the handle is first created
+    
+    Returns:
+        yt_dlp.YoutubeDL instance owned by the current thread
+    """
+    ydl = getattr(_ydl_local, 'ydl', None)
+    if ydl is None:
+        ydl = yt_dlp.YoutubeDL(ydl_opts)
+        _ydl_local.ydl = ydl
+        with _ydl_handles_lock:
+            _ydl_handles.append(ydl)
+    return ydl
+
+
+def close_ydl_handles():
+    """Close every YoutubeDL handle opened by get_thread_ydl()."""
+    with _ydl_handles_lock:
+        for ydl in _ydl_handles:
+            try:
+                ydl.close()
+            except Exception:
+                pass
+        _ydl_handles.clear()
+
+
+def scrape_comments_from_video(ydl, video_url: str, max_comments: int = 50) -> tuple:
     """
     Extract comments and description from a YouTube video using yt-dlp.
     
     Args:
+        ydl: Open yt_dlp.YoutubeDL handle (reused across videos)
         video_url: YouTube video URL
         max_comments: Maximum number of comments to extract
     
@@ -141,35 +215,22 @@ def scrape_comments_from_video(video_url: str, max_comments: int = 50) -> tuple:
     description = ""
     
     try:
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'skip_download': True,
-            'writesubtitles': False,
-            'writeautomaticsub': False,
-            'getcomments': True,
-        }
+        info = ydl.extract_info(video_url, download=False)
         
-        # Add cookies if available
-        ydl_opts = get_ytdlp_opts_with_cookies(ydl_opts)
+        # Extract description
+        description = info.get('description', '') or ''
         
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(video_url, download=False)
-            
-            # Extract description
-            description = info.get('description', '') or ''
-            
-            # Extract comments from info dict
-            comment_data = info.get('comments', [])
-            
-            for comment in comment_data[:max_comments]:
-                comments.append({
-                    'text': comment.get('text', ''),
-                    'author': comment.get('author', 'Unknown'),
-                    'likes': comment.get('like_count', 0),
-                    'timestamp': comment.get('timestamp', ''),
-                    'time_text': comment.get('time_text', '')
-                })
+        # Extract comments from info dict
+        comment_data = info.get('comments', [])
+        
+        for comment in comment_data[:max_comments]:
+            comments.append({
+                'text': (comment.get('text', '') or '')[:MAX_COMMENT_CHARS],
+                'author': comment.get('author', 'Unknown'),
+                'likes': comment.get('like_count', 0),
+                'timestamp': comment.get('timestamp', ''),
+                'time_text': comment.get('time_text', '')
+            })
     
     except Exception as e:
         print(f"Error extracting comments: {str(e)[:150]}")
@@ -177,6 +238,142 @@ def scrape_comments_from_video(video_url: str, max_comments: int = 50) -> tuple:
     return comments, description
 
 
+def _scrape_comments_on_thread(ydl_opts: dict, video_url: str, max_comments: int) -> tuple:
+    """Run scrape_comments_from_video with the current thread's YoutubeDL handle."""
+    return scrape_comments_from_video(get_thread_ydl(ydl_opts), video_url, max_comments)
+
+
+def _process_one(i: int, video: Dict, total: int, data_system: DataSystem,
+                 rate_limiter: TokenBucket, fetch_executor: ThreadPoolExecutor,
+                 ydl_opts: dict) -> str:
+    """
+    Scrape one video and push it to the job queue (runs in a worker thread).
+    
+    Transcript and comments are fetched concurrently. Log lines are buffered
+    and printed as one block so output from parallel workers does not interleave.
+    
+    Args:
+        i: 1-based position of the video in the list (for progress output)
+        video: Video dictionary from discovery
+        total: Total number of videos
+        data_system: DataSystem used to upload raw JSON and create the job
+        rate_limiter: Shared token bucket pacing YouTube requests
+        fetch_executor: Executor for the transcript and comment fetches
+        ydl_opts: yt-dlp options for the per-thread YoutubeDL handles
+    
+    Returns:
+        'created' if a job was created, 'skipped' if the video was skipped
+        or failed to save, 'error' on unexpected failure
+    """
+    video_url = video.get('url', '')
+    video_id = video.get('id', '')
+    video_title = video.get('title', 'Unknown')
+    
+    if not video_url:
+        print(f"[{i}/{total}] Skipping: No URL found")
+        return 'error'
+    
+    lines = [
+        f"[{i}/{total}] Processing: {video_title[:50]}...",
+        f"  Video ID: {video_id}",
+    ]
+    
+    try:
+        rate_limiter.acquire()
+        
+        # Fetch transcript and comments concurrently
+        # (many videos don't have transcripts - this is expected)
+        transcript_future = fetch_executor.submit(get_transcript_text, video_id)
+        comments_future = fetch_executor.submit(
+            _scrape_comments_on_thread, ydl_opts, video_url, MAX_COMMENTS_PER_VIDEO
+        )
+        wait([transcript_future, comments_future])
+        
+        transcript_text = transcript_future.result()
+        if transcript_text:
+            lines.append(f"  Transcript found ({len(transcript_text)} characters)")
+        else:
+            lines.append(f"  No transcript available (skipping)")
+        
+        comments, description = comments_future.result()
+        
+        if not comments:
+            lines.append(f"    No comments extracted - skipping job creation")
+            return 'skipped'
+        
+        # One clock read per video: ISO scraped_at in the payload (same format as
+        # news_scraper), epoch milliseconds in the storage key so two saves of a
+        # video within a second don't collide
+        now_ms = time.time_ns() // 1_000_000
+        
+        # Structure the data with Weighted Hybrid model
+        # YouTube comments are user_comments (weight 1.0) vs authoritative_content (weight 3.0)
+        structured_data = {
+            "meta": {
+                "id": video_id,
+                "title": video_title,
+                "description": description,
+                "url": video_url,
+                "alliance": video.get('alliance', 'Unknown'),  # Initial alliance from discovery
+                "search_query": video.get('search_query', ''),
+                "channel": video.get('channel', 'Unknown'),
+                "scraped_at": datetime.fromtimestamp(now_ms / 1000).isoformat()
+            },
+            "transcript": transcript_text or "",
+            "authoritative_content": [],  # Empty for YouTube sources (noisy signal)
+            "user_comments": comments  # Low weight (1.0) - user sentiment
+        }
+        
+        # Classify alliance with full content (more accurate than discovery phase)
+        detected_alliance = classify_alliance(structured_data, producer_alliance=video.get('alliance'))
+        
+        # Skip if no alliance detected (saves storage and processing)
+        if detected_alliance == "Unknown":
+            lines.append(f"    Skipping: No political alliance detected in content")
+            return 'skipped'
+        
+        # Update alliance in structured data with detected alliance
+        structured_data["meta"]["alliance"] = detected_alliance
+        lines.append(f"    Alliance detected: {detected_alliance}")
+        
+        # Prepare metadata for job queue
+        video_metadata = {
+            "video_id": video_id,
+            "video_title": video_title,
+            "video_url": video_url,
+            "alliance": video.get('alliance', 'Unknown'),
+            "search_query": video.get('search_query', ''),
+            "channel": video.get('channel', 'Unknown'),
+            "comment_count": len(comments),
+            "has_transcript": bool(transcript_text),
+            "transcript_length": len(transcript_text) if transcript_text else 0
+        }
+        
+        # Save to Supabase via DataSystem (Producer pattern)
+        filename = f"comments/{video_id}_{now_ms}.json"
+        
+        job_id = data_system.save_raw_json(
+            data=structured_data,
+            filename=filename,
+            video_metadata=video_metadata
+        )
+        
+        if job_id:
+            lines.append(f"  Extracted {len(comments)} user comments" + (f" and transcript ({len(transcript_text)} chars)" if transcript_text else " (no transcript)"))
+            lines.append(f"  Job {job_id} created in queue")
+            return 'created'
+        
+        lines.append(f"  Extracted {len(comments)} user comments" + (f" and transcript" if transcript_text else "") + " (FAILED to save - check logs above)")
+        return 'skipped'
+    
+    except Exception as e:
+        lines.append(f"  Error processing video: {str(e)[:100]}")
+        return 'error'
+    
+    finally:
+        print("\n".join(lines))
+
+
 def scrape_comments(video_list: Optional[List[Dict]] = None):
     """
     Main scraping function - Producer component.
@@ -217,104 +414,30 @@ def scrape_comments(video_list: Optional[List[Dict]] = None):
     
     jobs_created = 0
     videos_skipped = 0
+    total = len(video_list)
     
-    for i, video in enumerate(video_list, 1):
-        video_url = video.get('url', '')
-        video_id = video.get('id', '')
-        video_title = video.get('title', 'Unknown')
-        
-        if not video_url:
-            print(f"[{i}/{len(video_list)}] Skipping: No URL found")
-            continue
-        
-        print(f"[{i}/{len(video_list)}] Processing: {video_title[:50]}...")
-        print(f"  Video ID: {video_id}")
-        
-        try:
-            # Fetch transcript (many videos don't have transcripts - this is expected)
-            transcript_text = get_transcript_text(video_id)
-            if transcript_text:
-                print(f"  Transcript found ({len(transcript_text)} characters)")
-            else:
-                print(f"  No transcript available (skipping)")
-            
-            # Scrape comments and description
-            comments, description = scrape_comments_from_video(video_url, MAX_COMMENTS_PER_VIDEO)
-            
-            if not comments:
-                print(f"    No comments extracted - skipping job creation")
-                videos_skipped += 1
-                continue
-            
-            # Structure the data with Weighted Hybrid model
-            # YouTube comments are user_comments (weight 1.0) vs authoritative_content (weight 3.0)
-            structured_data = {
-                "meta": {
-                    "id": video_id,
-                    "title": video_title,
-                    "description": description,
-                    "url": video_url,
-                    "alliance": video.get('alliance', 'Unknown'),  # Initial alliance from discovery
-                    "search_query": video.get('search_query', ''),
-                    "channel": video.get('channel', 'Unknown'),
-                    "scraped_at": datetime.now().isoformat()
-                },
-                "transcript": transcript_text or "",
-                "authoritative_content": [],  # Empty for YouTube sources (noisy signal)
-                "user_comments": comments  # Low weight (1.0) - user sentiment
-            }
-            
-            # Classify alliance with full content (more accurate than discovery phase)
-            detected_alliance = classify_alliance(structured_data, producer_alliance=video.get('alliance'))
-            
-            # Skip if no alliance detected (saves storage and processing)
-            if detected_alliance == "Unknown":
-                print(f"    Skipping: No political alliance detected in content")
-                videos_skipped += 1
-                continue
-            
-            # Update alliance in structured data with detected alliance
-            structured_data["meta"]["alliance"] = detected_alliance
-            print(f"    Alliance detected: {detected_alliance}")
-            
-            # Prepare metadata for job queue
-            video_metadata = {
-                "video_id": video_id,
-                "video_title": video_title,
-                "video_url": video_url,
-                "alliance": video.get('alliance', 'Unknown'),
-                "search_query": video.get('search_query', ''),
-                "channel": video.get('channel', 'Unknown'),
-                "comment_count": len(comments),
-                "has_transcript": bool(transcript_text),
-                "transcript_length": len(transcript_text) if transcript_text else 0
-            }
-            
-            # Save to Supabase via DataSystem (Producer pattern)
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"comments/{video_id}_{timestamp}.json"
-            
-            job_id = data_system.save_raw_json(
-                data=structured_data,
-                filename=filename,
-                video_metadata=video_metadata
-            )
-            
-            if job_id:
-                jobs_created += 1
-                print(f"  Extracted {len(comments)} user comments" + (f" and transcript ({len(transcript_text)} chars)" if transcript_text else " (no transcript)"))
-                print(f"  Job {job_id} created in queue")
-            else:
-                videos_skipped += 1
-                print(f"  Extracted {len(comments)} user comments" + (f" and transcript" if transcript_text else "") + " (FAILED to save - check logs above)")
-        
-        except Exception as e:
-            print(f"  Error processing video: {str(e)[:100]}")
-            continue
-        
-        # Rate limiting
-        if i < len(video_list):
-            time.sleep(2)
+    rate_limiter = TokenBucket(rate=1.0 / SCRAPER_RATE_LIMIT_SECONDS, capacity=1)
+    ydl_opts = build_comment_ydl_opts()
+    
+    # Separate pool for the per-video transcript/comments fetches so video
+    # workers waiting on them can never starve the pool they are waiting on
+    try:
+        with ThreadPoolExecutor(max_workers=SCRAPER_WORKERS * 2) as fetch_executor, \
+                ThreadPoolExecutor(max_workers=SCRAPER_WORKERS) as video_executor:
+            futures = [
+                video_executor.submit(
+                    _process_one, i, video, total, data_system, rate_limiter, fetch_executor, ydl_opts
+                )
+                for i, video in enumerate(video_list, 1)
+            ]
+            for future in futures:
+                outcome = future.result()
+                if outcome == 'created':
+                    jobs_created += 1
+                elif outcome == 'skipped':
+                    videos_skipped += 1
+    finally:
+        close_ydl_handles()
     
     print()
     print("=" * 60)
@@ -325,13 +448,13 @@ def scrape_comments(video_list: Optional[List[Dict]] = None):
     print(f"  Jobs created: {jobs_created}")
     print(f"  Videos skipped: {videos_skipped} (no comments or save failed)")
     
-    # Verify jobs were actually created in database
-    if jobs_created > 0:
+    # Optionally cross-check the queue; the local counter is authoritative
+    if jobs_created > 0 and VERIFY_JOBS:
         try:
             from infra.client import get_supabase_client
             client = get_supabase_client()
             if client:
-                result = client.table('job_queue').select('id', count='exact').eq('status', 'PENDING').execute()
+                result = client.table('job_queue').select('id', count='exact', head=True).eq('status', 'PENDING').execute()
                 pending_count = result.count or 0
                 print(f"\nVerification:")
                 print(f"  PENDING jobs in queue: {pending_count}")
@@ -2,15 +2,21 @@
 PollPulse TN Utilities Package
 
 Contains helper scripts and data generation tools.
+
+Exports are resolved lazily (PEP 562) so importing a submodule such as
+utils.classifier does not also pull in pandas via the baseline generator.
 """
 
-from .generate_2021_baseline import generate_baseline
-from .alliance_mapper import (
-    AllianceMapper,
-    get_alliance_2021,
-    get_alliance_2026,
-    get_alliance_colors
-)
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_EXPORTS = {
+    'generate_baseline': '.generate_2021_baseline',
+    'AllianceMapper': '.alliance_mapper',
+    'get_alliance_2021': '.alliance_mapper',
+    'get_alliance_2026': '.alliance_mapper',
+    'get_alliance_colors': '.alliance_mapper',
+}
 
 __all__ = [
     'generate_baseline',
@@ -19,3 +25,16 @@ __all__ = [
     'get_alliance_2026',
     'get_alliance_colors'
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
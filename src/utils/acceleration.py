@@ -0,0 +1,61 @@
+"""
+PyTorch Model Acceleration
+
+Optional speed-ups for the FP32 PyTorch model path (the int8 ONNX path in
+utils/quantization.py already runs a fused graph):
+
+- BetterTransformer (optimum): fused multi-head attention that skips padding
+  tokens, which helps most on the variable-length comment batches.
+- torch.compile: compiles the model's forward pass. The first call pays the
+  compile cost, so callers should run a warm-up batch before real traffic.
+
+Each step is skipped with a warning when unavailable, leaving the model as-is.
+"""
+
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
+try:
+    from optimum.bettertransformer import BetterTransformer
+    BETTERTRANSFORMER_AVAILABLE = True
+except ImportError:
+    BETTERTRANSFORMER_AVAILABLE = False
+
+
+def accelerate_torch_model(model, compile_mode: str = 'reduce-overhead'):
+    """
+    Apply BetterTransformer and torch.compile to a PyTorch transformers model.
+
+    The forward method is compiled in place rather than wrapping the model,
+    so the result is still a PreTrainedModel that transformers.pipeline()
+    accepts.
+
+    Args:
+        model: transformers PreTrainedModel
+        compile_mode: torch.compile mode
+
+    Returns:
+        The (possibly transformed) model
+    """
+    if not TORCH_AVAILABLE:
+        return model
+
+    if BETTERTRANSFORMER_AVAILABLE:
+        try:
+            model = BetterTransformer.transform(model)
+            print("Using BetterTransformer fused attention")
+        except Exception as e:
+            print(f"Warning: BetterTransformer not applied: {str(e)[:150]}")
+
+    if hasattr(torch, 'compile'):
+        try:
+            # dynamic=True: batch and sequence lengths vary per call
+            model.forward = torch.compile(model.forward, mode=compile_mode, dynamic=True, fullgraph=False)
+            print(f"Compiled model forward with torch.compile (mode={compile_mode})")
+        except Exception as e:
+            print(f"Warning: torch.compile not applied: {str(e)[:150]}")
+
+    return model
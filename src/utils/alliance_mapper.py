@@ -18,15 +18,88 @@ Usage:
     alliance = mapper_2026.get_alliance("TVK")  # Returns "TVK_Front"
 """
 
-import json
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List
+
+try:
+    from .json_io import load_json_file
+except ImportError:
+    # Run as a script (python src/utils/alliance_mapper.py)
+    from json_io import load_json_file
 
 # Path setup
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent.parent
 CONFIG_DIR = PROJECT_ROOT / "config"
 
+# Party names are compared with whitespace and punctuation removed, so
+# "A.I.A.D.M.K.", "CPI (M)" and "JD(S)" meet the config's "AIADMK", "CPI(M)", "JDS"
+_NORMALIZE_TABLE = str.maketrans({c: None for c in ' \t\n\r.,-_()'})
+
+
+def _normalize_party(party: str) -> str:
+    """Canonical lookup key for a party name (one translate pass, then upper)."""
+    return party.translate(_NORMALIZE_TABLE).upper()
+
+
+# Fallbacks for party name variations not in config, tried in order:
+# (substring, prefix, exact name, config keys to try - None means "Independent")
+# All strings are in normalized form.
+_FUZZY_RULES = (
+    ('CONGRESS', None, None, ('INC',)),
+    ('COMMUNIST', 'CPI', None, ('CPI', 'CPIM', 'CPM')),
+    ('AIADMK', None, 'ADMK', ('ADMK', 'AIADMK')),
+    ('INDEPENDENT', None, 'IND', None),
+)
+
+
+def _fuzzy_rule_tests(rule) -> List[str]:
+    """Regex tests for one fuzzy rule: its substring, anchored prefix and anchored exact name."""
+    substring, prefix, exact, _ = rule
+    tests = [re.escape(substring)]
+    if prefix:
+        tests.append(r'\A' + re.escape(prefix))
+    if exact:
+        tests.append(r'\A' + re.escape(exact) + r'\Z')
+    return tests
+
+
+def _fuzzy_rules_share_prefix(rules) -> bool:
+    """True if a literal of one rule starts with a literal of another rule."""
+    literals = [
+        (index, literal)
+        for index, rule in enumerate(rules)
+        for literal in rule[:3] if literal
+    ]
+    return any(
+        i != j and b.startswith(a)
+        for i, a in literals
+        for j, b in literals
+    )
+
+
+def _compile_fuzzy_regex(rules) -> re.Pattern:
+    """
+    One alternation over every rule's substring/prefix/exact tests, with a
+    named group per rule (r0, r1, ...) so a single scan reports which rules hit.
+    The alternation sits in a zero-width lookahead, so every start position is
+    tried even when two rules' matches overlap ("CPINDEPENDENT"); only a second
+    rule matching at the same position could be missed, which the
+    shared-prefix check below rules out.
+    """
+    alternatives = [
+        f"(?P<r{index}>{'|'.join(_fuzzy_rule_tests(rule))})"
+        for index, rule in enumerate(rules)
+    ]
+    return re.compile(f"(?=(?:{'|'.join(alternatives)}))")
+
+
+_FUZZY_RE = _compile_fuzzy_regex(_FUZZY_RULES)
+assert not _fuzzy_rules_share_prefix(_FUZZY_RULES), \
+    "_FUZZY_RULES literals must not be prefixes of each other's (one match per position)"
+
 
 class AllianceMapper:
     """
@@ -35,7 +108,7 @@ class AllianceMapper:
     Attributes:
         year: Election year (2021 for baseline, 2026 for predictions)
         config: Loaded alliance configuration
-        party_map: Flat party -> alliance lookup
+        party_map: Flat normalized party -> alliance lookup
     """
     
     def __init__(self, year: int = 2026):
@@ -49,6 +122,7 @@ class AllianceMapper:
         self.config_path = CONFIG_DIR / f"alliances_{year}.json"
         self.config: Dict = {}
         self.party_map: Dict[str, str] = {}
+        self._alliance_cache: Dict[str, str] = {}  # Raw name -> alliance; ~15 parties repeat across 234 seats
         self._load_config()
     
     def _load_config(self):
@@ -59,13 +133,12 @@ class AllianceMapper:
             self.config = {"alliances": {}}
             return
         
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            self.config = json.load(f)
+        self.config = load_json_file(self.config_path)
         
         # Build flat party -> alliance map
         for alliance_key, alliance_data in self.config.get('alliances', {}).items():
             for party in alliance_data.get('parties', []):
-                self.party_map[party.upper()] = alliance_key
+                self.party_map[_normalize_party(party)] = alliance_key
     
     def get_alliance(self, party: str) -> str:
         """
@@ -77,38 +150,51 @@ class AllianceMapper:
         Returns:
             Alliance key (e.g., "DMK_Alliance", "ADMK_Alliance")
         """
-        party_clean = party.strip().upper()
+        # Memoized on the raw string so repeats skip strip/upper and fuzzy matching
+        alliance = self._alliance_cache.get(party)
+        if alliance is not None:
+            return alliance
         
-        # Direct lookup
-        if party_clean in self.party_map:
-            return self.party_map[party_clean]
+        party_clean = _normalize_party(party)
         
-        # Fuzzy matching for common variations
-        return self._fuzzy_match(party_clean)
+        # Direct lookup, then fuzzy matching for common variations
+        alliance = self.party_map.get(party_clean)
+        if alliance is None:
+            alliance = self._fuzzy_match(party_clean)
+        
+        self._alliance_cache[party] = alliance
+        return alliance
+    
+    def get_alliances(self, parties: Iterable[str]) -> List[str]:
+        """
+        Map many party names at once (e.g. a DataFrame column).
+        
+        Args:
+            parties: Party names
+            
+        Returns:
+            Alliance keys aligned with the input
+        """
+        cache = self._alliance_cache
+        get_alliance = self.get_alliance
+        return [cache.get(party) or get_alliance(party) for party in parties]
     
     def _fuzzy_match(self, party: str) -> str:
         """Fuzzy match for party name variations not in config."""
-        # Congress variations
-        if 'CONGRESS' in party:
-            if 'INC' in self.party_map:
-                return self.party_map['INC']
+        matched = {m.lastgroup for m in _FUZZY_RE.finditer(party)}
+        if not matched:
+            return "Others"
         
-        # Communist variations
-        if 'COMMUNIST' in party or party.startswith('CPI'):
-            for key in ['CPI', 'CPI(M)', 'CPM']:
+        # Rules still apply in table order; a rule whose keys are all missing falls through
+        for index, (_, _, _, keys) in enumerate(_FUZZY_RULES):
+            if f"r{index}" not in matched:
+                continue
+            if keys is None:
+                return "Independent"
+            for key in keys:
                 if key in self.party_map:
                     return self.party_map[key]
         
-        # AIADMK/ADMK variations
-        if 'AIADMK' in party or party == 'ADMK':
-            for key in ['ADMK', 'AIADMK']:
-                if key in self.party_map:
-                    return self.party_map[key]
-        
-        # Independent
-        if party == 'IND' or 'INDEPENDENT' in party:
-            return "Independent"
-        
         return "Others"
     
     def get_alliance_color(self, alliance: str) -> str:
@@ -145,22 +231,32 @@ class AllianceMapper:
 
 # Convenience functions for quick access
 
+@lru_cache(maxsize=None)
+def _get_mapper(year: int) -> AllianceMapper:
+    """Shared mapper per election year (config file is read once per process)."""
+    return AllianceMapper(year=year)
+
+
+# Flattened alliance -> color maps, keyed by year
+_alliance_colors: Dict[int, Dict[str, str]] = {}
+
+
 def get_alliance_2021(party: str) -> str:
     """Quick lookup for 2021 baseline generation."""
-    mapper = AllianceMapper(year=2021)
-    return mapper.get_alliance(party)
+    return _get_mapper(2021).get_alliance(party)
 
 
 def get_alliance_2026(party: str) -> str:
     """Quick lookup for 2026 predictions."""
-    mapper = AllianceMapper(year=2026)
-    return mapper.get_alliance(party)
+    return _get_mapper(2026).get_alliance(party)
 
 
-def get_alliance_colors() -> Dict[str, str]:
+def get_alliance_colors(year: int = 2026) -> Dict[str, str]:
     """Get all alliance colors for frontend map rendering."""
-    mapper = AllianceMapper(year=2026)
-    return {k: v['color'] for k, v in mapper.get_alliance_metadata().items()}
+    if year not in _alliance_colors:
+        mapper = _get_mapper(year)
+        _alliance_colors[year] = {k: v['color'] for k, v in mapper.get_alliance_metadata().items()}
+    return dict(_alliance_colors[year])
 
 
 if __name__ == "__main__":
@@ -17,9 +17,12 @@ Benefits:
 - Can be fine-tuned later if labeled data becomes available
 """
 
-import json
+import copy
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Optional, List, Tuple
 from pathlib import Path
 import warnings
@@ -27,18 +30,46 @@ import warnings
 # Suppress transformers warnings
 warnings.filterwarnings('ignore', category=UserWarning)
 
+# Must be set before tokenizers loads: the Rust thread pool otherwise competes
+# with torch's intra-op threads (and warns after the scraper's worker threads start)
+os.environ.setdefault('TOKENIZERS_PARALLELISM', 'false')
+
 # Try to import transformers for zero-shot classification
 try:
-    from transformers import pipeline
+    from transformers import pipeline, AutoTokenizer
     TRANSFORMERS_AVAILABLE = True
 except ImportError:
     TRANSFORMERS_AVAILABLE = False
     print("Warning: transformers not available. Using keyword-based classification.")
 
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
+from .json_io import load_json_file
+from .quantization import load_int8_model
+
 CONFIG_DIR = Path(__file__).parent.parent.parent / "config"
 
-# Global model cache
+ZERO_SHOT_MODEL = "MoritzLaurer/mDeBERTa-v3-base-xnli-multilingual-nli-2mil7"
+
+# Int8 ONNX Runtime zero-shot model (needs optimum[onnxruntime]; same flag as the processor)
+USE_ONNX_INT8 = os.getenv('USE_ONNX_INT8', 'false').lower() == 'true'
+
+# Concurrent pipeline calls per batch (torch releases the GIL in forward passes,
+# so chunks overlap tokenization/postprocessing with inference). 1 = serial.
+ZERO_SHOT_WORKERS = max(1, int(os.getenv('ZERO_SHOT_WORKERS', '1')))
+
+# Global model cache (lock guards the lazy load when called from scraper threads)
 _zero_shot_classifier = None
+_zero_shot_lock = threading.Lock()
+
+# Pipelines and their Rust tokenizers keep per-call state and are not
+# thread-safe, so every thread calls through its own pipeline; they all wrap
+# the one loaded model, whose forward pass is safe to run concurrently
+_zero_shot_local = threading.local()
 
 # Alliance labels for zero-shot classification (descriptive labels work better)
 ALLIANCE_LABELS = [
@@ -60,13 +91,32 @@ LABEL_TO_ALLIANCE = {
 def get_zero_shot_classifier():
     """Lazy load zero-shot classification model."""
     global _zero_shot_classifier
-    if _zero_shot_classifier is None and TRANSFORMERS_AVAILABLE:
+    if _zero_shot_classifier is not None or not TRANSFORMERS_AVAILABLE:
+        return _zero_shot_classifier
+    with _zero_shot_lock:
+        if _zero_shot_classifier is not None:
+            return _zero_shot_classifier
         try:
+            # Int8 ONNX Runtime export of the same model (cached on disk after first run)
+            ort_model = load_int8_model(ZERO_SHOT_MODEL) if USE_ONNX_INT8 else None
+            if ort_model is not None:
+                _zero_shot_classifier = pipeline(
+                    "zero-shot-classification",
+                    model=ort_model,
+                    tokenizer=AutoTokenizer.from_pretrained(ZERO_SHOT_MODEL, use_fast=True),
+                    device=-1
+                )
+                print("Using int8-quantized ONNX Runtime zero-shot model")
+                _zero_shot_local.classifier = _zero_shot_classifier
+                return _zero_shot_classifier
+            
             # Use multilingual zero-shot model that works with Tamil-English mixed content
             # MoritzLaurer models are specifically designed for zero-shot classification
+            # Fast (Rust) tokenizer passed explicitly so no revision falls back to the slow one
             _zero_shot_classifier = pipeline(
                 "zero-shot-classification",
-                model="MoritzLaurer/mDeBERTa-v3-base-xnli-multilingual-nli-2mil7",
+                model=ZERO_SHOT_MODEL,
+                tokenizer=AutoTokenizer.from_pretrained(ZERO_SHOT_MODEL, use_fast=True),
                 device=-1  # Use CPU (set to 0 for GPU if available)
             )
         except Exception as e:
@@ -76,65 +126,160 @@ def get_zero_shot_classifier():
                 _zero_shot_classifier = pipeline(
                     "zero-shot-classification",
                     model="facebook/bart-large-mnli",
+                    tokenizer=AutoTokenizer.from_pretrained("facebook/bart-large-mnli", use_fast=True),
                     device=-1
                 )
             except Exception as e2:
                 print(f"Warning: Could not load fallback classifier: {e2}")
                 return None
+        
+        if ZERO_SHOT_WORKERS > 1 and TORCH_AVAILABLE:
+            # Split the cores between workers so intra-op threads don't oversubscribe
+            torch.set_num_threads(max(1, (os.cpu_count() or 1) // ZERO_SHOT_WORKERS))
+        _zero_shot_local.classifier = _zero_shot_classifier
     return _zero_shot_classifier
 
 
+def _thread_zero_shot_classifier(classifier):
+    """
+    This thread's pipeline for `classifier`, built on first use.
+    
+    The copy shares the loaded model weights but gets its own pipeline object
+    and tokenizer, so run_zero_shot workers and concurrent scraper threads
+    never call into the same pipeline at once.
+    """
+    local = getattr(_zero_shot_local, 'classifier', None)
+    if local is not None and local.model is classifier.model:
+        return local
+    local = pipeline(
+        "zero-shot-classification",
+        model=classifier.model,
+        tokenizer=copy.deepcopy(classifier.tokenizer),
+        device=-1
+    )
+    _zero_shot_local.classifier = local
+    return local
+
+
+# Party acronyms and names
+PARTY_PATTERNS = {
+    'DMK': r'\bdmk\b',
+    'ADMK': r'\badmk\b|\baiadmk\b',
+    'BJP': r'\bbjp\b',
+    'TVK': r'\btvk\b',
+    'NTK': r'\bntk\b',
+    'PMK': r'\bpmk\b',
+    'VCK': r'\bvck\b',
+    'MDMK': r'\bmdmk\b',
+    'CPI': r'\bcpi\b',
+    'CPM': r'\bcpm\b',
+    'Congress': r'\bcongress\b|\binc\b',
+}
+
+# Leader names
+LEADER_PATTERNS = {
+    'Stalin': r'\bstalin\b',
+    'Udhayanidhi': r'\budhayanidhi\b',
+    'EPS': r'\beps\b|\bedappadi\b',
+    'OPS': r'\bops\b',
+    'Vijay': r'\bvijay\b|\bthalapathy\b',
+    'Seeman': r'\bseeman\b',
+    'Thirumavalavan': r'\bthirumavalavan\b',
+    'Vaiko': r'\bvaiko\b',
+    'Annamalai': r'\bannamalai\b',
+}
+
+
+def _compile_entity_regex(patterns: Dict[str, str]) -> re.Pattern:
+    """One alternation with a named group per entity, matched against lowercased text."""
+    return re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in patterns.items()))
+
+
+_PARTY_RE = _compile_entity_regex(PARTY_PATTERNS)
+_LEADER_RE = _compile_entity_regex(LEADER_PATTERNS)
+
+
 def extract_political_entities(text: str) -> Dict[str, List[str]]:
     """
     Extract political entities from text using pattern matching (fallback method).
     
+    Each entity set is found in a single pass over the lowercased text.
+    
     Returns:
-        Dict with keys: 'parties', 'leaders'
+        Dict with keys: 'parties', 'leaders' (in pattern order)
     """
-    entities = {
-        'parties': [],
-        'leaders': []
-    }
+    text_lower = text.lower()
     
-    # Party acronyms and names
-    party_patterns = {
-        'DMK': r'\bdmk\b',
-        'ADMK': r'\badmk\b|\baiadmk\b',
-        'BJP': r'\bbjp\b',
-        'TVK': r'\btvk\b',
-        'NTK': r'\bntk\b',
-        'PMK': r'\bpmk\b',
-        'VCK': r'\bvck\b',
-        'MDMK': r'\bmdmk\b',
-        'CPI': r'\bcpi\b',
-        'CPM': r'\bcpm\b',
-        'Congress': r'\bcongress\b|\binc\b',
-    }
+    found_parties = {m.lastgroup for m in _PARTY_RE.finditer(text_lower)}
+    found_leaders = {m.lastgroup for m in _LEADER_RE.finditer(text_lower)}
     
-    # Leader names
-    leader_patterns = {
-        'Stalin': r'\bstalin\b',
-        'Udhayanidhi': r'\budhayanidhi\b',
-        'EPS': r'\beps\b|\bedappadi\b',
-        'OPS': r'\bops\b',
-        'Vijay': r'\bvijay\b|\bthalapathy\b',
-        'Seeman': r'\bseeman\b',
-        'Thirumavalavan': r'\bthirumavalavan\b',
-        'Vaiko': r'\bvaiko\b',
-        'Annamalai': r'\bannamalai\b',
+    return {
+        'parties': [party for party in PARTY_PATTERNS if party in found_parties],
+        'leaders': [leader for leader in LEADER_PATTERNS if leader in found_leaders]
     }
+
+
+# Entity-to-alliance mapping
+ENTITY_ALLIANCE_MAP = {
+    'DMK': 'DMK_Front',
+    'Congress': 'DMK_Front',
+    'VCK': 'DMK_Front',
+    'MDMK': 'DMK_Front',
+    'CPI': 'DMK_Front',
+    'CPM': 'DMK_Front',
+    'ADMK': 'ADMK_Front',
+    'BJP': 'ADMK_Front',
+    'PMK': 'ADMK_Front',
+    'TVK': 'TVK_Front',
+    'NTK': 'NTK',
+    'Stalin': 'DMK_Front',
+    'Udhayanidhi': 'DMK_Front',
+    'Thirumavalavan': 'DMK_Front',
+    'Vaiko': 'DMK_Front',
+    'EPS': 'ADMK_Front',
+    'OPS': 'ADMK_Front',
+    'Vijay': 'TVK_Front',
+    'Seeman': 'NTK',
+    'Annamalai': 'ADMK_Front',
+}
+
+# (entity, alliance, weight) in scoring order: parties count 1, leaders 2
+_ENTITY_WEIGHTS = tuple(
+    [(party, ENTITY_ALLIANCE_MAP[party], 1) for party in PARTY_PATTERNS] +
+    [(leader, ENTITY_ALLIANCE_MAP[leader], 2) for leader in LEADER_PATTERNS]  # Leaders weighted higher
+)
+
+# Parties and leaders in one alternation so the fallback scans the text once
+_ENTITY_RE = _compile_entity_regex({**PARTY_PATTERNS, **LEADER_PATTERNS})
+
+
+# Entity matches needed (all pointing at one alliance) to skip the transformer
+ENTITY_DECISIVE_MATCHES = 2
+
+
+def _entity_match(text: str) -> Tuple[Optional[str], bool]:
+    """
+    Score the entities found in text by alliance.
     
-    text_lower = text.lower()
+    Returns:
+        (best alliance or None, decisive) - decisive when at least
+        ENTITY_DECISIVE_MATCHES entities matched and all belong to one alliance
+    """
+    found = {m.lastgroup for m in _ENTITY_RE.finditer(text.lower())}
+    if not found:
+        return None, False
     
-    for party, pattern in party_patterns.items():
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            entities['parties'].append(party)
+    alliance_counts = {}
+    for entity, alliance, weight in _ENTITY_WEIGHTS:
+        if entity in found:
+            alliance_counts[alliance] = alliance_counts.get(alliance, 0) + weight
     
-    for leader, pattern in leader_patterns.items():
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            entities['leaders'].append(leader)
+    if not alliance_counts:
+        return None, False
     
-    return entities
+    best = max(alliance_counts.items(), key=lambda x: x[1])[0]
+    decisive = len(alliance_counts) == 1 and len(found) >= ENTITY_DECISIVE_MATCHES
+    return best, decisive
 
 
 def classify_with_entities(text: str) -> Optional[str]:
@@ -142,83 +287,33 @@ def classify_with_entities(text: str) -> Optional[str]:
     Fallback classification using entity extraction.
     Used when zero-shot classifier is not available.
     """
-    entities = extract_political_entities(text)
-    
-    # Entity-to-alliance mapping
-    entity_alliance_map = {
-        'DMK': 'DMK_Front',
-        'Congress': 'DMK_Front',
-        'VCK': 'DMK_Front',
-        'MDMK': 'DMK_Front',
-        'CPI': 'DMK_Front',
-        'CPM': 'DMK_Front',
-        'ADMK': 'ADMK_Front',
-        'BJP': 'ADMK_Front',
-        'PMK': 'ADMK_Front',
-        'TVK': 'TVK_Front',
-        'NTK': 'NTK',
-        'Stalin': 'DMK_Front',
-        'Udhayanidhi': 'DMK_Front',
-        'Thirumavalavan': 'DMK_Front',
-        'Vaiko': 'DMK_Front',
-        'EPS': 'ADMK_Front',
-        'OPS': 'ADMK_Front',
-        'Vijay': 'TVK_Front',
-        'Seeman': 'NTK',
-        'Annamalai': 'ADMK_Front',
-    }
-    
-    alliance_counts = {}
-    for party in entities['parties']:
-        alliance = entity_alliance_map.get(party)
-        if alliance:
-            alliance_counts[alliance] = alliance_counts.get(alliance, 0) + 1
-    
-    for leader in entities['leaders']:
-        alliance = entity_alliance_map.get(leader)
-        if alliance:
-            alliance_counts[alliance] = alliance_counts.get(alliance, 0) + 2  # Leaders weighted higher
-    
-    if alliance_counts:
-        return max(alliance_counts.items(), key=lambda x: x[1])[0]
-    
-    return None
+    return _entity_match(text)[0]
 
 
+@lru_cache(maxsize=1)
 def load_alliances() -> Dict:
-    """Load alliance keywords from config file."""
+    """Load alliance keywords from config file (read once per process; treat as read-only)."""
     config_path = CONFIG_DIR / "alliances.json"
     if not config_path.exists():
         raise FileNotFoundError(f"Alliance config not found: {config_path}")
     
-    with open(config_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return load_json_file(config_path)
 
 
-def classify_alliance(data: Dict, producer_alliance: Optional[str] = None) -> str:
-    """
-    Classify content into a political alliance using zero-shot classification.
-    
-    This is the production-grade approach that uses pre-trained models
-    to understand context and semantics without requiring training data.
-    
-    Args:
-        data: Structured data payload with meta, authoritative_content, user_comments
-        producer_alliance: Optional alliance already detected by producer
-    
-    Returns:
-        Alliance name (e.g., "DMK_Front") or "Unknown"
-    """
-    # Load alliances config
-    alliances = load_alliances()
-    keywords_map = alliances.get('keywords', {})
-    valid_alliances = set(keywords_map.keys())
-    
-    # Priority 1: Use producer alliance if valid
-    if producer_alliance and producer_alliance != 'Unknown' and producer_alliance in valid_alliances:
-        return producer_alliance
-    
-    # Priority 2: Extract text from all content sources
+@lru_cache(maxsize=1)
+def _valid_alliances_set() -> frozenset:
+    """Alliance names from config, flattened once."""
+    return frozenset(load_alliances().get('keywords', {}).keys())
+
+
+# Zero-shot inputs are cut to roughly 256 tokens; the pipeline has no
+# max_length option and the title/headlines carry the signal anyway
+ZERO_SHOT_MAX_CHARS = 1024
+ZERO_SHOT_BATCH_SIZE = 16
+
+
+def _text_to_classify(data: Dict) -> str:
+    """Pick the most reliable text in a payload for alliance classification."""
     meta = data.get('meta', {})
     title = meta.get('title', '') or ''
     description = meta.get('description', '') or ''
@@ -258,47 +353,144 @@ def classify_alliance(data: Dict, producer_alliance: Optional[str] = None) -> st
     if not text_to_classify:
         text_to_classify = tertiary_text.strip()
     
-    if not text_to_classify or len(text_to_classify) < 10:
-        return "Unknown"
+    return text_to_classify
+
+
+def _alliance_from_zero_shot(result: Dict) -> Optional[str]:
+    """Map a zero-shot result to an alliance name if the top label is confident enough."""
+    # Extract top prediction
+    if result['labels'] and result['scores']:
+        top_label = result['labels'][0]
+        top_score = result['scores'][0]
+        
+        # Map label to alliance name
+        for label_key, alliance_name in LABEL_TO_ALLIANCE.items():
+            if label_key in top_label:
+                # Require minimum confidence (0.3 for zero-shot)
+                if top_score >= 0.3:
+                    return alliance_name
+                break
+    
+    return None
+
+
+def _zero_shot_chunk(classifier, texts: List[str]) -> List[Dict]:
+    """One batched pipeline call on this thread's pipeline; always returns a list of results."""
+    outputs = _thread_zero_shot_classifier(classifier)(
+        texts,
+        ALLIANCE_LABELS,
+        multi_label=False,
+        batch_size=ZERO_SHOT_BATCH_SIZE
+    )
+    if isinstance(outputs, dict):
+        outputs = [outputs]
+    return outputs
+
+
+def run_zero_shot(classifier, texts: List[str]) -> List[Dict]:
+    """
+    Run the zero-shot pipeline over texts, split across ZERO_SHOT_WORKERS threads.
+    
+    Falls back to a single serial batched call when one worker is configured
+    or the input fits in one batch. Safe to call from several threads: each
+    thread runs on its own pipeline over the shared model.
+    
+    Returns:
+        Pipeline results in input order
+    """
+    if ZERO_SHOT_WORKERS == 1 or len(texts) <= ZERO_SHOT_BATCH_SIZE:
+        return _zero_shot_chunk(classifier, texts)
+    
+    chunk_size = -(-len(texts) // ZERO_SHOT_WORKERS)
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    
+    with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+        chunk_outputs = executor.map(lambda chunk: _zero_shot_chunk(classifier, chunk), chunks)
+        return [output for outputs in chunk_outputs for output in outputs]
+
+
+def classify_alliances_batch(
+    data_list: List[Dict],
+    producer_alliances: Optional[List[Optional[str]]] = None
+) -> List[str]:
+    """
+    Classify several payloads into political alliances with one zero-shot call.
+    
+    Cheapest path first: a valid producer alliance wins outright, then
+    entity extraction settles texts whose entities all point at one alliance.
+    Only the remaining ambiguous texts go through the zero-shot pipeline, as a
+    single batched call, falling back to their entity result per item.
+    
+    Args:
+        data_list: Structured data payloads with meta, authoritative_content, user_comments
+        producer_alliances: Optional alliance already detected by producer, per payload
+    
+    Returns:
+        Alliance name (e.g., "DMK_Front") or "Unknown" for each payload, in input order
+    """
+    if producer_alliances is None:
+        producer_alliances = [None] * len(data_list)
+    
+    results = ["Unknown"] * len(data_list)
+    pending = []  # (index, text, entity alliance) still needing zero-shot
+    
+    for i, (data, producer_alliance) in enumerate(zip(data_list, producer_alliances)):
+        # Priority 1: Use producer alliance if valid (config only read when one is given)
+        if producer_alliance and producer_alliance != 'Unknown' and producer_alliance in _valid_alliances_set():
+            results[i] = producer_alliance
+            continue
+        
+        # Priority 2: Extract text from all content sources
+        text_to_classify = _text_to_classify(data)
+        if not text_to_classify or len(text_to_classify) < 10:
+            continue
+        
+        # Priority 3: Unambiguous entity mentions (e.g. "DMK" + "Stalin")
+        entity_alliance, decisive = _entity_match(text_to_classify)
+        if decisive:
+            results[i] = entity_alliance
+            continue
+        
+        pending.append((i, text_to_classify, entity_alliance))
+    
+    if not pending:
+        return results
     
     # Try zero-shot classification first
+    zero_shot_results = [None] * len(pending)
     classifier = get_zero_shot_classifier()
     if classifier:
         try:
-            # Zero-shot classification
-            result = classifier(text_to_classify, ALLIANCE_LABELS)
-            
-            # Extract top prediction
-            if result['labels'] and result['scores']:
-                top_label = result['labels'][0]
-                top_score = result['scores'][0]
-                
-                # Map label to alliance name
-                for label_key, alliance_name in LABEL_TO_ALLIANCE.items():
-                    if label_key in top_label:
-                        # Require minimum confidence (0.3 for zero-shot)
-                        if top_score >= 0.3:
-                            return alliance_name
-                        break
-            
-            # If zero-shot didn't find a match, fall back to entity extraction
-            entity_result = classify_with_entities(text_to_classify)
-            if entity_result:
-                return entity_result
-                
+            outputs = run_zero_shot(classifier, [text[:ZERO_SHOT_MAX_CHARS] for _, text, _ in pending])
+            zero_shot_results = [_alliance_from_zero_shot(output) for output in outputs]
         except Exception as e:
             print(f"Error in zero-shot classification: {e}")
-            # Fall back to entity extraction
-            entity_result = classify_with_entities(text_to_classify)
-            if entity_result:
-                return entity_result
-    else:
-        # No classifier available, use entity extraction
-        entity_result = classify_with_entities(text_to_classify)
-        if entity_result:
-            return entity_result
-    
-    return "Unknown"
+    
+    for (i, _, entity_alliance), alliance in zip(pending, zero_shot_results):
+        # If zero-shot didn't find a match, fall back to entity extraction
+        if alliance is None:
+            alliance = entity_alliance
+        if alliance:
+            results[i] = alliance
+    
+    return results
+
+
+def classify_alliance(data: Dict, producer_alliance: Optional[str] = None) -> str:
+    """
+    Classify content into a political alliance using zero-shot classification.
+    
+    This is the production-grade approach that uses pre-trained models
+    to understand context and semantics without requiring training data.
+    
+    Args:
+        data: Structured data payload with meta, authoritative_content, user_comments
+        producer_alliance: Optional alliance already detected by producer
+    
+    Returns:
+        Alliance name (e.g., "DMK_Front") or "Unknown"
+    """
+    return classify_alliances_batch([data], [producer_alliance])[0]
 
 
 def should_process_content(data: Dict, min_alliance_confidence: int = 1) -> tuple[bool, str]:
@@ -13,11 +13,35 @@ DECOUPLED DESIGN:
 - Same pattern used for 2026 predictions (config/alliances_2026.json)
 """
 
-import json
+import argparse
+import heapq
+import sys
+import traceback
+from collections import Counter
 import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Optional
 
+try:
+    import pyarrow  # noqa: F401  (Arrow CSV engine and the Parquet subset cache)
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+try:
+    from .alliance_mapper import _get_mapper
+    from .json_io import load_json_file, dump_json_file
+except ImportError:
+    # Run as a script (python src/utils/generate_2021_baseline.py)
+    from alliance_mapper import _get_mapper
+    from json_io import load_json_file, dump_json_file
+
 # Path setup
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent.parent
@@ -25,107 +49,112 @@ CSV_PATH = PROJECT_ROOT / "2021 election data.csv"
 ALLIANCE_CONFIG_PATH = PROJECT_ROOT / "config" / "alliances_2021.json"
 DISTRICTS_CONFIG_PATH = PROJECT_ROOT / "config" / "districts.json"
 OUTPUT_PATH = PROJECT_ROOT / "data" / "2021_baseline.json"
+PRETTY_OUTPUT_PATH = OUTPUT_PATH.with_suffix('.pretty.json')
+# Typed TN-2021 subset of the CSV, rebuilt whenever the CSV is newer (needs pyarrow)
+TN_PARQUET_PATH = PROJECT_ROOT / "data" / "2021_tn.parquet"
+
+# Only these TCPD columns are used; the rest of the dataset is never parsed
+CSV_USECOLS = [
+    'State_Name', 'Year', 'Position', 'Constituency_Name', 'District_Name',
+    'Party', 'Margin', 'Margin_Percentage', 'Vote_Share_Percentage',
+    'Valid_Votes', 'Turnout_Percentage'
+]
+# Low-cardinality text columns are read as categories (one string per distinct value)
+CSV_DTYPES = {
+    'State_Name': 'category', 'District_Name': 'category', 'Party': 'category',
+    'Year': 'int16', 'Position': 'int8'
+}
 
 # ============================================================
-# ALLIANCE MAPPING (Config-Driven)
+# ALLIANCE MAPPING (Config-Driven, shared with AllianceMapper)
 # ============================================================
 
-# Cache for loaded alliance config
-_alliance_config: Optional[Dict] = None
-_party_to_alliance_map: Optional[Dict[str, str]] = None
-
-
-def load_alliance_config(config_path: Path = ALLIANCE_CONFIG_PATH) -> Dict:
-    """Load alliance configuration from JSON file."""
-    global _alliance_config
-    
-    if _alliance_config is not None:
-        return _alliance_config
-    
-    if not config_path.exists():
+def load_alliance_mapper():
+    """Get the shared 2021 AllianceMapper, failing loudly if its config is missing."""
+    if not ALLIANCE_CONFIG_PATH.exists():
         raise FileNotFoundError(
-            f"Alliance config not found: {config_path}\n"
+            f"Alliance config not found: {ALLIANCE_CONFIG_PATH}\n"
             "Please create config/alliances_2021.json with party-to-alliance mappings."
         )
-    
-    with open(config_path, 'r', encoding='utf-8') as f:
-        _alliance_config = json.load(f)
-    
-    print(f"Loaded alliance config from: {config_path}")
-    return _alliance_config
+    return _get_mapper(2021)
+
 
+def load_districts_config() -> Dict:
+    """Load districts.json for constituency-district mapping validation."""
+    if DISTRICTS_CONFIG_PATH.exists():
+        return load_json_file(DISTRICTS_CONFIG_PATH)
+    return {}
+
+
+# ============================================================
+# CSV LOADING
+# ============================================================
 
-def build_party_to_alliance_map(config: Dict = None) -> Dict[str, str]:
-    """Build a flat party -> alliance lookup from config."""
-    global _party_to_alliance_map
+def load_tn_2021_rows() -> pd.DataFrame:
+    """
+    Load the Tamil Nadu 2021 rows, from the Parquet cache when it is current.
     
-    if _party_to_alliance_map is not None:
-        return _party_to_alliance_map
+    With pyarrow installed the filtered subset is written to TN_PARQUET_PATH
+    after a CSV parse, and later runs read that instead (typed, columnar, no
+    text-to-number conversion). Without pyarrow the CSV is parsed every time.
+    """
+    if not CSV_PATH.exists():
+        raise FileNotFoundError(f"CSV not found at {CSV_PATH}")
     
-    if config is None:
-        config = load_alliance_config()
+    if (PYARROW_AVAILABLE and TN_PARQUET_PATH.exists()
+            and TN_PARQUET_PATH.stat().st_mtime >= CSV_PATH.stat().st_mtime):
+        print(f"Loading cached subset from: {TN_PARQUET_PATH}")
+        return pd.read_parquet(TN_PARQUET_PATH)
     
-    _party_to_alliance_map = {}
+    df_tn = read_tn_2021_csv()
     
-    for alliance_key, alliance_data in config.get('alliances', {}).items():
-        for party in alliance_data.get('parties', []):
-            # Store both original and uppercase for flexible matching
-            _party_to_alliance_map[party.upper()] = alliance_key
+    if PYARROW_AVAILABLE:
+        try:
+            TN_PARQUET_PATH.parent.mkdir(parents=True, exist_ok=True)
+            df_tn.to_parquet(TN_PARQUET_PATH, compression='zstd', index=False)
+        except Exception as e:
+            print(f"Warning: Could not write Parquet cache: {e}")
     
-    return _party_to_alliance_map
+    return df_tn
 
 
-def map_party_to_alliance(party: str) -> str:
+def read_tn_2021_csv() -> pd.DataFrame:
     """
-    Map individual party to alliance based on config.
+    Parse the Tamil Nadu 2021 rows of the TCPD CSV into a pandas DataFrame.
     
-    This function is config-driven - update alliances_2021.json to change mappings.
+    With polars installed the CSV is scanned lazily so the state/year filter
+    and column projection run inside the parser; otherwise pandas reads the
+    projected columns and filters afterwards. Both return CSV_DTYPES columns.
     """
-    party_clean = party.strip().upper()
-    
-    # Load mapping from config
-    party_map = build_party_to_alliance_map()
-    
-    # Direct lookup
-    if party_clean in party_map:
-        return party_map[party_clean]
-    
-    # Fuzzy matching for common variations not in config
-    # These are fallbacks for data inconsistencies
-    
-    # Congress variations
-    if 'CONGRESS' in party_clean and 'INC' in party_map:
-        return party_map.get('INC', 'Others')
-    
-    # Communist variations
-    if 'COMMUNIST' in party_clean or party_clean.startswith('CPI'):
-        if 'CPI' in party_map:
-            return party_map['CPI']
-        if 'CPI(M)' in party_map:
-            return party_map['CPI(M)']
-        if 'CPM' in party_map:
-            return party_map['CPM']
-    
-    # AIADMK/ADMK variations
-    if 'AIADMK' in party_clean or party_clean == 'ADMK':
-        if 'ADMK' in party_map:
-            return party_map['ADMK']
-        if 'AIADMK' in party_map:
-            return party_map['AIADMK']
-    
-    # Independent
-    if party_clean == 'IND' or 'INDEPENDENT' in party_clean:
-        return "Independent"
-    
-    return "Others"
-
-
-def load_districts_config() -> Dict:
-    """Load districts.json for constituency-district mapping validation."""
-    if DISTRICTS_CONFIG_PATH.exists():
-        with open(DISTRICTS_CONFIG_PATH, 'r') as f:
-            return json.load(f)
-    return {}
+    print(f"Loading CSV from: {CSV_PATH}")
+    
+    if POLARS_AVAILABLE:
+        frame = (
+            pl.scan_csv(CSV_PATH)
+            .select(CSV_USECOLS)
+            .filter((pl.col('State_Name') == 'Tamil_Nadu') & (pl.col('Year') == 2021))
+            .collect()
+        )
+        print(f"Loaded {frame.height} rows (polars scan, filtered on read)")
+        # Built from Python lists so the conversion does not need pyarrow
+        return pd.DataFrame(frame.to_dict(as_series=False)).astype(CSV_DTYPES)
+    
+    # Load only the needed columns with explicit dtypes (Arrow engine when available)
+    df = pd.read_csv(
+        CSV_PATH,
+        usecols=CSV_USECOLS,
+        dtype=CSV_DTYPES,
+        engine='pyarrow' if PYARROW_AVAILABLE else 'c'
+    )
+    
+    print(f"Loaded {len(df)} rows")
+    print(f"Columns: {list(df.columns)}")
+    
+    # Filter for Tamil Nadu 2021
+    return df[
+        (df['State_Name'] == 'Tamil_Nadu') & 
+        (df['Year'] == 2021)
+    ].reset_index(drop=True)
 
 
 def generate_baseline() -> Dict:
@@ -150,95 +179,76 @@ def generate_baseline() -> Dict:
         "summary": {...}
     }
     """
-    print(f"Loading CSV from: {CSV_PATH}")
-    
-    if not CSV_PATH.exists():
-        raise FileNotFoundError(f"CSV not found at {CSV_PATH}")
-    
-    # Load CSV with pandas
-    df = pd.read_csv(CSV_PATH)
-    
-    print(f"Loaded {len(df)} rows")
-    print(f"Columns: {list(df.columns)}")
-    
-    # Filter for Tamil Nadu 2021 and Position 1 (winners) and Position 2 (runner-up)
-    df_tn = df[
-        (df['State_Name'] == 'Tamil_Nadu') & 
-        (df['Year'] == 2021)
-    ].copy()
+    df_tn = load_tn_2021_rows()
     
     print(f"Tamil Nadu 2021 rows: {len(df_tn)}")
     
+    # Normalize the join key once instead of per winner
+    df_tn['Constituency_Key'] = df_tn['Constituency_Name'].str.strip().str.upper()
+    
     # Get winners (Position == 1)
-    winners = df_tn[df_tn['Position'] == 1].copy()
+    winners = df_tn[df_tn['Position'] == 1]
     
     # Get runner-ups (Position == 2)
-    runners_up = df_tn[df_tn['Position'] == 2].copy()
+    runners_up = df_tn[df_tn['Position'] == 2]
     
     print(f"Winners: {len(winners)}")
     print(f"Runner-ups: {len(runners_up)}")
     
-    # Build constituencies dict
-    constituencies = {}
-    
-    for _, row in winners.iterrows():
-        constituency_name = row['Constituency_Name'].strip().upper()
-        district_name = row['District_Name'].strip()
-        party = row['Party'].strip()
-        
-        # Get runner-up info
-        runner_up_row = runners_up[
-            runners_up['Constituency_Name'].str.strip().str.upper() == constituency_name
-        ]
-        
-        runner_up_party = ""
-        runner_up_alliance = ""
-        if len(runner_up_row) > 0:
-            runner_up_party = runner_up_row.iloc[0]['Party'].strip()
-            runner_up_alliance = map_party_to_alliance(runner_up_party)
-        
-        constituencies[constituency_name] = {
-            "district": district_name,
-            "winner": party,
-            "winner_alliance": map_party_to_alliance(party),
-            "margin": int(row['Margin']) if pd.notna(row['Margin']) else 0,
-            "margin_percentage": float(row['Margin_Percentage']) if pd.notna(row['Margin_Percentage']) else 0.0,
-            "vote_share": float(row['Vote_Share_Percentage']) if pd.notna(row['Vote_Share_Percentage']) else 0.0,
-            "runner_up": runner_up_party,
-            "runner_up_alliance": runner_up_alliance,
-            "total_votes": int(row['Valid_Votes']) if pd.notna(row['Valid_Votes']) else 0,
-            "turnout": float(row['Turnout_Percentage']) if pd.notna(row['Turnout_Percentage']) else 0.0
+    # Attach each winner's runner-up with one hashed join (first runner-up per seat)
+    runner_up_parties = (
+        runners_up.drop_duplicates('Constituency_Key')[['Constituency_Key', 'Party']]
+        .rename(columns={'Party': 'Runner_Up_Party'})
+    )
+    merged = winners.merge(runner_up_parties, on='Constituency_Key', how='left')
+    
+    merged['District_Name'] = merged['District_Name'].str.strip()
+    merged['Party'] = merged['Party'].str.strip()
+    merged['Runner_Up_Party'] = merged['Runner_Up_Party'].str.strip().fillna('')
+    
+    # Map each distinct party once rather than once per row
+    parties = list((set(merged['Party']) | set(merged['Runner_Up_Party'])) - {''})
+    alliance_by_party = dict(zip(parties, load_alliance_mapper().get_alliances(parties)))
+    alliance_by_party[''] = ''  # No runner-up
+    merged['Winner_Alliance'] = merged['Party'].map(alliance_by_party)
+    merged['Runner_Up_Alliance'] = merged['Runner_Up_Party'].map(alliance_by_party)
+    
+    # Vectorized numeric casts (missing values become 0)
+    for column in ('Margin', 'Valid_Votes'):
+        merged[column] = merged[column].fillna(0).astype(int)
+    for column in ('Margin_Percentage', 'Vote_Share_Percentage', 'Turnout_Percentage'):
+        merged[column] = merged[column].fillna(0.0).astype(float)
+    
+    # Build constituencies dict (a repeated key keeps its last row).
+    # Intern the small-vocabulary strings so the 234 entries share one copy each
+    constituencies = {
+        row['Constituency_Key']: {
+            "district": sys.intern(row['District_Name']),
+            "winner": sys.intern(row['Party']),
+            "winner_alliance": row['Winner_Alliance'],
+            "margin": row['Margin'],
+            "margin_percentage": row['Margin_Percentage'],
+            "vote_share": row['Vote_Share_Percentage'],
+            "runner_up": sys.intern(row['Runner_Up_Party']),
+            "runner_up_alliance": row['Runner_Up_Alliance'],
+            "total_votes": row['Valid_Votes'],
+            "turnout": row['Turnout_Percentage']
         }
-    
-    # Calculate summary statistics
-    alliance_counts = {}
-    alliance_seats = {
-        "DMK_Alliance": [], 
-        "ADMK_Alliance": [], 
-        "AMMK_Front": [],
-        "MNM_Front": [],
-        "NTK": [], 
-        "Independent": [],
-        "Others": []
+        for row in merged.to_dict('records')
     }
     
-    for const_name, data in constituencies.items():
-        alliance = data['winner_alliance']
-        alliance_counts[alliance] = alliance_counts.get(alliance, 0) + 1
-        if alliance in alliance_seats:
-            alliance_seats[alliance].append(const_name)
+    # One row per seat in dict order (a repeated key keeps its last row, as in the dict)
+    seats = merged.groupby('Constituency_Key', sort=False)[['Winner_Alliance', 'Margin_Percentage']].last()
+    margins = seats['Margin_Percentage']
+    
+    # Calculate summary statistics
+    alliance_counts = dict(Counter(seats['Winner_Alliance']))
     
     # Identify vulnerable seats (margin < 5%)
-    vulnerable_seats = [
-        name for name, data in constituencies.items()
-        if data['margin_percentage'] < 5.0
-    ]
+    vulnerable_seats = margins[margins < 5.0]
     
     # Identify safe seats (margin > 20%)
-    safe_seats = [
-        name for name, data in constituencies.items()
-        if data['margin_percentage'] > 20.0
-    ]
+    safe_seats = margins[margins > 20.0]
     
     baseline = {
         "metadata": {
@@ -255,13 +265,11 @@ def generate_baseline() -> Dict:
             "total_seats": len(constituencies),
             "vulnerable_seats_count": len(vulnerable_seats),
             "safe_seats_count": len(safe_seats),
-            "average_margin_percentage": round(
-                sum(c['margin_percentage'] for c in constituencies.values()) / len(constituencies), 2
-            ) if constituencies else 0
+            "average_margin_percentage": round(float(margins.mean()), 2) if constituencies else 0
         },
         "analysis": {
-            "vulnerable_seats": vulnerable_seats[:20],  # Top 20 most vulnerable
-            "safe_seats": safe_seats[:10]  # Top 10 safest
+            "vulnerable_seats": vulnerable_seats.nsmallest(20).index.tolist(),  # Top 20 most vulnerable
+            "safe_seats": safe_seats.nlargest(10).index.tolist()  # Top 10 safest
         }
     }
     
@@ -269,46 +277,78 @@ def generate_baseline() -> Dict:
 
 
 def print_summary(baseline: Dict):
-    """Print a summary of the baseline data."""
-    print("\n" + "=" * 60)
-    print("2021 TAMIL NADU ELECTION BASELINE SUMMARY")
-    print("=" * 60)
+    """Print a summary of the baseline data (buffered, written in one call)."""
+    lines = []
+    emit = lines.append
+    
+    emit("\n" + "=" * 60)
+    emit("2021 TAMIL NADU ELECTION BASELINE SUMMARY")
+    emit("=" * 60)
     
     summary = baseline['summary']
     metadata = baseline['metadata']
     
-    print(f"\nSource: {metadata['source']}")
-    print(f"Total Constituencies: {metadata['total_constituencies']}")
+    emit(f"\nSource: {metadata['source']}")
+    emit(f"Total Constituencies: {metadata['total_constituencies']}")
     
-    print(f"\nSEATS BY ALLIANCE:")
-    print("-" * 40)
+    emit(f"\nSEATS BY ALLIANCE:")
+    emit("-" * 40)
     for alliance, count in sorted(summary['seats_by_alliance'].items(), key=lambda x: -x[1]):
         pct = (count / summary['total_seats']) * 100
-        print(f"  {alliance:20s}: {count:3d} seats ({pct:.1f}%)")
+        emit(f"  {alliance:20s}: {count:3d} seats ({pct:.1f}%)")
     
-    print(f"\nKEY METRICS:")
-    print("-" * 40)
-    print(f"  Vulnerable Seats (<5% margin): {summary['vulnerable_seats_count']}")
-    print(f"  Safe Seats (>20% margin): {summary['safe_seats_count']}")
-    print(f"  Average Margin: {summary['average_margin_percentage']:.2f}%")
+    emit(f"\nKEY METRICS:")
+    emit("-" * 40)
+    emit(f"  Vulnerable Seats (<5% margin): {summary['vulnerable_seats_count']}")
+    emit(f"  Safe Seats (>20% margin): {summary['safe_seats_count']}")
+    emit(f"  Average Margin: {summary['average_margin_percentage']:.2f}%")
     
-    print(f"\nTOP 10 MOST VULNERABLE SEATS:")
-    print("-" * 40)
+    emit(f"\nTOP 10 MOST VULNERABLE SEATS:")
+    emit("-" * 40)
     
-    # Sort constituencies by margin percentage
-    sorted_by_margin = sorted(
+    # Ten lowest margins without sorting every constituency (ties keep dict order)
+    most_vulnerable = heapq.nsmallest(
+        10,
         baseline['constituencies'].items(),
         key=lambda x: x[1]['margin_percentage']
     )
     
-    for i, (name, data) in enumerate(sorted_by_margin[:10], 1):
-        print(f"  {i:2d}. {name:25s} | {data['winner']:8s} vs {data['runner_up']:8s} | Margin: {data['margin_percentage']:.2f}%")
+    for i, (name, data) in enumerate(most_vulnerable, 1):
+        emit(f"  {i:2d}. {name:25s} | {data['winner']:8s} vs {data['runner_up']:8s} | Margin: {data['margin_percentage']:.2f}%")
     
-    print("\n" + "=" * 60)
+    emit("\n" + "=" * 60)
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
+def baseline_is_current() -> bool:
+    """True if OUTPUT_PATH is newer than the CSV and the 2021 alliance config."""
+    if not OUTPUT_PATH.exists() or not CSV_PATH.exists():
+        return False
+    
+    output_mtime = OUTPUT_PATH.stat().st_mtime
+    sources = [CSV_PATH, ALLIANCE_CONFIG_PATH]
+    return all(output_mtime >= source.stat().st_mtime for source in sources if source.exists())
 
-def main():
-    """Main entry point."""
+
+def main(pretty: bool = False, force: bool = False):
+    """
+    Main entry point.
+    
+    Args:
+        pretty: Also write an indented copy to PRETTY_OUTPUT_PATH for reading.
+                The machine copy at OUTPUT_PATH is always compact.
+        force: Regenerate even if the saved baseline is up to date
+    """
+    if not force and baseline_is_current():
+        print(f"Baseline up to date: {OUTPUT_PATH} (use --force to regenerate)")
+        baseline = load_json_file(OUTPUT_PATH)
+        if pretty:
+            dump_json_file(baseline, PRETTY_OUTPUT_PATH, indent=True)
+            print(f"Pretty-printed copy saved to: {PRETTY_OUTPUT_PATH}")
+        print_summary(baseline)
+        return baseline
+    
     print("Generating 2021 Tamil Nadu Election Baseline...")
     print("-" * 60)
     
@@ -318,12 +358,15 @@ def main():
         # Ensure output directory exists
         OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
         
-        # Save to JSON
-        with open(OUTPUT_PATH, 'w', encoding='utf-8') as f:
-            json.dump(baseline, f, indent=2, ensure_ascii=False)
+        # Save to JSON (compact; consumers parse it, nobody diffs it)
+        dump_json_file(baseline, OUTPUT_PATH)
         
         print(f"\nBaseline saved to: {OUTPUT_PATH}")
         
+        if pretty:
+            dump_json_file(baseline, PRETTY_OUTPUT_PATH, indent=True)
+            print(f"Pretty-printed copy saved to: {PRETTY_OUTPUT_PATH}")
+        
         # Print summary
         print_summary(baseline)
         
@@ -335,10 +378,15 @@ def main():
         return None
     except Exception as e:
         print(f"ERROR generating baseline: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Generate the 2021 TN election baseline")
+    parser.add_argument('--pretty', action='store_true',
+                        help=f"Also write an indented copy to {PRETTY_OUTPUT_PATH.name}")
+    parser.add_argument('--force', action='store_true',
+                        help="Regenerate even if the saved baseline is newer than the CSV")
+    args = parser.parse_args()
+    main(pretty=args.pretty, force=args.force)
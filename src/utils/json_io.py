@@ -0,0 +1,66 @@
+"""
+JSON File Helpers
+
+Config loading and baseline writing go through these helpers so they use
+orjson (native parser/serializer) when it is installed and fall back to the
+stdlib json module otherwise. Output is UTF-8 with non-ASCII kept as-is in
+both cases.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads_json(payload: Union[bytes, str]) -> Any:
+    """Parse a JSON document from bytes or str."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def dumps_json(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes.
+
+    Args:
+        data: JSON-serializable object (numpy scalars are accepted with orjson)
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        # NON_STR_KEYS matches stdlib json, which stringifies int/float keys
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def load_json_file(path: Union[str, Path]) -> Any:
+    """Read and parse a JSON file."""
+    with open(path, 'rb') as f:
+        return loads_json(f.read())
+
+
+def dump_json_file(data: Any, path: Union[str, Path], indent: bool = False):
+    """
+    Serialize `data` and write it to `path` atomically.
+    
+    The document is written to a sibling .tmp file and renamed over `path`,
+    so readers never see a half-written file.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(dumps_json(data, indent=indent))
+    os.replace(tmp_path, path)
@@ -0,0 +1,74 @@
+"""
+Int8 Model Quantization
+
+Optional CPU speed-up for the transformer pipelines: exports a Hugging Face
+sequence-classification model to ONNX and applies dynamic int8 quantization
+with ONNX Runtime (via optimum). Quantized weights run int8 GEMMs (VNNI on
+AVX-512 CPUs) instead of FP32, roughly halving memory and cutting latency.
+
+The export happens once and is cached on disk. Callers fall back to the
+regular FP32 model when optimum is not installed or the export fails.
+"""
+
+import os
+import platform
+from pathlib import Path
+from typing import Optional
+
+# Try to import optimum for ONNX export + quantization
+try:
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    OPTIMUM_AVAILABLE = True
+except ImportError:
+    OPTIMUM_AVAILABLE = False
+
+ONNX_CACHE_DIR = Path(os.getenv(
+    'ONNX_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'pollpulse', 'onnx')
+))
+
+QUANTIZED_FILE_NAME = "model_quantized.onnx"
+
+
+def _quantization_config():
+    """Dynamic (weights-only) int8 config for the host CPU."""
+    if platform.machine().lower() in ('arm64', 'aarch64'):
+        return AutoQuantizationConfig.arm64(is_static=False, per_channel=False)
+    return AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+
+
+def load_int8_model(model_name: str) -> Optional[object]:
+    """
+    Load an int8-quantized ONNX Runtime version of a classification model.
+    
+    Exports and quantizes on first use, then reuses the cached ONNX file.
+    The returned model can be passed to transformers.pipeline() in place
+    of the PyTorch model.
+    
+    Args:
+        model_name: Hugging Face model id (e.g. "cardiffnlp/twitter-xlm-roberta-base-sentiment")
+    
+    Returns:
+        ORTModelForSequenceClassification, or None if unavailable
+    """
+    if not OPTIMUM_AVAILABLE:
+        print("Warning: optimum[onnxruntime] not installed. Using FP32 model.")
+        return None
+    
+    target_dir = ONNX_CACHE_DIR / model_name.replace('/', '__')
+    
+    try:
+        if not (target_dir / QUANTIZED_FILE_NAME).exists():
+            print(f"Exporting {model_name} to ONNX and quantizing to int8 (one-time)...")
+            ort_model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+            ort_model.save_pretrained(target_dir / "fp32")
+            
+            quantizer = ORTQuantizer.from_pretrained(ort_model)
+            quantizer.quantize(save_dir=target_dir, quantization_config=_quantization_config())
+        
+        return ORTModelForSequenceClassification.from_pretrained(target_dir, file_name=QUANTIZED_FILE_NAME)
+    except Exception as e:
+        print(f"Warning: int8 quantization failed for {model_name}: {e}")
+        print("  Using FP32 model instead.")
+        return None
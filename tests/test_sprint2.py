@@ -6,8 +6,16 @@ Tests for:
 2. Outlier Cap - Prevents single source dominance
 3. Engagement Weighting - Likes affect sentiment weight
 4. Probability-Based Scoring - Uses model confidence
+5. Lexicon Fast Path - Rule-based labels skip the model
+6. Prediction Cache - Repeated texts are inferred once
+7. Prediction Read Paging - Flushes over the row limit read every row
+8. In-Flight Dedup - Content awaiting its write is not processed twice
+9. Alliance Fuzzy Fallback - Party name variants map to the right alliance
+10. Entity Short-Circuit - Entity matches settle clear-cut texts before zero-shot
+11. Raw JSON Round Trip - Gzipped and legacy plain payloads read back intact
 
-Run: python tests/test_sprint2.py
+Run: python tests/test_sprint2.py [--integration]
+     SKIP_MODEL_TESTS=1 python -m pytest tests  (skips the model test)
 """
 
 import sys
@@ -15,6 +23,17 @@ import os
 import math
 from datetime import datetime, timezone, timedelta
 
+try:
+    import pytest
+    # Model load takes seconds (and a download on a cold cache)
+    requires_model = pytest.mark.skipif(
+        os.getenv('SKIP_MODEL_TESTS') == '1',
+        reason="SKIP_MODEL_TESTS=1 (sentiment model load)"
+    )
+except ImportError:  # Standalone run; the model test is gated by --integration
+    def requires_model(func):
+        return func
+
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
@@ -27,8 +46,17 @@ from processor import (
     MAX_INFLUENCE_PER_SOURCE,
     ENABLE_OUTLIER_CAP,
     ENABLE_ENGAGEMENT_WEIGHTING,
-    ENABLE_PROBABILITY_SCORING
+    ENABLE_PROBABILITY_SCORING,
+    classify_with_lexicon,
+    run_sentiment_model,
+    prediction_cache_key,
+    write_prediction_updates,
+    prepare_job,
+    release_in_flight_content
 )
+from utils.alliance_mapper import AllianceMapper, _FUZZY_RULES, _fuzzy_rules_share_prefix
+from utils import classifier as alliance_classifier
+from infra import data_manager
 
 
 def test_freshness_decay():
@@ -153,6 +181,7 @@ def test_probability_scoring():
     return True
 
 
+@requires_model
 def test_sentiment_with_engagement():
     """Test sentiment analysis with engagement weighting (requires model)."""
     print("\n" + "=" * 60)
@@ -204,8 +233,406 @@ def test_sentiment_with_engagement():
         return True  # Don't fail on model loading issues
 
 
-def run_all_tests():
-    """Run all Sprint 2 tests."""
+def test_lexicon_fast_path():
+    """Test lexicon fast path decides only clear-cut texts."""
+    print("\n" + "=" * 60)
+    print("TEST 6: Lexicon Fast Path")
+    print("=" * 60)
+    
+    test_cases = [
+        ("Great work, best CM, super support!", "positive", "Strong positive (English)"),
+        ("Worst govt, corrupt and useless, shame", "negative", "Strong negative (English)"),
+        ("வாழ்க தலைவா வெற்றி நிச்சயம் நன்றி", "positive", "Strong positive (Tamil)"),
+        ("Good speech but bad policies", None, "Mixed signal (model decides)"),
+        ("Stalin addressed the rally today", None, "No signal (model decides)"),
+    ]
+    
+    print("-" * 60)
+    
+    all_passed = True
+    for text, expected, description in test_cases:
+        label = classify_with_lexicon(text)
+        status = "[PASS]" if label == expected else "[FAIL]"
+        if status == "[FAIL]":
+            all_passed = False
+        print(f"{status} {description}: label={label} (expected={expected})")
+    
+    # Only short user comments take the fast path, with a calibrated score
+    model_inputs = []
+    
+    def stub_model(batch, top_k=None, truncation=True):
+        model_inputs.extend(batch)
+        return [[{'label': 'neutral', 'score': 0.9}] for _ in batch]
+    
+    comment = "Great work, best CM, super support!"
+    article = "Great work, best CM, super support! " + "The minister spoke at length. " * 20
+    results = run_sentiment_model([comment, comment + " ", article], stub_model, [True, False, True])
+    lexicon_score = results[0][0]['score']
+    gated = results[0][0]['label'] == 'positive' and model_inputs == [comment + " ", article]
+    calibrated = 0.5 < lexicon_score < 1.0 and abs(sum(r['score'] for r in results[0]) - 1.0) < 1e-9
+    if not (gated and calibrated):
+        all_passed = False
+    print(f"{'[PASS]' if gated else '[FAIL]'} Ineligible and long texts go to the model: {len(model_inputs)} model inputs")
+    print(f"{'[PASS]' if calibrated else '[FAIL]'} Lexicon score is calibrated: {lexicon_score:.2f}")
+    
+    print("-" * 60)
+    print(f"Result: {'PASSED' if all_passed else 'FAILED'}")
+    return all_passed
+
+
+def test_prediction_cache():
+    """Test repeated texts hit the prediction cache instead of the model."""
+    print("\n" + "=" * 60)
+    print("TEST 7: Prediction Cache")
+    print("=" * 60)
+    
+    model_inputs = []
+    
+    def stub_model(batch, top_k=None, truncation=True):
+        model_inputs.extend(batch)
+        return [[{'label': 'neutral', 'score': 0.9}] for _ in batch]
+    
+    # Whitespace variants share an entry; case variants do not (the model is cased)
+    texts = ["Rally in Madurai today", "Rally in  Madurai\ttoday", "Rally in Madurai today", "First comment"]
+    cased = ["GREAT rally!!", "great rally!!"]
+    
+    first = run_sentiment_model(texts, stub_model)
+    calls_after_first = len(model_inputs)
+    second = run_sentiment_model(texts, stub_model)
+    calls_after_second = len(model_inputs)
+    run_sentiment_model(cased, stub_model)
+    
+    print("-" * 60)
+    print(f"Model inputs after first pass: {calls_after_first} (expected 2 distinct texts)")
+    print(f"Model inputs after second pass: {calls_after_second} (expected no new calls)")
+    print(f"Case variants sent to the model: {model_inputs[calls_after_second:]} (expected both)")
+    
+    all_passed = (
+        calls_after_first == 2 and
+        calls_after_second == calls_after_first and
+        model_inputs[calls_after_second:] == cased and
+        prediction_cache_key(cased[0]) != prediction_cache_key(cased[1]) and
+        all(r is not None for r in first + second)
+    )
+    
+    print("-" * 60)
+    print(f"Result: {'PASSED' if all_passed else 'FAILED'}")
+    return all_passed
+
+
+class _FakePredictionTable:
+    """constituency_predictions stand-in that truncates reads like PostgREST."""
+    
+    SERVER_MAX_ROWS = 1000  # PostgREST default db-max-rows
+    
+    def __init__(self, rows):
+        self.rows = rows
+        self.upserted = []
+        self._filters = {}
+    
+    def select(self, columns):
+        self._filters = {}
+        return self
+    
+    def in_(self, column, values):
+        self._filters[column] = set(values)
+        return self
+    
+    def upsert(self, payload, on_conflict=None):
+        self.upserted = payload
+        self._filters = None
+        return self
+    
+    def execute(self):
+        if self._filters is None:
+            return type('Result', (), {'data': self.upserted})()
+        matched = [
+            r for r in self.rows
+            if r['constituency_name'] in self._filters['constituency_name']
+            and r['alliance'] in self._filters['alliance']
+        ]
+        return type('Result', (), {'data': matched[:self.SERVER_MAX_ROWS]})()
+
+
+def test_prediction_read_paging():
+    """Test a flush touching more rows than the server row limit keeps existing state."""
+    print("\n" + "=" * 60)
+    print("TEST 8: Prediction Read Paging")
+    print("=" * 60)
+    
+    alliances = ['DMK_Front', 'ADMK_Front', 'TVK_Front', 'NTK', 'Others']
+    names = [f"SEAT_{i:03d}" for i in range(234)]  # 234 x 5 = 1170 rows > limit
+    existing = [
+        {
+            'constituency_name': name, 'alliance': alliance, 'district': 'Chennai',
+            'sentiment_score': 0.5, 'confidence_weight': 0.5,
+            'source_ids': ['old'], 'source_count': 7, 'model_version': 'v1'
+        }
+        for name in names for alliance in alliances
+    ]
+    table = _FakePredictionTable(existing)
+    client = type('Client', (), {'table': lambda self, name: table})()
+    
+    updates = [
+        {'constituency_name': name, 'alliance_name': alliance, 'current_score': 0.5, 'source_id': 'new'}
+        for name in names for alliance in alliances
+    ]
+    written = write_prediction_updates(client, updates)
+    
+    reset_rows = [r for r in table.upserted if r.get('source_count') != 8]
+    
+    print("-" * 60)
+    print(f"Rows written: {written} (expected {len(updates)})")
+    print(f"Rows treated as new: {len(reset_rows)} (expected 0)")
+    
+    all_passed = written == len(updates) and not reset_rows
+    
+    print("-" * 60)
+    print(f"Result: {'PASSED' if all_passed else 'FAILED'}")
+    return all_passed
+
+
+def test_in_flight_dedup():
+    """Test content prepared in one batch is a duplicate until its write commits."""
+    print("\n" + "=" * 60)
+    print("TEST 9: In-Flight Dedup")
+    print("=" * 60)
+    
+    class _EmptyTable:
+        def select(self, *args, **kwargs): return self
+        def eq(self, *args): return self
+        def execute(self): return type('Result', (), {'data': []})()
+    
+    client = type('Client', (), {'table': lambda self, name: _EmptyTable()})()
+    data_system = type('DataSystem', (), {'update_job_status': lambda self, job_id, status: True})()
+    
+    def fetched(job_id):
+        return {
+            'job_id': job_id, 'found': True, 'file_path': f"comments/{job_id}.json",
+            'data': {'meta': {'id': 'video-in-flight'}, 'user_comments': [{'text': 'Vote DMK', 'likes': 1}]}
+        }
+    
+    first = prepare_job(fetched('job-1'), data_system, client, 'DMK_Front')
+    # Batch N+1 is prepared while the writer still holds batch N
+    second = prepare_job(fetched('job-2'), data_system, client, 'DMK_Front')
+    release_in_flight_content([first])
+    # After the write commits (and fails to record, e.g. DLQ) the content may be retried
+    third = prepare_job(fetched('job-3'), data_system, client, 'DMK_Front')
+    release_in_flight_content([third])
+    
+    print("-" * 60)
+    print(f"First job needs inference: {first['result'] is None}")
+    print(f"Second job skipped as duplicate: {second['result'] is True}")
+    print(f"Job after release needs inference: {third['result'] is None}")
+    
+    all_passed = first['result'] is None and second['result'] is True and third['result'] is None
+    
+    print("-" * 60)
+    print(f"Result: {'PASSED' if all_passed else 'FAILED'}")
+    return all_passed
+
+
+def test_alliance_fuzzy_fallback():
+    """Test party name variants and the fuzzy fallback rules (2021 config)."""
+    print("\n" + "=" * 60)
+    print("TEST 10: Alliance Fuzzy Fallback")
+    print("=" * 60)
+    
+    mapper = AllianceMapper(year=2021)
+    # Same rules with no config keys: rules whose keys are missing fall through
+    bare_mapper = AllianceMapper(year=2021)
+    bare_mapper.party_map = {}
+    
+    test_cases = [
+        (mapper, "Indian National Congress", "DMK_Alliance", "CONGRESS substring -> INC"),
+        (mapper, "Communist Party of India (Marxist)", "DMK_Alliance", "COMMUNIST substring -> CPI"),
+        (mapper, "CPI(ML)", "DMK_Alliance", "CPI prefix"),
+        (mapper, "C.P.I. (M)", "DMK_Alliance", "Punctuated CPI(M)"),
+        (mapper, "A.I.A.D.M.K.", "ADMK_Alliance", "Punctuated AIADMK"),
+        (mapper, "AIADMK (Amma)", "ADMK_Alliance", "AIADMK substring"),
+        (mapper, "ADMK", "ADMK_Alliance", "ADMK exact"),
+        (mapper, "Ind.", "Independent", "Punctuated IND"),
+        (mapper, "Independent", "Independent", "INDEPENDENT substring"),
+        (mapper, "Some Local Party", "Others", "Unknown party"),
+        (bare_mapper, "Congress", "Others", "Rule keys missing from config"),
+        (bare_mapper, "CPIndependent", "Independent", "Overlapping CPI/INDEPENDENT hits"),
+    ]
+    
+    print("-" * 60)
+    
+    all_passed = True
+    for m, party, expected, description in test_cases:
+        alliance = m.get_alliance(party)
+        status = "[PASS]" if alliance == expected else "[FAIL]"
+        if status == "[FAIL]":
+            all_passed = False
+        print(f"{status} {description}: {party!r} -> {alliance} (expected={expected})")
+    
+    # The single-scan regex relies on no rule literal being a prefix of another's
+    overlap_free = not _fuzzy_rules_share_prefix(_FUZZY_RULES)
+    detects_overlap = _fuzzy_rules_share_prefix(_FUZZY_RULES + (('CONG', None, None, ('INC',)),))
+    if not (overlap_free and detects_overlap):
+        all_passed = False
+    print(f"{'[PASS]' if overlap_free and detects_overlap else '[FAIL]'} Rule literals do not share prefixes")
+    
+    print("-" * 60)
+    print(f"Result: {'PASSED' if all_passed else 'FAILED'}")
+    return all_passed
+
+
+def test_entity_short_circuit():
+    """Test entity extraction and the decisive entity short-circuit before zero-shot."""
+    print("\n" + "=" * 60)
+    print("TEST 11: Entity Short-Circuit")
+    print("=" * 60)
+    
+    print("-" * 60)
+    all_passed = True
+    
+    # Word boundaries: "dmk" must not match inside "admk"/"mdmk"
+    extraction_cases = [
+        ("ADMK and MDMK cadres clash", ['ADMK', 'MDMK'], "DMK not found in ADMK/MDMK"),
+        ("AIADMK general council meets", ['ADMK'], "AIADMK maps to ADMK only"),
+        ("DMK wins the bypoll", ['DMK'], "Standalone DMK"),
+    ]
+    for text, expected, description in extraction_cases:
+        parties = alliance_classifier.extract_political_entities(text)['parties']
+        status = "[PASS]" if parties == expected else "[FAIL]"
+        if status == "[FAIL]":
+            all_passed = False
+        print(f"{status} {description}: parties={parties} (expected={expected})")
+    
+    # Stub zero-shot pipeline: records its inputs and always answers TVK Front
+    class StubZeroShot:
+        model = object()
+        
+        def __init__(self):
+            self.inputs = []
+        
+        def __call__(self, texts, labels, multi_label=False, batch_size=None):
+            self.inputs.extend(texts)
+            return [{'labels': [labels[2]], 'scores': [0.9]} for _ in texts]
+    
+    stub = StubZeroShot()
+    
+    def stub_loader():
+        alliance_classifier._zero_shot_local.classifier = stub
+        return stub
+    
+    payloads = [
+        {"meta": {"title": "Stalin and DMK cadres rally in Chennai"}},
+        {"meta": {"title": "DMK and ADMK trade barbs before polls"}},
+        {"meta": {"title": "Stalin speaks at the rally"}},
+    ]
+    
+    original_loader = alliance_classifier.get_zero_shot_classifier
+    alliance_classifier.get_zero_shot_classifier = stub_loader
+    try:
+        alliances = alliance_classifier.classify_alliances_batch(payloads)
+    finally:
+        alliance_classifier.get_zero_shot_classifier = original_loader
+        alliance_classifier._zero_shot_local.classifier = None
+    
+    batch_cases = [
+        (alliances[0] == "DMK_Front" and payloads[0]["meta"]["title"] not in stub.inputs,
+         f"Two DMK-only entities short-circuit: {alliances[0]}"),
+        (alliances[1] == "TVK_Front" and payloads[1]["meta"]["title"] in stub.inputs,
+         f"Mixed-alliance text falls through to zero-shot: {alliances[1]}"),
+        (alliances[2] == "TVK_Front" and payloads[2]["meta"]["title"] in stub.inputs,
+         f"A single entity is not decisive: {alliances[2]}"),
+    ]
+    for passed, description in batch_cases:
+        if not passed:
+            all_passed = False
+        print(f"{'[PASS]' if passed else '[FAIL]'} {description}")
+    
+    print("-" * 60)
+    print(f"Result: {'PASSED' if all_passed else 'FAILED'}")
+    return all_passed
+
+
+class _FakeStorageClient:
+    """Supabase client stand-in: in-memory storage bucket and job_queue insert."""
+    
+    def __init__(self):
+        self.objects = {}  # path -> (bytes, file_options)
+        self.storage = self
+    
+    def from_(self, bucket_name):
+        return self
+    
+    def upload(self, path, content, file_options=None):
+        self.objects[path] = (content, file_options or {})
+    
+    def download(self, path):
+        return self.objects[path][0]
+    
+    def table(self, name):
+        return self
+    
+    def insert(self, row):
+        return self
+    
+    def execute(self):
+        return type('Result', (), {'data': [{'id': 'job-1'}]})()
+
+
+def test_raw_json_round_trip():
+    """Test raw payloads survive upload/download, gzipped or not, with both serializers."""
+    print("\n" + "=" * 60)
+    print("TEST 12: Raw JSON Round Trip")
+    print("=" * 60)
+    
+    payload = {'meta': {'id': 'video-1', 'title': 'ஸ்டாலின் rally'}, 'scores': {1: 0.5}}
+    expected = {'meta': {'id': 'video-1', 'title': 'ஸ்டாலின் rally'}, 'scores': {'1': 0.5}}
+    legacy = b'{"meta": {"id": "video-0"}, "user_comments": []}'
+    
+    print("-" * 60)
+    all_passed = True
+    
+    orjson_available = data_manager.ORJSON_AVAILABLE
+    modes = [True, False] if orjson_available else [False]
+    try:
+        for use_orjson in modes:
+            data_manager.ORJSON_AVAILABLE = use_orjson
+            client = _FakeStorageClient()
+            data_system = data_manager.DataSystem.__new__(data_manager.DataSystem)
+            data_system.client = client
+            data_system.bucket_name = 'raw_data'
+            
+            job_id = data_system.save_raw_json(payload, 'comments/video-1.json')
+            stored, options = client.objects['comments/video-1.json']
+            client.objects['comments/video-0.json'] = (legacy, {})
+            
+            checks = [
+                (job_id == 'job-1', "Job queued"),
+                (stored[:2] == data_manager.GZIP_MAGIC, "Upload is gzipped"),
+                (options.get('content-type') == 'application/gzip', "Upload labelled application/gzip"),
+                (data_system.get_file_from_storage('comments/video-1.json') == expected,
+                 "Gzipped payload reads back (int keys as strings)"),
+                (data_system.get_file_from_storage('comments/video-0.json') == {'meta': {'id': 'video-0'}, 'user_comments': []},
+                 "Legacy plain JSON still reads"),
+            ]
+            serializer = 'orjson' if use_orjson else 'json'
+            for passed, description in checks:
+                if not passed:
+                    all_passed = False
+                print(f"{'[PASS]' if passed else '[FAIL]'} [{serializer}] {description}")
+    finally:
+        data_manager.ORJSON_AVAILABLE = orjson_available
+    
+    print("-" * 60)
+    print(f"Result: {'PASSED' if all_passed else 'FAILED'}")
+    return all_passed
+
+
+def run_all_tests(integration: bool = False):
+    """
+    Run all Sprint 2 tests.
+    
+    Args:
+        integration: Also run the model-dependent sentiment integration test
+    """
     print("\n" + "=" * 60)
     print("SPRINT 2 TEST SUITE: Advanced ML Scoring")
     print("=" * 60)
@@ -216,9 +643,17 @@ def run_all_tests():
     results.append(("Engagement Weighting", test_engagement_weighting()))
     results.append(("Outlier Cap", test_outlier_cap()))
     results.append(("Probability Scoring", test_probability_scoring()))
+    results.append(("Lexicon Fast Path", test_lexicon_fast_path()))
+    results.append(("Prediction Cache", test_prediction_cache()))
+    results.append(("Prediction Read Paging", test_prediction_read_paging()))
+    results.append(("In-Flight Dedup", test_in_flight_dedup()))
+    results.append(("Alliance Fuzzy Fallback", test_alliance_fuzzy_fallback()))
+    results.append(("Entity Short-Circuit", test_entity_short_circuit()))
+    results.append(("Raw JSON Round Trip", test_raw_json_round_trip()))
     
-    # Skip model-dependent test by default
-    # results.append(("Sentiment Integration", test_sentiment_with_engagement()))
+    # Skip model-dependent test by default (--integration to include it)
+    if integration:
+        results.append(("Sentiment Integration", test_sentiment_with_engagement()))
     
     print("\n" + "=" * 60)
     print("TEST SUMMARY")
@@ -241,5 +676,12 @@ def run_all_tests():
 
 
 if __name__ == "__main__":
-    success = run_all_tests()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Sprint 2 test suite")
+    parser.add_argument('--integration', action='store_true',
+                        help="Also run the model-dependent sentiment integration test")
+    args = parser.parse_args()
+    
+    success = run_all_tests(integration=args.integration)
     sys.exit(0 if success else 1)